@@ -29,6 +29,7 @@ constants used by EMC^2 are also stored in this module.
     model.TestHalfAndHalf
     model.TestModel
     Instrument
+    LazyTableDict
     Model
 
 In addition the :func:`emc2.core.quantity` is equivalent to pint's
@@ -37,6 +38,6 @@ with units, making EMC^2 unit aware.
 """
 
 from . import instruments
-from .instrument import Instrument
+from .instrument import Instrument, LazyTableDict
 from . import model
 from .model import Model
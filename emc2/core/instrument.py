@@ -7,6 +7,7 @@ This module stores the Instrument class.
 """
 import numpy as np
 
+from collections.abc import MutableMapping
 from pint import UnitRegistry
 from ..io import load_arm_file
 
@@ -14,6 +15,73 @@ ureg = UnitRegistry()
 quantity = ureg.Quantity
 
 
+class LazyTableDict(MutableMapping):
+    """
+    A dictionary of scattering LUTs that are loaded on first access.
+
+    Entries are either set directly or registered with :py:meth:`set_loader`, in which
+    case the loader is only called when the entry is first accessed. The names of the
+    accessed entries are stored in the accessed attribute.
+
+    Attributes
+    ----------
+    accessed: set
+        The names of the entries that were accessed.
+    """
+
+    def __init__(self):
+        self._tables = {}
+        self._loaders = {}
+        self.accessed = set()
+
+    def set_loader(self, key, loader, *args, **kwargs):
+        """
+        Registers an entry to be loaded on first access by calling loader(*args, **kwargs).
+        """
+        self._tables.pop(key, None)
+        self._loaders[key] = (loader, args, kwargs)
+
+    def is_loaded(self, key):
+        """
+        Returns True if the entry has been loaded.
+        """
+        return key in self._tables
+
+    def __getitem__(self, key):
+        if key not in self._tables:
+            if key not in self._loaders:
+                raise KeyError(key)
+            loader, args, kwargs = self._loaders[key]
+            self._tables[key] = loader(*args, **kwargs)
+            del self._loaders[key]
+        self.accessed.add(key)
+        return self._tables[key]
+
+    def __setitem__(self, key, value):
+        self._loaders.pop(key, None)
+        self._tables[key] = value
+
+    def __delitem__(self, key):
+        if key in self._tables:
+            del self._tables[key]
+        else:
+            del self._loaders[key]
+        self.accessed.discard(key)
+
+    def __contains__(self, key):
+        return key in self._tables or key in self._loaders
+
+    def __iter__(self):
+        return iter(list(self._tables.keys()) + list(self._loaders.keys()))
+
+    def __len__(self):
+        return len(self._tables) + len(self._loaders)
+
+    def __repr__(self):
+        return "%s(loaded=%s, not_loaded=%s)" % (
+            self.__class__.__name__, list(self._tables.keys()), list(self._loaders.keys()))
+
+
 class Instrument(object):
     """
     This is the base class which holds the information needed to contain the instrument parameters for the
@@ -64,6 +132,16 @@ class Instrument(object):
         Pulse width in mus.
     tau_md: float
         Pulse width in mus.
+    mie_table, scat_table, bulk_table: LazyTableDict
+        The single-particle Mie, single-particle (e.g., C6 or m-D, A-D relationships), and bulk
+        scattering LUTs. Entries are loaded on first access (see :py:meth:`get_accessed_tables`).
+    psd_integral_tables: dict
+        Cache of PSD integral lookup tables calculated from the scattering LUTs
+        (see :py:func:`emc2.simulator.psd.calc_psd_integral_table`). None marks a LUT for
+        which no valid table could be calculated.
+    bulk_interpolators: dict
+        Cache of the (mu, lambda) interpolators of the bulk scattering LUTs
+        (see :py:func:`emc2.simulator.psd.calc_bulk_mu_lambda_interpolator`).
     """
 
     def __init__(self, frequency=None, wavelength=None):
@@ -105,10 +183,12 @@ class Instrument(object):
             self.freq = frequency.to('Hz').magnitude
             self.wavelength = wavelength.to('micrometer').magnitude
 
-        self.mie_table = {}
-        self.scat_table = {}  # scattering calculation LUTs (e.g., C6 or m-D, A-D relationships).
-        self.bulk_table = {}
+        self.mie_table = LazyTableDict()
+        self.scat_table = LazyTableDict()  # scattering calculation LUTs (e.g., C6 or m-D, A-D relationships).
+        self.bulk_table = LazyTableDict()
         self.scatterer = {}
+        self.psd_integral_tables = {}
+        self.bulk_interpolators = {}
         self.ds = None
 
     def read_arm_netcdf_file(self, filename, **kwargs):
@@ -123,3 +203,16 @@ class Instrument(object):
 
         """
         self.ds = load_arm_file(filename, **kwargs)
+
+    def get_accessed_tables(self):
+        """
+        Returns the names of the scattering LUTs that were accessed (and hence loaded).
+
+        Returns
+        -------
+        accessed: dict
+            The sorted names of the accessed entries in the mie_table, scat_table,
+            and bulk_table attributes.
+        """
+        return {table_name: sorted(getattr(self, table_name).accessed)
+                for table_name in ["mie_table", "scat_table", "bulk_table"]}
@@ -37,37 +37,37 @@ class CSAPR(Instrument):
         # Load mie tables
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
         if supercooled:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieCSAPR_liq_c.dat")  # Turner et al. (2016) -10 C
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieCSAPR_liq_c.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieCSAPR_liq_c.dat")  # Turner et al. (2016) -10 C
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieCSAPR_liq_c.dat")
         else:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieCSAPR_liq.dat")  # Segelstein (1981)
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieCSAPR_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/MieCSAPR_ci.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieCSAPR_liq.dat")  # Segelstein (1981)
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieCSAPR_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/MieCSAPR_ci.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieCSAPR_pi1.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieCSAPR_pi1.dat")
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieCSAPR_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieCSAPR_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(data_path + "/C6_CSAPR_8col_agg_rough_270K.dat", True)
+        self.scat_table.set_loader("E3_ice", load_scat_file, data_path + "/C6_CSAPR_8col_agg_rough_270K.dat", True)
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_CSAPR_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_CSAPR_C6PSD_c6_8col_ice_agg_rough_270K.dat")
         if supercooled:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_CSAPR_C6PSD_mie_liq_c.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_CSAPR_C6PSD_mie_liq_c.dat")
         else:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_CSAPR_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_CSAPR_C6PSD_mie_ice.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_CSAPR_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_CSAPR_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_CSAPR_ice.dat", True, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_CSAPR_ice.dat", True, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_CSAPR_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_CSAPR_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
         if supercooled:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_CSAPR_mDAD_mie_liq_c.nc")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_CSAPR_mDAD_mie_liq_c.nc")
         else:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_CSAPR_mDAD_mie_liq.nc")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_CSAPR_mDAD_mie_liq.nc")
         #self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_CSAPR_mDAD_mie_ice.dat",
 #                                                                  param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'ARTS_tables')
@@ -96,39 +96,39 @@ class XSACR(Instrument):
         # Load mie tables
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
         if supercooled:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieXSACR_liq_c.dat")  # Turner et al. (2016) -10 C
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieXSACR_liq_c.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieXSACR_liq_c.dat")  # Turner et al. (2016) -10 C
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieXSACR_liq_c.dat")
         else:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieXSACR_liq.dat")  # Segelstein (1981)
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieXSACR_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/MieXSACR_ci.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieXSACR_liq.dat")  # Segelstein (1981)
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieXSACR_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/MieXSACR_ci.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieXSACR_pi1.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieXSACR_pi1.dat")
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieXSACR_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieXSACR_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(data_path + "/C6_XSACR_8col_agg_rough_270K.dat", True)
+        self.scat_table.set_loader("E3_ice", load_scat_file, data_path + "/C6_XSACR_8col_agg_rough_270K.dat", True)
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_XSACR_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_XSACR_C6PSD_c6_8col_ice_agg_rough_270K.dat")
         if supercooled:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_XSACR_C6PSD_mie_liq_c.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_XSACR_C6PSD_mie_liq_c.dat")
         else:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_XSACR_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_XSACR_C6PSD_mie_ice.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_XSACR_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_XSACR_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_XSACR_ice.dat", True, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_XSACR_ice.dat", True, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_XSACR_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_XSACR_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
         if supercooled:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_XSACR_mDAD_mie_liq_c.nc")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_XSACR_mDAD_mie_liq_c.nc")
         else:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_XSACR_mDAD_mie_liq.nc")
-        self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_XSACR_mDAD_mie_ice.dat",
-                                                                  param_type="mDAD")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_XSACR_mDAD_mie_liq.nc")
+        self.bulk_table.set_loader("mie_ice_CESM_PSD", load_bulk_scat_file, data_path + "/bulk_XSACR_mDAD_mie_ice.dat",
+                                   param_type="mDAD")
 
 
 class KAZR(Instrument):
@@ -194,39 +194,39 @@ class KAZR(Instrument):
         # Load mie tables
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
         if supercooled:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieKAZR_liq_c.dat")  # Turner et al. (2016) -10 C
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieKAZR_liq_c.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieKAZR_liq_c.dat")  # Turner et al. (2016) -10 C
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieKAZR_liq_c.dat")
         else:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieKAZR_liq.dat")  # Segelstein (1981)
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieKAZR_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/MieKAZR_ci.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieKAZR_liq.dat")  # Segelstein (1981)
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieKAZR_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/MieKAZR_ci.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieKAZR_pi1.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieKAZR_pi1.dat")
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieKAZR_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieKAZR_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(data_path + "/C6_KAZR_8col_agg_rough_270K.dat", True)
+        self.scat_table.set_loader("E3_ice", load_scat_file, data_path + "/C6_KAZR_8col_agg_rough_270K.dat", True)
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_KAZR_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_KAZR_C6PSD_c6_8col_ice_agg_rough_270K.dat")
         if supercooled:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_KAZR_C6PSD_mie_liq_c.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_KAZR_C6PSD_mie_liq_c.dat")
         else:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_KAZR_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_KAZR_C6PSD_mie_ice.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_KAZR_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_KAZR_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_KAZR_ice.dat", True, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_KAZR_ice.dat", True, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_KAZR_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_KAZR_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
         if supercooled:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_KAZR_mDAD_mie_liq_c.nc")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_KAZR_mDAD_mie_liq_c.nc")
         else:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_KAZR_mDAD_mie_liq.nc")
-        self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_KAZR_mDAD_mie_ice.dat",
-                                                                  param_type="mDAD")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_KAZR_mDAD_mie_liq.nc")
+        self.bulk_table.set_loader("mie_ice_CESM_PSD", load_bulk_scat_file, data_path + "/bulk_KAZR_mDAD_mie_ice.dat",
+                                   param_type="mDAD")
 
 
 class WACR(Instrument):
@@ -278,40 +278,40 @@ class WACR(Instrument):
         # Load mie tables
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
         if supercooled:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieWACR_liq_c.dat")  # Turner et al. (2016) -10 C
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieWACR_liq_c.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieWACR_liq_c.dat")  # Turner et al. (2016) -10 C
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieWACR_liq_c.dat")
         else:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieWACR_liq.dat")  # Segelstein (1981)
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieWACR_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/MieWACR_ci.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieWACR_liq.dat")  # Segelstein (1981)
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieWACR_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/MieWACR_ci.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieWACR_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieWACR_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieWACR_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieWACR_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(
-            data_path + "/C6_WACR_8col_agg_rough_270K.dat", True)
+        self.scat_table.set_loader("E3_ice", load_scat_file,
+                                   data_path + "/C6_WACR_8col_agg_rough_270K.dat", True)
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_WACR_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_WACR_C6PSD_c6_8col_ice_agg_rough_270K.dat")
         if supercooled:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_WACR_C6PSD_mie_liq_c.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_WACR_C6PSD_mie_liq_c.dat")
         else:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_WACR_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_WACR_C6PSD_mie_ice.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_WACR_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_WACR_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_WACR_ice.dat", True, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_WACR_ice.dat", True, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_WACR_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_WACR_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
         if supercooled:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_WACR_mDAD_mie_liq_c.nc")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_WACR_mDAD_mie_liq_c.nc")
         else:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_WACR_mDAD_mie_liq.nc")
-        self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_WACR_mDAD_mie_ice.dat",
-                                                                  param_type="mDAD")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_WACR_mDAD_mie_liq.nc")
+        self.bulk_table.set_loader("mie_ice_CESM_PSD", load_bulk_scat_file, data_path + "/bulk_WACR_mDAD_mie_ice.dat",
+                                   param_type="mDAD")
 
 
 class RL(Instrument):
@@ -351,31 +351,31 @@ class RL(Instrument):
 
         # Load mie tables
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
-        self.mie_table["cl"] = load_mie_file(data_path + "/MieRL_liq.dat")
-        self.mie_table["pl"] = load_mie_file(data_path + "/MieRL_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/MieRL_ci.dat")
+        self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieRL_liq.dat")
+        self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieRL_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/MieRL_ci.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(
-                data_path + "/MieRL_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
+            self.mie_table.set_loader("pi", load_mie_file,
+                                      data_path + "/MieRL_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieRL_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieRL_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(data_path + "/C6_RL_8col_agg_rough_270K.dat", False)
+        self.scat_table.set_loader("E3_ice", load_scat_file, data_path + "/C6_RL_8col_agg_rough_270K.dat", False)
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_RL_C6PSD_c6_8col_ice_agg_rough_270K.dat")
-        self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_RL_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_RL_C6PSD_mie_ice.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_RL_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_RL_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_RL_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_RL_ice.dat", False, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_RL_ice.dat", False, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_RL_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
-        self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_RL_mDAD_mie_liq.nc")
-        self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_RL_mDAD_mie_ice.dat",
-                                                                  param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_RL_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_RL_mDAD_mie_liq.nc")
+        self.bulk_table.set_loader("mie_ice_CESM_PSD", load_bulk_scat_file, data_path + "/bulk_RL_mDAD_mie_ice.dat",
+                                   param_type="mDAD")
 
 
 class HSRL(Instrument):
@@ -416,31 +416,31 @@ class HSRL(Instrument):
 
         # Load mie tables
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
-        self.mie_table["cl"] = load_mie_file(data_path + "/MieHSRL_liq.dat")
-        self.mie_table["pl"] = load_mie_file(data_path + "/MieHSRL_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/MieHSRL_ci.dat")
+        self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieHSRL_liq.dat")
+        self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieHSRL_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/MieHSRL_ci.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(
-                data_path + "/MieHSRL_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
+            self.mie_table.set_loader("pi", load_mie_file,
+                                      data_path + "/MieHSRL_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieHSRL_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieHSRL_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(data_path + "/C6_HSRL_8col_agg_rough_270K.dat", False)
+        self.scat_table.set_loader("E3_ice", load_scat_file, data_path + "/C6_HSRL_8col_agg_rough_270K.dat", False)
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_HSRL_C6PSD_c6_8col_ice_agg_rough_270K.dat")
-        self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_HSRL_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_HSRL_C6PSD_mie_ice.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_HSRL_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_HSRL_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_HSRL_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_HSRL_ice.dat", False, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_HSRL_ice.dat", False, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_HSRL_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
-        self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_HSRL_mDAD_mie_liq.nc")
-        self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_HSRL_mDAD_mie_ice.dat",
-                                                                  param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_HSRL_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_HSRL_mDAD_mie_liq.nc")
+        self.bulk_table.set_loader("mie_ice_CESM_PSD", load_bulk_scat_file, data_path + "/bulk_HSRL_mDAD_mie_ice.dat",
+                                   param_type="mDAD")
 
 
 class CEIL(Instrument):
@@ -472,40 +472,40 @@ class CEIL(Instrument):
         # Load mie tables
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
         if supercooled:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieCEIL_liq_c.dat")  # Rowe et al. (2020) -10 C
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieCEIL_liq_c.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieCEIL_liq_c.dat")  # Rowe et al. (2020) -10 C
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieCEIL_liq_c.dat")
         else:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieCEIL_liq.dat")  # Segelstein (1981)
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieCEIL_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/MieCEIL_ci.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieCEIL_liq.dat")  # Segelstein (1981)
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieCEIL_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/MieCEIL_ci.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(
-                data_path + "/MieCEIL_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
+            self.mie_table.set_loader("pi", load_mie_file,
+                                      data_path + "/MieCEIL_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieCEIL_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieCEIL_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(data_path + "/C6_CEIL_8col_agg_rough_270K.dat", False)
+        self.scat_table.set_loader("E3_ice", load_scat_file, data_path + "/C6_CEIL_8col_agg_rough_270K.dat", False)
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_CEIL_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_CEIL_C6PSD_c6_8col_ice_agg_rough_270K.dat")
         if supercooled:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_CEIL_C6PSD_mie_liq_c.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_CEIL_C6PSD_mie_liq_c.dat")
         else:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_CEIL_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_CEIL_C6PSD_mie_ice.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_CEIL_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_CEIL_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_CEIL_ice.dat", False, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_CEIL_ice.dat", False, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_CEIL_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_CEIL_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
         if supercooled:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_CEIL_mDAD_mie_liq_c.nc")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_CEIL_mDAD_mie_liq_c.nc")
         else:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_CEIL_mDAD_mie_liq.nc")
-        self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_CEIL_mDAD_mie_ice.dat",
-                                                                  param_type="mDAD")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_CEIL_mDAD_mie_liq.nc")
+        self.bulk_table.set_loader("mie_ice_CESM_PSD", load_bulk_scat_file, data_path + "/bulk_CEIL_mDAD_mie_ice.dat",
+                                   param_type="mDAD")
 
 
 class Ten64nm(Instrument):
@@ -536,41 +536,41 @@ class Ten64nm(Instrument):
         # Load mie tables
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
         if supercooled:
-            self.mie_table["cl"] = load_mie_file(data_path + "/Mie1064nm_liq_c.dat")  # Rowe et al. (2020) -10 C
-            self.mie_table["pl"] = load_mie_file(data_path + "/Mie1064nm_liq_c.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/Mie1064nm_liq_c.dat")  # Rowe et al. (2020) -10 C
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/Mie1064nm_liq_c.dat")
         else:
-            self.mie_table["cl"] = load_mie_file(data_path + "/Mie1064nm_liq.dat")  # Segelstein (1981) 25 C
-            self.mie_table["pl"] = load_mie_file(data_path + "/Mie1064nm_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/Mie1064nm_ci.dat")
-        self.mie_table["pi"] = load_mie_file(data_path + "/Mie1064nm_pi.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/Mie1064nm_liq.dat")  # Segelstein (1981) 25 C
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/Mie1064nm_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/Mie1064nm_ci.dat")
+        self.mie_table.set_loader("pi", load_mie_file, data_path + "/Mie1064nm_pi.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(
-                data_path + "/Mie1064nm_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
+            self.mie_table.set_loader("pi", load_mie_file,
+                                      data_path + "/Mie1064nm_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/Mie1064nm_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/Mie1064nm_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(data_path + "/C6_1064nm_8col_agg_rough_270K.dat", False)
+        self.scat_table.set_loader("E3_ice", load_scat_file, data_path + "/C6_1064nm_8col_agg_rough_270K.dat", False)
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_1064nm_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_1064nm_C6PSD_c6_8col_ice_agg_rough_270K.dat")
         if supercooled:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_1064nm_C6PSD_mie_liq_c.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_1064nm_C6PSD_mie_liq_c.dat")
         else:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_1064nm_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_1064nm_C6PSD_mie_ice.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_1064nm_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_1064nm_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_1064nm_ice.dat", False, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_1064nm_ice.dat", False, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_1064nm_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_1064nm_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
         if supercooled:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_1064nm_mDAD_mie_liq_c.nc")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_1064nm_mDAD_mie_liq_c.nc")
         else:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_1064nm_mDAD_mie_liq.nc")
-        self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_1064nm_mDAD_mie_ice.dat",
-                                                                  param_type="mDAD")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_1064nm_mDAD_mie_liq.nc")
+        self.bulk_table.set_loader("mie_ice_CESM_PSD", load_bulk_scat_file, data_path + "/bulk_1064nm_mDAD_mie_ice.dat",
+                                   param_type="mDAD")
 
 
 class NEXRAD(Instrument):
@@ -600,41 +600,41 @@ class NEXRAD(Instrument):
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
 
         if supercooled:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieNEXRAD_liq_c.dat")  # Turner et al. (2016) -10 C
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieNEXRAD_liq_c.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieNEXRAD_liq_c.dat")  # Turner et al. (2016) -10 C
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieNEXRAD_liq_c.dat")
         else:
-            self.mie_table["cl"] = load_mie_file(data_path + "/MieNEXRAD_liq.dat")
-            self.mie_table["pl"] = load_mie_file(data_path + "/MieNEXRAD_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/MieNEXRAD_ci.dat")
+            self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieNEXRAD_liq.dat")
+            self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieNEXRAD_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/MieNEXRAD_ci.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieNEXRAD_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieNEXRAD_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieNEXRAD_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieNEXRAD_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(
-            data_path + "/C6_NEXRAD_8col_agg_rough_270K.dat", True)
+        self.scat_table.set_loader("E3_ice", load_scat_file,
+                                   data_path + "/C6_NEXRAD_8col_agg_rough_270K.dat", True)
 
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_NEXRAD_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_NEXRAD_C6PSD_c6_8col_ice_agg_rough_270K.dat")
         if supercooled:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_NEXRAD_C6PSD_mie_liq_c.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_NEXRAD_C6PSD_mie_liq_c.dat")
         else:
-            self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_NEXRAD_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_NEXRAD_C6PSD_mie_ice.dat")
+            self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_NEXRAD_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_NEXRAD_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_NEXRAD_ice.dat", True, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_NEXRAD_ice.dat", True, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_NEXRAD_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_NEXRAD_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
         if supercooled:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_NEXRAD_mDAD_mie_liq_c.nc")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_NEXRAD_mDAD_mie_liq_c.nc")
         else:
-            self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_NEXRAD_mDAD_mie_liq.nc")
-        self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_NEXRAD_mDAD_mie_ice.dat",
-                                                                  param_type="mDAD")
+            self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_NEXRAD_mDAD_mie_liq.nc")
+        self.bulk_table.set_loader("mie_ice_CESM_PSD", load_bulk_scat_file, data_path + "/bulk_NEXRAD_mDAD_mie_ice.dat",
+                                   param_type="mDAD")
 
 
 class CALIOP(Instrument):
@@ -675,28 +675,28 @@ class CALIOP(Instrument):
 
         # Load mie tables
         data_path = os.path.join(os.path.dirname(__file__), 'mie_tables')
-        self.mie_table["cl"] = load_mie_file(data_path + "/MieHSRL_liq.dat")
-        self.mie_table["pl"] = load_mie_file(data_path + "/MieHSRL_liq.dat")
-        self.mie_table["ci"] = load_mie_file(data_path + "/MieHSRL_ci.dat")
+        self.mie_table.set_loader("cl", load_mie_file, data_path + "/MieHSRL_liq.dat")
+        self.mie_table.set_loader("pl", load_mie_file, data_path + "/MieHSRL_liq.dat")
+        self.mie_table.set_loader("ci", load_mie_file, data_path + "/MieHSRL_ci.dat")
         if 'DHARMA' in args:
-            self.mie_table["pi"] = load_mie_file(
-                data_path + "/MieHSRL_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
+            self.mie_table.set_loader("pi", load_mie_file,
+                                      data_path + "/MieHSRL_pi1.dat")  # pi1 for 100 kg/m^2 (DHARMA)
         else:
-            self.mie_table["pi"] = load_mie_file(data_path + "/MieHSRL_pi.dat")
+            self.mie_table.set_loader("pi", load_mie_file, data_path + "/MieHSRL_pi.dat")
         # ModelE3 bulk
         data_path = os.path.join(os.path.dirname(__file__), 'c6_tables')
-        self.scat_table["E3_ice"] = load_scat_file(data_path + "/C6_HSRL_8col_agg_rough_270K.dat", False)
+        self.scat_table.set_loader("E3_ice", load_scat_file, data_path + "/C6_HSRL_8col_agg_rough_270K.dat", False)
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_c6_tables')
-        self.bulk_table["E3_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_HSRL_C6PSD_c6_8col_ice_agg_rough_270K.dat")
-        self.bulk_table["E3_liq"] = load_bulk_scat_file(data_path + "/bulk_HSRL_C6PSD_mie_liq.dat")
-        self.bulk_table["mie_ice_E3_PSD"] = load_bulk_scat_file(data_path + "/bulk_HSRL_C6PSD_mie_ice.dat")
+        self.bulk_table.set_loader("E3_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_HSRL_C6PSD_c6_8col_ice_agg_rough_270K.dat")
+        self.bulk_table.set_loader("E3_liq", load_bulk_scat_file, data_path + "/bulk_HSRL_C6PSD_mie_liq.dat")
+        self.bulk_table.set_loader("mie_ice_E3_PSD", load_bulk_scat_file, data_path + "/bulk_HSRL_C6PSD_mie_ice.dat")
         # CESM/E3SM bulk
         data_path = os.path.join(os.path.dirname(__file__), 'mDAD_tables')
-        self.scat_table["CESM_ice"] = load_scat_file(data_path + "/mDAD_HSRL_ice.dat", False, param_type="mDAD")
+        self.scat_table.set_loader("CESM_ice", load_scat_file, data_path + "/mDAD_HSRL_ice.dat", False, param_type="mDAD")
         data_path = os.path.join(os.path.dirname(__file__), 'bulk_mDAD_tables')
-        self.bulk_table["CESM_ice"] = load_bulk_scat_file(
-            data_path + "/bulk_HSRL_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
-        self.bulk_table["CESM_liq"] = xr.open_dataset(data_path + "/bulk_HSRL_mDAD_mie_liq.nc")
-        self.bulk_table["mie_ice_CESM_PSD"] = load_bulk_scat_file(data_path + "/bulk_HSRL_mDAD_mie_ice.dat",
-                                                                  param_type="mDAD")
+        self.bulk_table.set_loader("CESM_ice", load_bulk_scat_file,
+                                   data_path + "/bulk_HSRL_mDAD_mDAD_ice_263K.dat", param_type="mDAD")
+        self.bulk_table.set_loader("CESM_liq", xr.open_dataset, data_path + "/bulk_HSRL_mDAD_mie_liq.nc")
+        self.bulk_table.set_loader("mie_ice_CESM_PSD", load_bulk_scat_file, data_path + "/bulk_HSRL_mDAD_mie_ice.dat",
+                                   param_type="mDAD")
@@ -17,6 +17,7 @@ except:
 from .instrument import ureg, quantity
 from netCDF4 import Dataset
 from ..scattering import brandes
+from ..io import write_chunked_netcdf
 
 try:
     from wrf import tk, getvar, ALL_TIMES
@@ -103,6 +104,19 @@ class Model():
         some models).
     model_name: str
         The name of the model.
+    time_offset: int
+        The index of the first time step of ds in the full model record. This is nonzero
+        when the model is processed in time blocks, and is used to seed the random number
+        generator of each time column in the subcolumn generator.
+    precision: str
+        The floating point precision of the model fields and the simulated subcolumn fields
+        ('float64' or 'float32'). See :py:meth:`set_precision`.
+    active_cells: dict
+        The flat indices of the (subcolumn, time, height) cells with a positive mixing ratio,
+        keyed by the name of the subcolumn mixing ratio field (e.g., 'strat_q_subcolumns_cl').
+        Set by :py:func:`emc2.simulator.subcolumn.set_q_n` and used by the forward operators
+        to skip hydrometeor-free cells (see :py:func:`emc2.simulator.subcolumn.get_active_cells`,
+        which finds the cells again if the field was replaced).
     variable_density: dict
         If the model allows for particle density for vary (e.g. 2-moment NSSL), then
         this is a dict pointing to the variable with the density for each hydrometeor class
@@ -142,6 +156,9 @@ class Model():
         self.stacked_time_dim = None
         self.process_conv = True
         self.model_name = ""
+        self.time_offset = 0
+        self.precision = "float64"
+        self.active_cells = {}
         self.consts = {"c": 299792458.0,  # m/s
                        "R_d": 287.058,  # J K^-1 Kg^-1
                        "g": 9.80665,  # m/s^2
@@ -159,11 +176,45 @@ class Model():
         for variable in self.ds.variables.keys():
             attrs = self.ds[variable].attrs
             try:
-                self.ds[variable] = self.ds[variable].astype('float64')
+                self.ds[variable] = self.ds[variable].astype(self.precision)
             except TypeError:
                 continue
             self.ds[variable].attrs = attrs
 
+    def set_precision(self, precision):
+        """
+        Sets the floating point precision of the model and casts the floating point
+        fields in the model dataset to it.
+
+        The subcolumn generator and the forward operators allocate their subcolumn fields
+        with this precision. With 'float32', quantities that would lose accuracy or overflow
+        in single precision (e.g., the gamma PSD intercept, cumulative optical depth sums, and
+        dBZ to linear conversions) are still calculated in double precision before the
+        results are cast.
+
+        Parameters
+        ----------
+        precision: str or numpy.dtype
+            The floating point precision ('float64' or 'float32').
+        """
+        precision = np.dtype(precision).name
+        if precision not in ["float32", "float64"]:
+            raise ValueError("The precision must be either 'float32' or 'float64' (got %s)." % precision)
+        self.precision = precision
+        self._cast_to_precision()
+
+    def _cast_to_precision(self, subcolumns_only=False):
+        """
+        Casts the floating point fields in the model dataset (or only the fields with a
+        subcolumn dimension) to the model precision.
+        """
+        for variable in list(self.ds.data_vars.keys()):
+            if self.ds[variable].dtype.kind != "f" or self.ds[variable].dtype == self.precision:
+                continue
+            if subcolumns_only and "subcolumn" not in self.ds[variable].dims:
+                continue
+            self.ds[variable] = self.ds[variable].astype(self.precision)
+
     def _crop_bounding_box(self, bounding_box):
         """
         Crop the input region to a given bounding box for a regional model.
@@ -466,14 +517,23 @@ class Model():
         else:
             return hyd_types
 
-    def subcolumns_to_netcdf(self, file_name):
+    def subcolumns_to_netcdf(self, file_name, append=False, time_chunk=None, complevel=4):
         """
-        Saves all of the simulated subcolumn parameters to a netCDF file.
+        Saves all of the simulated subcolumn parameters to a chunked and compressed netCDF4 file.
+        The variables are chunked in slabs of time steps and the time dimension is unlimited
+        (see :py:func:`emc2.io.write_chunked_netcdf`).
 
         Parameters
         ----------
         file_name: str
             The name of the file to save to.
+        append: bool
+            If True and the file exists, append the subcolumn parameters to the file along
+            the time dimension (e.g., when processing the model in time blocks).
+        time_chunk: int or None
+            The number of time steps per chunk. None will use chunks of about 1 MiB.
+        complevel: int
+            The zlib compression level (0 to disable compression).
         """
         # Set all relevant variables to save:
         vars_to_keep = ["sub_col", "subcol", "strat_", "conv_", "_tot", "_ext", "_mask", "_min", "mpr", "fpr", self.time_dim, "Times"]
@@ -482,11 +542,12 @@ class Model():
             if np.any([x in my_var for x in vars_to_keep]):
                 var_dict[my_var] = self.ds[my_var]
         out_ds = xr.Dataset(var_dict)
-        out_ds.to_netcdf(file_name)
+        write_chunked_netcdf(out_ds, file_name, time_dim=self.time_dim, append=append,
+                             time_chunk=time_chunk, complevel=complevel)
 
-    def load_subcolumns_from_netcdf(self, file_name):
+    def load_subcolumns_from_netcdf(self, file_name, chunks=None, variables=None, lazy=False):
         """
-        Load all of the subcolumn data from a previously saved netCDF file.
+        Load the subcolumn data from a previously saved netCDF file.
         The dataset being loaded must match the current number of subcolumns if there are any
         generated.
 
@@ -494,14 +555,36 @@ class Model():
         ----------
         file_name: str
             Name of the file to save.
+        chunks: dict, str, or None
+            If not None, the subcolumn data are opened lazily as Dask arrays with these chunks
+            (see :py:func:`xarray.open_dataset`; use {} for the chunks of the file).
+        variables: list of str or None
+            The names of the variables to load (the coordinates are always loaded).
+            None will load all of the variables.
+        lazy: bool
+            If True (or if chunks is not None), the subcolumn data are kept as file-backed
+            arrays that are only read when needed, and the file remains open. If False, the
+            data are loaded into memory and the file is closed.
         """
-        my_file = xr.open_dataset(file_name)
-        self.ds = xr.merge([self.ds, my_file])
-        my_file.close()
+        my_file = xr.open_dataset(file_name, chunks=chunks)
+        if variables is not None:
+            missing_vars = [x for x in variables if x not in my_file.variables]
+            if len(missing_vars) > 0:
+                my_file.close()
+                raise KeyError("Variable(s) %s not found in %s" % (missing_vars, file_name))
+            my_file = my_file[variables]
+        if not (lazy or chunks is not None):
+            my_file.load()
+            my_file.close()
+        if len(self.ds.variables) == 0:
+            self.ds = my_file
+        else:
+            self.ds = xr.merge([self.ds, my_file])
+        self.active_cells = {}
 
 
 class ModelE(Model):
-    def __init__(self, file_path, time_range=None, load_processed=False):
+    def __init__(self, file_path, time_range=None, load_processed=False, lazy_load=False, load_vars=None):
         """
         This loads a ModelE simulation with all of the necessary parameters for EMC^2 to run.
 
@@ -514,6 +597,12 @@ class ModelE(Model):
         load_processed: bool
             If True, treating the 'file_path' variable as an EMC2-processed dataset; thus skipping
             dimension stacking as part of pre-processing.
+        lazy_load: bool
+            If True and load_processed is True, keep the processed subcolumn data as file-backed
+            arrays that are only read when needed (see :py:meth:`Model.load_subcolumns_from_netcdf`).
+        load_vars: list of str or None
+            If load_processed is True, the names of the processed variables to load. None will
+            load all of the variables.
         """
         super().__init__()
         self.Rho_hyd = {'cl': 1000. * ureg.kg / (ureg.m**3), 'ci': 500. * ureg.kg / (ureg.m**3),
@@ -554,7 +643,7 @@ class ModelE(Model):
 
         if load_processed:
             self.ds = xr.Dataset()
-            self.load_subcolumns_from_netcdf(file_path)
+            self.load_subcolumns_from_netcdf(file_path, variables=load_vars, lazy=lazy_load)
         else:
             self.ds = read_netcdf(file_path)
         if np.logical_and("level" in self.ds.coords, not "p" in self.ds.coords):
@@ -580,7 +669,7 @@ class ModelE(Model):
 
 class E3SM(Model):
     def __init__(self, file_path, time_range=None, load_processed=False, time_dim="time", appended_str=False,
-                 all_appended_in_lat=False):
+                 all_appended_in_lat=False, lazy_load=False, load_vars=None):
         """
         This loads an E3SM simulation output with all of the necessary parameters for EMC^2 to run.
 
@@ -601,6 +690,12 @@ class E3SM(Model):
         all_appended_in_lat: bool
             If True using only the appended str portion to the lat_dim. Otherwise, combining
             the appended str from both the lat and lon dims (relevant if appended_str is True).
+        lazy_load: bool
+            If True and load_processed is True, keep the processed subcolumn data as file-backed
+            arrays that are only read when needed (see :py:meth:`Model.load_subcolumns_from_netcdf`).
+        load_vars: list of str or None
+            If load_processed is True, the names of the processed variables to load. None will
+            load all of the variables.
         """
         super().__init__()
         self.Rho_hyd = {'cl': 1000. * ureg.kg / (ureg.m**3), 'ci': 500. * ureg.kg / (ureg.m**3),
@@ -643,7 +738,7 @@ class E3SM(Model):
         self.process_conv = False
         if load_processed:
             self.ds = xr.Dataset()
-            self.load_subcolumns_from_netcdf(file_path)
+            self.load_subcolumns_from_netcdf(file_path, variables=load_vars, lazy=lazy_load)
         else:
             self.ds = read_netcdf(file_path)
             if appended_str:
@@ -705,7 +800,8 @@ class E3SM(Model):
 
 
 class CESM2(E3SM):
-    def __init__(self, file_path, time_range=None, load_processed=False, time_dim="time", appended_str=False):
+    def __init__(self, file_path, time_range=None, load_processed=False, time_dim="time", appended_str=False,
+                 lazy_load=False, load_vars=None):
         """
         This loads a CESM2 simulation output with all of the necessary parameters for EMC^2 to run.
 
@@ -723,8 +819,15 @@ class CESM2(E3SM):
         appended_str: bool
             If True, removing appended strings added to fieldnames and coordinates during
             post-processing (e.g., in cropped regions from global simualtions).
+        lazy_load: bool
+            If True and load_processed is True, keep the processed subcolumn data as file-backed
+            arrays that are only read when needed (see :py:meth:`Model.load_subcolumns_from_netcdf`).
+        load_vars: list of str or None
+            If load_processed is True, the names of the processed variables to load. None will
+            load all of the variables.
         """
-        super().__init__(file_path, time_range, load_processed, time_dim, appended_str)
+        super().__init__(file_path, time_range, load_processed, time_dim, appended_str,
+                         lazy_load=lazy_load, load_vars=load_vars)
         self.model_name = "CESM2"
 
 
@@ -992,7 +1095,7 @@ class WRF(Model):
 
 class DHARMA(Model):
     def __init__(self, file_path, time_range=None, time_dim="dom_col", single_pi_class=True,
-                 load_processed=False):
+                 load_processed=False, lazy_load=False, load_vars=None):
         """
         This loads a DHARMA simulation with all of the necessary parameters
         for EMC^2 to run.
@@ -1013,6 +1116,12 @@ class DHARMA(Model):
         load_processed: bool
             If True, treating the 'file_path' variable as an EMC2-processed dataset; thus skipping
             appended string removal and dimension stacking, which are typically part of pre-processing.
+        lazy_load: bool
+            If True and load_processed is True, keep the processed subcolumn data as file-backed
+            arrays that are only read when needed (see :py:meth:`Model.load_subcolumns_from_netcdf`).
+        load_vars: list of str or None
+            If load_processed is True, the names of the processed variables to load. None will
+            load all of the variables.
         """
         super().__init__()
         self.Rho_hyd = {'cl': 1000. * ureg.kg / (ureg.m**3), 'ci': 500. * ureg.kg / (ureg.m**3),
@@ -1079,7 +1188,7 @@ class DHARMA(Model):
 
         if load_processed:
             self.ds = xr.Dataset()
-            self.load_subcolumns_from_netcdf(file_path)
+            self.load_subcolumns_from_netcdf(file_path, variables=load_vars, lazy=lazy_load)
         else:
             self.ds = xr.open_dataset(file_path)
             for variable in self.ds.variables.keys():
@@ -12,9 +12,14 @@ This module contains all of the basic I/O functions of EMC^2:
     load_scat_file
     load_bulk_scat_file
     load_arm_file
+    write_chunked_netcdf
+    table_cache.get_table_cache_dir
+    table_cache.clear_table_cache
 """
 
 from .load_mie_file import load_mie_file
 from .load_scat_file import load_scat_file
 from .load_bulk_scat_file import load_bulk_scat_file
 from .load_obs import load_arm_file
+from .write_netcdf import write_chunked_netcdf
+from . import table_cache
@@ -1,7 +1,9 @@
 import pandas as pd
 
+from .table_cache import read_table_cache, write_table_cache
 
-def load_bulk_scat_file(filename, param_type="C6"):
+
+def load_bulk_scat_file(filename, param_type="C6", use_cache=True):
     """
     Loads bulk ice or liquid scattering LUTs from a file
     (by default using the PSD used in the C6 collection).
@@ -14,7 +16,9 @@ def load_bulk_scat_file(filename, param_type="C6"):
         parameterization type:
         C6 - C6 collection based on Yang et al., JAS, 2013 (as used in the GISS ModelE3).
         mDAD - equivalent V/A spheres after implementing m-D and A-D parameterizations (as used in CESM and E3SM).
-
+    use_cache: bool
+        If True, load the parsed table from the on-disk table cache when available
+        (see :py:mod:`emc2.io.table_cache`) and add it to the cache otherwise.
 
     Returns
     -------
@@ -22,6 +26,10 @@ def load_bulk_scat_file(filename, param_type="C6"):
         The xarray Dataset storing the scattering data, including
         descriptive metadata.
     """
+    if use_cache:
+        my_df = read_table_cache(filename, "load_bulk_scat_file", param_type=param_type)
+        if my_df is not None:
+            return my_df
 
     if param_type == "C6":
         names = ["r_e", "Q_scat", "Q_ext", "Q_back", "Q_back_cross", "LDR", "lidar_ratio"]
@@ -70,4 +78,6 @@ def load_bulk_scat_file(filename, param_type="C6"):
     my_df["lidar_ratio"].attrs["long_name"] = "Bulk Lidar ratio"
     my_df['lidar_ratio'].attrs["standard_name"] = "Lidar ratio"
 
+    if use_cache:
+        write_table_cache(my_df, filename, "load_bulk_scat_file", param_type=param_type)
     return my_df
@@ -1,8 +1,10 @@
 import pandas as pd
 import numpy as np
 
+from .table_cache import read_table_cache, write_table_cache
 
-def load_mie_file(filename):
+
+def load_mie_file(filename, use_cache=True):
     """
     Loads the Mie parameters from a file.
 
@@ -10,6 +12,9 @@ def load_mie_file(filename):
     ----------
     filename: str
         The name of the file storing the Mie scattering parameters
+    use_cache: bool
+        If True, load the parsed table from the on-disk table cache when available
+        (see :py:mod:`emc2.io.table_cache`) and add it to the cache otherwise.
 
     Returns
     -------
@@ -17,6 +22,10 @@ def load_mie_file(filename):
         The xarray Dataset storing the Mie parameters, including
         descriptive metadata.
     """
+    if use_cache:
+        my_df = read_table_cache(filename, "load_mie_file")
+        if my_df is not None:
+            return my_df
 
     my_df = pd.read_csv(filename, delim_whitespace=True,
                         names=["wavelength", "p_diam", "size_parameter", "compre_real",
@@ -76,4 +85,6 @@ def load_mie_file(filename):
     my_df["backscat_eff"].attrs["long_name"] = "Backscattering efficiency"
     my_df["backscat_eff"].attrs["standard_name"] = "Backscattering_efficiency"
 
+    if use_cache:
+        write_table_cache(my_df, filename, "load_mie_file")
     return my_df
@@ -1,7 +1,9 @@
 import pandas as pd
 
+from .table_cache import read_table_cache, write_table_cache
 
-def load_scat_file(filename, is_radar, param_type="C6"):
+
+def load_scat_file(filename, is_radar, param_type="C6", use_cache=True):
     """
     Loads ice scattering LUTs from a file.
     (by default using the PSD used in the C6 collection).
@@ -17,6 +19,9 @@ def load_scat_file(filename, is_radar, param_type="C6"):
         parameterization type:
         C6 - C6 collection based on Yang et al., JAS, 2013 (as used in the GISS ModelE3).
         mDAD - equivalent V/A spheres after implementing m-D and A-D parameterizations (as used in CESM and E3SM).
+    use_cache: bool
+        If True, load the parsed table from the on-disk table cache when available
+        (see :py:mod:`emc2.io.table_cache`) and add it to the cache otherwise.
 
     Returns
     -------
@@ -24,6 +29,11 @@ def load_scat_file(filename, is_radar, param_type="C6"):
         The xarray Dataset storing the scattering data, including
         descriptive metadata.
     """
+    if use_cache:
+        my_df = read_table_cache(filename, "load_scat_file", is_radar=is_radar, param_type=param_type)
+        if my_df is not None:
+            return my_df
+
     if is_radar is True:
         first_input = "frequency"
     else:
@@ -100,4 +110,6 @@ def load_scat_file(filename, is_radar, param_type="C6"):
     my_df["alpha_p"].attrs["long_name"] = "Extinction cross section"
     my_df["alpha_p"].attrs["standard_name"] = "Ext_cross_section"
 
+    if use_cache:
+        write_table_cache(my_df, filename, "load_scat_file", is_radar=is_radar, param_type=param_type)
     return my_df
@@ -0,0 +1,144 @@
+"""
+Persistent on-disk cache of parsed scattering LUTs.
+
+Parsed tables are stored as one .npy file per variable (plus a JSON file with the
+dimensions and metadata) so that they can be memory-mapped when loaded again.
+Cache entries are keyed on the cache format version, the loader name and parameters,
+and the path, modification time, and size of the source file.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import warnings
+
+import numpy as np
+import xarray as xr
+
+CACHE_VERSION = 1
+
+
+def get_table_cache_dir():
+    """
+    Returns the directory of the scattering LUT cache.
+
+    The directory is set by the EMC2_CACHE_DIR environment variable (an empty
+    string disables the cache) and defaults to $XDG_CACHE_HOME/emc2/tables
+    (~/.cache/emc2/tables).
+
+    Returns
+    -------
+    cache_dir: str or None
+        The cache directory. None if caching is disabled.
+    """
+    cache_dir = os.environ.get("EMC2_CACHE_DIR")
+    if cache_dir is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+        cache_dir = os.path.join(cache_home, "emc2", "tables")
+    if cache_dir == "":
+        return None
+    return cache_dir
+
+
+def read_table_cache(filename, loader_name, **params):
+    """
+    Loads a parsed scattering LUT from the cache.
+
+    Parameters
+    ----------
+    filename: str
+        The name of the source file of the LUT.
+    loader_name: str
+        The name of the function that parses the source file.
+    Additional keyword arguments are the loader parameters that are part of the cache key.
+
+    Returns
+    -------
+    my_df: xarray.Dataset or None
+        The xarray Dataset with memory-mapped variables, or None if the LUT is not cached.
+    """
+    entry_dir = _get_entry_dir(filename, loader_name, params)
+    if entry_dir is None or not os.path.isdir(entry_dir):
+        return None
+    try:
+        with open(os.path.join(entry_dir, "meta.json"), "r") as meta_file:
+            meta = json.load(meta_file)
+        if meta["version"] != CACHE_VERSION:
+            return None
+        data_vars = {}
+        coords = {}
+        for i, (var_name, var_meta) in enumerate(meta["variables"].items()):
+            values = np.load(os.path.join(entry_dir, "%d.npy" % i), mmap_mode="r")
+            variable = xr.Variable(var_meta["dims"], values, attrs=var_meta["attrs"])
+            if var_meta["is_coord"]:
+                coords[var_name] = variable
+            else:
+                data_vars[var_name] = variable
+    except (OSError, ValueError, KeyError):
+        return None
+    return xr.Dataset(data_vars, coords=coords, attrs=meta["attrs"])
+
+
+def write_table_cache(my_df, filename, loader_name, **params):
+    """
+    Writes a parsed scattering LUT to the cache. Failures to write are reported
+    as warnings.
+
+    Parameters
+    ----------
+    my_df: xarray.Dataset
+        The parsed LUT.
+    filename: str
+        The name of the source file of the LUT.
+    loader_name: str
+        The name of the function that parses the source file.
+    Additional keyword arguments are the loader parameters that are part of the cache key.
+    """
+    entry_dir = _get_entry_dir(filename, loader_name, params)
+    if entry_dir is None or os.path.isdir(entry_dir):
+        return
+    meta = {"version": CACHE_VERSION, "source": os.path.abspath(filename),
+            "attrs": _to_json_attrs(my_df.attrs), "variables": {}}
+    try:
+        os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(entry_dir))
+        for i, var_name in enumerate(my_df.variables):
+            np.save(os.path.join(tmp_dir, "%d.npy" % i), my_df[var_name].values)
+            meta["variables"][var_name] = {
+                "dims": list(my_df[var_name].dims), "attrs": _to_json_attrs(my_df[var_name].attrs),
+                "is_coord": var_name in my_df.coords}
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as meta_file:
+            json.dump(meta, meta_file)
+        try:
+            os.rename(tmp_dir, entry_dir)
+        except OSError:  # Another process wrote the same entry first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except (OSError, TypeError) as err:
+        warnings.warn("Could not write %s to the table cache: %s" % (filename, err))
+
+
+def clear_table_cache():
+    """
+    Removes all entries from the scattering LUT cache.
+    """
+    cache_dir = get_table_cache_dir()
+    if cache_dir is not None and os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir)
+
+
+def _get_entry_dir(filename, loader_name, params):
+    cache_dir = get_table_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        file_stat = os.stat(filename)
+    except OSError:
+        return None
+    key = json.dumps([CACHE_VERSION, loader_name, os.path.abspath(filename), file_stat.st_mtime_ns,
+                      file_stat.st_size, sorted(params.items())])
+    return os.path.join(cache_dir, "%s_%s" % (loader_name, hashlib.sha1(key.encode()).hexdigest()))
+
+
+def _to_json_attrs(attrs):
+    return {key: val.item() if isinstance(val, np.generic) else val for key, val in attrs.items()}
@@ -0,0 +1,106 @@
+"""
+Chunked and compressed netCDF4 output of (subcolumn, time, height) products.
+
+Variables are chunked in slabs of time steps spanning all of the other dimensions, so
+reading a time range or a single variable only decompresses the chunks that are needed.
+The time dimension is unlimited, such that new time blocks can be appended to the file.
+"""
+import os
+import threading
+
+import dask.array as da
+import numpy as np
+import xarray as xr
+
+from netCDF4 import Dataset
+
+
+def write_chunked_netcdf(ds, file_name, time_dim="time", append=False, time_chunk=None,
+                         complevel=4):
+    """
+    Writes a dataset to a chunked and compressed netCDF4 file, or appends it to an existing
+    file along the time dimension.
+
+    Dask-backed variables are computed chunk by chunk (in parallel, with the writes to
+    the file serialized), so the dataset does not need to fit in memory. This also holds
+    when appending, where the chunks of all of the appended variables are stored together.
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset to write.
+    file_name: str
+        The name of the netCDF file.
+    time_dim: str
+        The name of the time dimension. This dimension is unlimited in the file.
+    append: bool
+        If True and the file exists, append the variables with a time dimension to the
+        existing file along the time dimension. The variables must already exist in the file.
+    time_chunk: int or None
+        The number of time steps per chunk. None will use chunks of about 1 MiB.
+    complevel: int
+        The zlib compression level (0 to disable compression).
+    """
+    if append and os.path.isfile(file_name):
+        _append_netcdf(ds, file_name, time_dim)
+        return
+
+    ds = ds.copy()
+    encoding = {}
+    for var_name, variable in ds.variables.items():
+        variable.encoding = {key: val for key, val in variable.encoding.items()
+                             if key in ["units", "calendar", "dtype", "_FillValue"]}
+        encoding[var_name] = _get_encoding(variable, time_dim, time_chunk, complevel)
+    unlimited_dims = [time_dim] if time_dim in ds.dims else None
+    ds.to_netcdf(file_name, format="NETCDF4", encoding=encoding, unlimited_dims=unlimited_dims)
+
+
+def _get_encoding(variable, time_dim, time_chunk, complevel):
+    if variable.ndim == 0 or variable.dtype.kind not in "biuf":
+        return {}
+    chunk_sizes = list(variable.shape)
+    if time_dim in variable.dims:
+        t_axis = variable.dims.index(time_dim)
+        if time_chunk is None:
+            slab_size = variable.dtype.itemsize * int(np.prod(chunk_sizes)) // max(chunk_sizes[t_axis], 1)
+            time_chunk = 2**20 // max(slab_size, 1)
+        chunk_sizes[t_axis] = int(np.clip(time_chunk, 1, max(chunk_sizes[t_axis], 1)))
+    encoding = {"chunksizes": tuple(max(x, 1) for x in chunk_sizes)}
+    if complevel > 0:
+        encoding.update({"zlib": True, "complevel": complevel, "shuffle": True})
+    return encoding
+
+
+def _append_netcdf(ds, file_name, time_dim):
+    with Dataset(file_name, "a") as nc_file:
+        if time_dim not in nc_file.dimensions:
+            raise ValueError("%s does not have a %s dimension to append to." % (file_name, time_dim))
+        t_start = len(nc_file.dimensions[time_dim])
+        sources, targets, regions = [], [], []
+        for var_name, variable in ds.variables.items():
+            if time_dim not in variable.dims:
+                continue
+            if var_name not in nc_file.variables:
+                raise KeyError("%s is not a variable in %s. Only variables that are already in the "
+                               "file can be appended." % (var_name, file_name))
+            nc_var = nc_file.variables[var_name]
+            if nc_var.dimensions != variable.dims:
+                raise ValueError("The dimensions of %s (%s) do not match the dimensions in %s (%s)." %
+                                 (var_name, variable.dims, file_name, nc_var.dimensions))
+            encoding = {key: nc_var.getncattr(key) for key in ["units", "calendar"]
+                        if key in nc_var.ncattrs()}
+            if variable.dtype.kind != "b":
+                encoding["dtype"] = nc_var.dtype
+            encoded = xr.conventions.encode_cf_variable(
+                xr.Variable(variable.dims, variable.data, encoding=encoding), name=var_name)
+            t_axis = variable.dims.index(time_dim)
+            out_slice = [slice(None)] * variable.ndim
+            out_slice[t_axis] = slice(t_start, t_start + variable.shape[t_axis])
+            if isinstance(encoded.data, da.Array):
+                sources.append(encoded.data)
+                targets.append(nc_var)
+                regions.append(tuple(out_slice))
+            else:
+                nc_var[tuple(out_slice)] = encoded.values
+        if sources:
+            da.store(sources, targets, regions=regions, lock=threading.Lock())
@@ -16,9 +16,17 @@ simulator in EMC^2.
     classification.radar_classify_phase
     classification.lidar_emulate_cosp_phase
     classification.calculate_phase_ratio
+    executor.get_executor
+    executor.SerialExecutor
+    executor.ThreadExecutor
+    executor.DaskExecutor
+    executor.ProcessExecutor
 
     psd.calc_mu_lambda
     psd.calc_re_thompson
+    psd.calc_psd_integral_table
+    psd.interp_psd_integral_table
+    psd.calc_bulk_mu_lambda_interpolator
     radar_moments.calc_total_reflectivity
     radar_moments.accumulate_attenuation
     radar_moments.calc_radar_empirical
@@ -37,10 +45,12 @@ simulator in EMC^2.
     subcolumn.set_stratiform_sub_col_frac
     subcolumn.set_precip_sub_col_frac
     subcolumn.set_q_n
+    subcolumn.get_active_cells
 """
 
 from . import attenuation
 from . import classification
+from . import executor
 from . import radar_moments
 from . import lidar_moments
 from . import psd
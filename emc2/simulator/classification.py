@@ -150,14 +150,13 @@ def radar_classify_phase(instrument, model, mask_height_rng=None, convert_zeros_
         else:
             phase_mask = np.zeros_like(model.ds["strat_frac_subcolumns_cl"], dtype=np.uint8)
         phase_mask = np.where(model.ds[Ze_fieldnames[ii]].values >=
-                              np.tile(model.ds['Ze_min'].values,
-                                      (model.num_subcolumns, 1, 1)), 3, phase_mask)  # Precip
+                              model.ds['Ze_min'].values[np.newaxis, :, :], 3, phase_mask)  # Precip
         phase_mask = np.where(np.logical_and(cld_exist_cond[ii], phase_mask != 3), 1, phase_mask)  # Cloud
         phase_mask = np.where(np.logical_and(cld_exist_cond[ii], phase_mask == 3), 2, phase_mask)  # Mixed
         if mask_height_rng is not None:
             phase_mask = np.where(
-                np.logical_or(np.tile(model.ds[model.z_field], (model.num_subcolumns, 1, 1)) < mask_height_rng[0],
-                              np.tile(model.ds[model.z_field], (model.num_subcolumns, 1, 1)) > mask_height_rng[1]),
+                np.logical_or(model.ds[model.z_field].values[np.newaxis, :, :] < mask_height_rng[0],
+                              model.ds[model.z_field].values[np.newaxis, :, :] > mask_height_rng[1]),
                 0, phase_mask)
         if convert_zeros_to_nan:
             phase_mask = np.where(phase_mask == 0, np.nan, phase_mask)
@@ -240,8 +239,11 @@ def lidar_emulate_cosp_phase(instrument, model, eta=0.7, OD_from_sfc=True, phase
     else:
         hyd_classes = {"liq": ["cl"], "ice": ["ci"]}
 
-    ATB_mol = np.tile(model.ds['sigma_180_vol'].values * (1. + 0.0284) * model.ds['tau'].values,
-                      (model.num_subcolumns, 1, 1))
+    # Grid-mean molecular fields broadcast over the subcolumn dimension
+    beta_m = model.ds['sigma_180_vol'].values[np.newaxis, :, :]
+    tau = model.ds['tau'].values[np.newaxis, :, :]
+    T_values = model.ds[model.T_field].values[np.newaxis, :, :]
+    ATB_mol = beta_m * (1. + 0.0284) * tau
 
     beta_p_allhyd = np.zeros_like(model.ds['sub_col_beta_p_tot_strat'].values)
     beta_p_cross_allhyd = np.zeros_like(model.ds['sub_col_beta_p_tot_strat'].values)
@@ -264,25 +266,17 @@ def lidar_emulate_cosp_phase(instrument, model, eta=0.7, OD_from_sfc=True, phase
                 beta_p[hyd_class] += np.nan_to_num(
                     model.ds['sub_col_beta_p_%s_%s' % (hyd_type, cloud_class)].values)
                 OD[hyd_class] += np.nan_to_num(model.ds['sub_col_OD_%s_%s' % (hyd_type, cloud_class)].values)
-            ATB_co[hyd_class] = (np.tile(model.ds['sigma_180_vol'].values, (model.num_subcolumns, 1, 1)) +
-                                 beta_p[hyd_class]) * np.tile(
-                model.ds['tau'].values, (model.num_subcolumns, 1, 1)) * \
-                np.exp(-2 * eta * OD[hyd_class])
+            ATB_co[hyd_class] = (beta_m + beta_p[hyd_class]) * tau * np.exp(-2 * eta * OD[hyd_class])
             ATB_cross[hyd_class] = np.polyval(atb_cross_coeff[hyd_class], ATB_co[hyd_class] * 1e3) / 1e3
-            beta_p_cross[hyd_class] = ATB_cross[hyd_class] / np.exp(-2 * eta * OD[hyd_class]) / \
-                np.tile(model.ds['tau'].values, (model.num_subcolumns, 1, 1)) - \
-                np.tile(model.ds['sigma_180_vol'].values * (0.0284 / (1 + 0.0284)), (model.num_subcolumns, 1, 1))
+            beta_p_cross[hyd_class] = ATB_cross[hyd_class] / np.exp(-2 * eta * OD[hyd_class]) / tau - \
+                beta_m * (0.0284 / (1 + 0.0284))
             beta_p_allhyd += beta_p[hyd_class]
             beta_p_cross_allhyd += beta_p_cross[hyd_class]
             OD_allhyd += OD[hyd_class]
         ATB_tot = (beta_p["liq"] + beta_p_cross["liq"] + beta_p["ice"] + beta_p_cross["ice"] +
-                   np.tile(model.ds['sigma_180_vol'].values * (1. + 0.0284), (model.num_subcolumns, 1, 1))) * \
-            np.exp(-2 * eta * (OD["liq"] + OD["ice"])) * \
-            np.tile(model.ds['tau'].values, (model.num_subcolumns, 1, 1))
-        ATB_cross_tot = (beta_p_cross["liq"] + beta_p_cross["ice"] + np.tile(model.ds['sigma_180_vol'].values *
-                         (0.0284 / (1. + 0.0284)), (model.num_subcolumns, 1, 1))) * \
-            np.exp(-2 * eta * (OD["liq"] + OD["ice"])) * \
-            np.tile(model.ds['tau'].values, (model.num_subcolumns, 1, 1))
+                   beta_m * (1. + 0.0284)) * np.exp(-2 * eta * (OD["liq"] + OD["ice"])) * tau
+        ATB_cross_tot = (beta_p_cross["liq"] + beta_p_cross["ice"] + beta_m * (0.0284 / (1. + 0.0284))) * \
+            np.exp(-2 * eta * (OD["liq"] + OD["ice"])) * tau
         del beta_p_cross, ATB_cross, ATB_co, OD, beta_p
 
         # Begin cloud detection and phase classification
@@ -301,11 +295,9 @@ def lidar_emulate_cosp_phase(instrument, model, eta=0.7, OD_from_sfc=True, phase
         reflective_mask = np.where(np.logical_and(SR > undef_SR_thresh, reflective_mask == 1),
                                    0, reflective_mask)
 
-        phase_mask = np.where(np.logical_and(np.tile(model.ds[model.T_field].values,
-                                                     (model.num_subcolumns, 1, 1)) > 273.15,
+        phase_mask = np.where(np.logical_and(T_values > 273.15,
                               phase_mask > 0), 1, phase_mask)
-        phase_mask = np.where(np.logical_and(np.tile(model.ds[model.T_field].values,
-                                                     (model.num_subcolumns, 1, 1)) < 233.15,
+        phase_mask = np.where(np.logical_and(T_values < 233.15,
                               phase_mask > 0), 2, phase_mask)
         phase_mask = np.where(np.logical_and(reflective_mask > 0, phase_mask > 0), 3, phase_mask)
         if convert_zeros_to_nan:
@@ -336,14 +328,10 @@ def lidar_emulate_cosp_phase(instrument, model, eta=0.7, OD_from_sfc=True, phase
             model.ds["COSP_SR_%s" % cloud_class].attrs["units"] = r"$m^{-1}\ sr^{-1}$"
 
     # determine phase_mask for all hydrometeors
-    ATB_tot_allhyd = (beta_p_allhyd + beta_p_cross_allhyd +
-                      np.tile(model.ds['sigma_180_vol'].values * (1. + 0.0284), (model.num_subcolumns, 1, 1))) * \
-        np.exp(-2 * eta * OD_allhyd) * \
-        np.tile(model.ds['tau'].values, (model.num_subcolumns, 1, 1))
-    ATB_cross_allhyd = (beta_p_cross_allhyd + np.tile(model.ds['sigma_180_vol'].values *
-                        (0.0284 / (1. + 0.0284)), (model.num_subcolumns, 1, 1))) * \
-        np.exp(-2 * eta * OD_allhyd) * \
-        np.tile(model.ds['tau'].values, (model.num_subcolumns, 1, 1))
+    ATB_tot_allhyd = (beta_p_allhyd + beta_p_cross_allhyd + beta_m * (1. + 0.0284)) * \
+        np.exp(-2 * eta * OD_allhyd) * tau
+    ATB_cross_allhyd = (beta_p_cross_allhyd + beta_m * (0.0284 / (1. + 0.0284))) * \
+        np.exp(-2 * eta * OD_allhyd) * tau
 
     # Begin cloud detection and phase classification
     mask_name = "COSP_phase_mask_all_hyd"
@@ -363,11 +351,9 @@ def lidar_emulate_cosp_phase(instrument, model, eta=0.7, OD_from_sfc=True, phase
     reflective_mask = np.where(np.logical_and(SR_allhyd > undef_SR_thresh, reflective_mask == 1),
                                0, reflective_mask)
 
-    phase_mask = np.where(np.logical_and(np.tile(model.ds[model.T_field].values,
-                                                 (model.num_subcolumns, 1, 1)) > 273.15,
+    phase_mask = np.where(np.logical_and(T_values > 273.15,
                           phase_mask > 0), 1, phase_mask)
-    phase_mask = np.where(np.logical_and(np.tile(model.ds[model.T_field].values,
-                                                 (model.num_subcolumns, 1, 1)) < 233.15,
+    phase_mask = np.where(np.logical_and(T_values < 233.15,
                           phase_mask > 0), 2, phase_mask)
     phase_mask = np.where(np.logical_and(reflective_mask > 0, phase_mask > 0), 3, phase_mask)
     if convert_zeros_to_nan:
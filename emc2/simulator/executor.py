@@ -0,0 +1,291 @@
+"""
+Executors used to run the column loops of the subcolumn generator and the
+forward models.
+
+Each loop is expressed as a module-level task function that is called as
+``func(task, **shared)``, where task is e.g. a (start, end) range of time
+indices and shared is a dict of the large read-only input arrays. The executor
+backends differ in how the tasks are dispatched and how the shared inputs reach
+the workers.
+"""
+import os
+import sys
+import numpy as np
+import dask.bag as db
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing import resource_tracker, shared_memory
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Shared memory block of an array passed to the process pool workers
+_SharedArray = namedtuple("_SharedArray", ["name", "shape", "dtype"])
+
+# Shared inputs attached in a process pool worker
+_worker_shared = {}
+_worker_memory = []
+
+
+class Executor(object):
+    """
+    Base class of the column loop executors.
+
+    Attributes
+    ----------
+    name: str
+        The backend name.
+    parallel: bool
+        True if the tasks are dispatched to more than one worker.
+    n_workers: int or None
+        The number of workers. None will use the number of processors.
+    """
+    name = None
+    parallel = False
+    n_workers = None
+
+    def num_workers(self):
+        """
+        Returns the number of tasks that run at the same time.
+        """
+        if not self.parallel:
+            return 1
+        return self.n_workers or os.cpu_count() or 1
+
+    def map(self, func, tasks, shared=None, chunk=None):
+        """
+        Calls func(task, \\*\\*shared) for each task.
+
+        Parameters
+        ----------
+        func: callable
+            The task function. For the process backend func must be picklable
+            (i.e., a module-level function or a functools.partial of one).
+        tasks: sequence
+            The tasks.
+        shared: dict or None
+            The read-only inputs that are passed to every task as keyword arguments.
+        chunk: int or None
+            The number of tasks to dispatch at once. None will dispatch all of the tasks
+            at once.
+
+        Returns
+        -------
+        results: list
+            The task results in the order of the tasks.
+        """
+        if shared is None:
+            shared = {}
+        return _map_in_chunks(partial(self._map, func, shared=shared), list(tasks), chunk)
+
+    def _map(self, func, tasks, shared):
+        """
+        Calls func(task, \\*\\*shared) for each task of one chunk. The default runs the
+        tasks one after another in the calling process.
+        """
+        return [func(x, **shared) for x in tasks]
+
+
+class SerialExecutor(Executor):
+    """
+    Runs the tasks one after another in the calling process.
+    """
+    name = "serial"
+
+    def map(self, func, tasks, shared=None, chunk=None):
+        return super().map(func, tasks, shared=shared)
+
+
+class ThreadExecutor(Executor):
+    """
+    Runs the tasks in a thread pool. The shared inputs are not copied, and the tasks run
+    concurrently wherever numpy releases the GIL.
+
+    Parameters
+    ----------
+    n_workers: int or None
+        The number of threads. None will use the concurrent.futures default.
+    """
+    name = "thread"
+    parallel = True
+
+    def __init__(self, n_workers=None):
+        self.n_workers = n_workers
+
+    def _map(self, func, tasks, shared):
+        with ThreadPoolExecutor(max_workers=self.n_workers) as pool:
+            return list(pool.map(partial(func, **shared), tasks))
+
+
+class DaskExecutor(Executor):
+    """
+    Runs the tasks as a dask bag using the current dask scheduler. Note that the shared
+    inputs are serialized with every task partition when a multiprocessing scheduler is used.
+    """
+    name = "dask"
+    parallel = True
+
+    def _map(self, func, tasks, shared):
+        return db.from_sequence(tasks).map(partial(func, **shared)).compute()
+
+
+class ProcessExecutor(Executor):
+    """
+    Runs the tasks in a process pool. The shared arrays are copied into shared memory
+    once per map call and attached by each worker process, so that only the tasks and
+    their results are serialized. The shared memory and the pool are reused by all of
+    the chunks of a map call.
+
+    Parameters
+    ----------
+    n_workers: int or None
+        The number of worker processes. None will use the number of processors.
+    """
+    name = "process"
+    parallel = True
+
+    def __init__(self, n_workers=None):
+        self.n_workers = n_workers
+
+    def map(self, func, tasks, shared=None, chunk=None):
+        if shared is None:
+            shared = {}
+        memory = []
+        specs = {}
+        try:
+            for key, value in shared.items():
+                if isinstance(value, np.ndarray) and value.dtype != object and value.nbytes > 0:
+                    shm = shared_memory.SharedMemory(create=True, size=value.nbytes)
+                    memory.append(shm)
+                    np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)[...] = value
+                    specs[key] = _SharedArray(shm.name, value.shape, value.dtype.str)
+                else:
+                    specs[key] = value
+            with ProcessPoolExecutor(max_workers=self.n_workers, initializer=_attach_shared,
+                                     initargs=(specs,)) as pool:
+                return _map_in_chunks(
+                    lambda x: list(pool.map(partial(_call_with_shared, func), x)), list(tasks), chunk)
+        finally:
+            for shm in memory:
+                shm.close()
+                shm.unlink()
+
+
+def get_executor(parallel=True):
+    """
+    Returns the executor of the column loops.
+
+    Parameters
+    ----------
+    parallel: bool, str or Executor
+        If False, run the loops serially. If True, use dask (the default of EMC^2).
+        If a str, the name of the backend ('serial', 'thread', 'dask', or 'process').
+        An Executor instance (e.g., ProcessExecutor(n_workers=4)) is returned as is.
+
+    Returns
+    -------
+    executor: Executor
+        The executor.
+    """
+    if isinstance(parallel, Executor):
+        return parallel
+    if isinstance(parallel, str):
+        executors = {x.name: x for x in [SerialExecutor, ThreadExecutor, DaskExecutor, ProcessExecutor]}
+        if parallel not in executors.keys():
+            raise ValueError("Unknown executor %s. Available executors are %s" %
+                             (parallel, list(executors.keys())))
+        return executors[parallel]()
+    if parallel:
+        return DaskExecutor()
+    return SerialExecutor()
+
+
+def get_block_size(n_items, item_nbytes, executor=None, max_nbytes=2**25, tasks_per_worker=4):
+    """
+    Returns the number of items (e.g., time columns or cells) to process in one task.
+
+    The block size is limited such that the working set of a block (item_nbytes per item)
+    is at most max_nbytes, and the blocks of all workers take up at most half of the available
+    memory. For a parallel executor, the block size is further limited such that each worker
+    gets about tasks_per_worker tasks to balance the load.
+
+    Parameters
+    ----------
+    n_items: int
+        The number of items.
+    item_nbytes: int
+        The working set of one item in bytes.
+    executor: Executor or None
+        The executor of the tasks. None will assume serial processing.
+    max_nbytes: int
+        The maximum working set of a block in bytes.
+    tasks_per_worker: int
+        The number of tasks per worker of a parallel executor.
+
+    Returns
+    -------
+    block_size: int
+        The number of items in one block.
+    """
+    n_workers = 1 if executor is None else executor.num_workers()
+    max_nbytes = min(max_nbytes, _get_available_memory() // (2 * n_workers))
+    block_size = max_nbytes // max(int(item_nbytes), 1)
+    if n_workers > 1:
+        block_size = min(block_size, -(-n_items // (tasks_per_worker * n_workers)))
+    return int(max(min(block_size, n_items), 1))
+
+
+def _get_available_memory():
+    if PSUTIL_AVAILABLE:
+        return psutil.virtual_memory().available
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return np.iinfo(np.int64).max
+
+
+def _map_in_chunks(map_func, tasks, chunk):
+    if chunk is None or chunk >= len(tasks):
+        return map_func(tasks)
+
+    results = []
+    for j in range(0, len(tasks), chunk):
+        ind_max = min(j + chunk, len(tasks))
+        print("Processing tasks %d-%d out of %d" % (j, ind_max, len(tasks)))
+        results += map_func(tasks[j:ind_max])
+    return results
+
+
+def _attach_shared(specs):
+    _worker_shared.clear()
+    for key, value in specs.items():
+        if isinstance(value, _SharedArray):
+            shm = _attach_shared_memory(value.name)
+            _worker_memory.append(shm)
+            array = np.ndarray(value.shape, dtype=np.dtype(value.dtype), buffer=shm.buf)
+            array.flags.writeable = False
+            _worker_shared[key] = array
+        else:
+            _worker_shared[key] = value
+
+
+def _attach_shared_memory(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # The creating process owns (and unlinks) the block, so it must not be registered with
+    # the resource tracker by the workers that attach to it.
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _call_with_shared(func, task):
+    return func(task, **_worker_shared)
@@ -1,11 +1,12 @@
 import xarray as xr
 import numpy as np
-import dask.bag as db
 from time import time
-from scipy.interpolate import LinearNDInterpolator
 
 from .attenuation import calc_theory_beta_m
-from .psd import calc_mu_lambda
+from .psd import calc_mu_lambda, interp_psd_integral_table
+from .psd import _get_psd_integral_table, _get_bulk_mu_lambda_interpolator
+from .executor import get_executor, get_block_size
+from .subcolumn import get_active_cells, _scatter_cells
 from ..core.instrument import ureg, quantity
 
 
@@ -59,10 +60,10 @@ def calc_total_alpha_beta(model, OD_from_sfc=True, eta=1):
     model.ds["sub_col_OD_tot"].attrs["long_name"] = \
         "Total cumulative optical depth at %s (convective + stratiform)" % OD_str
     model.ds["sub_col_OD_tot"].attrs["units"] = "1"
-    beta_m = np.tile(model.ds['sigma_180_vol'].values, (model.num_subcolumns, 1, 1))
-    T = np.tile(model.ds['tau'].values, (model.num_subcolumns, 1, 1))
-    model.ds['sub_col_beta_att_tot'] = (beta_m + model.ds['sub_col_beta_p_tot']) * \
-        T * np.exp(-2 * eta * model.ds['sub_col_OD_tot'])
+    beta_m = model.ds['sigma_180_vol'].values[np.newaxis, :, :]
+    T = model.ds['tau'].values[np.newaxis, :, :]
+    model.ds['sub_col_beta_att_tot'] = ((beta_m + model.ds['sub_col_beta_p_tot']) *
+                                        T * np.exp(-2 * eta * model.ds['sub_col_OD_tot'])).astype(model.precision)
     model.ds["sub_col_beta_att_tot"].attrs["long_name"] = \
         "Total attenuated backscatter coefficient (convective + stratiform)"
     model.ds["sub_col_beta_att_tot"].attrs["units"] = r"$m^{-1} sr^{-1}$"
@@ -181,18 +182,20 @@ def accumulate_OD(model, is_conv, z_values, hyd_type, OD_from_sfc=True, **kwargs
         cloud_str = "strat"
 
     Dims = model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)].shape
+    alpha_p = model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)].values
+    layer_OD = np.zeros(Dims, dtype='float64')
     if OD_from_sfc:
-        dz = np.tile(np.diff(z_values, axis=1, prepend=0.), (model.num_subcolumns, 1, 1))
-        model.ds["sub_col_OD_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(np.cumsum(
-            dz * np.concatenate((np.zeros(Dims[:2] + (1,)),
-                                 model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)][:, :, :-1]), axis=2),
-            axis=2), dims=model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)].dims)
+        dz = np.diff(z_values, axis=1, prepend=0.)
+        layer_OD[:, :, 1:] = alpha_p[:, :, :-1]
+        layer_OD *= dz[np.newaxis, :, :]
+        np.cumsum(layer_OD, axis=2, out=layer_OD)
     else:
-        dz = np.tile(np.diff(z_values, axis=1, append=0.), (model.num_subcolumns, 1, 1))
-        model.ds["sub_col_OD_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(np.flip(np.cumsum(
-            np.flip(dz * np.concatenate((model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)][:, :, 1:],
-                                         np.zeros(Dims[:2] + (1,))), axis=2), axis=2), axis=2), axis=2),
-            dims=model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)].dims)
+        dz = np.diff(z_values, axis=1, append=0.)
+        layer_OD[:, :, :-1] = alpha_p[:, :, 1:]
+        layer_OD *= dz[np.newaxis, :, :]
+        np.cumsum(layer_OD[:, :, ::-1], axis=2, out=layer_OD[:, :, ::-1])
+    model.ds["sub_col_OD_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
+        layer_OD.astype(model.precision, copy=False), dims=model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)].dims)
 
     return model
 
@@ -238,33 +241,34 @@ def calc_lidar_empirical(instrument, model, is_conv, p_values, t_values, z_value
 
     Dims = model.ds["%s_q_subcolumns_cl" % cloud_str].shape
     model.ds['sub_col_beta_p_tot_%s' % cloud_str] = xr.DataArray(
-        np.zeros(Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        np.zeros(Dims, dtype=model.precision), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
     model.ds['sub_col_alpha_p_tot_%s' % cloud_str] = xr.DataArray(
-        np.zeros(Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        np.zeros(Dims, dtype=model.precision), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
     model.ds['sub_col_OD_tot_%s' % cloud_str] = xr.DataArray(
-        np.zeros(Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        np.zeros(Dims, dtype=model.precision), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
 
     for hyd_type in hyd_types:
-        WC = model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)] * p_values / \
-            (instrument.R_d * (t_values + 273.15))
+        cells = get_active_cells(model, hyd_type, is_conv)
+        col_cells = cells % (Dims[1] * Dims[2])
+        t_cells = t_values.ravel()[col_cells]
+        WC = model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)].values.ravel()[cells] * \
+            p_values.ravel()[col_cells] / (instrument.R_d * (t_cells + 273.15))
         if is_conv:
             empr_array = model.ds[model.conv_re_fields[hyd_type]].values
 
         else:
             empr_array = model.ds[model.strat_re_fields[hyd_type]].values
         if hyd_type == "cl" or hyd_type == "pl":
-            model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
-                (3 * WC) / (2 * model.Rho_hyd[hyd_type] * 1e-6 *
-                            np.tile(empr_array, (model.num_subcolumns, 1, 1))),
-                dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+            alpha_cells = (3 * WC) / (2 * model.Rho_hyd[hyd_type].magnitude * 1e-6 *
+                                      empr_array.ravel()[col_cells])
         else:
             # Heymsfield et al. (2014)
-            a = 0.00532 * (t_values + 90) ** 2.55
-            b = 1.31 * np.exp(0.0047 * t_values)
-            a = np.tile(a, (model.num_subcolumns, 1, 1))
-            b = np.tile(b, (model.num_subcolumns, 1, 1))
-            model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
-                (WC / a) ** (1 / b), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+            a = 0.00532 * (t_cells + 90) ** 2.55
+            b = 1.31 * np.exp(0.0047 * t_cells)
+            alpha_cells = (WC / a) ** (1 / b)
+        model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
+            _scatter_cells(alpha_cells, cells, Dims, dtype=model.precision),
+            dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
 
         model.ds["sub_col_beta_p_%s_%s" % (hyd_type, cloud_str)] = \
             model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)] / \
@@ -331,8 +335,6 @@ def calc_lidar_bulk(instrument, model, is_conv, p_values, z_values, OD_from_sfc=
         cloud_str = "strat"
         re_fields = model.strat_re_fields
 
-    n_subcolumns = model.num_subcolumns
-
     if model.model_name in ["E3SM", "CESM2"]:
         bulk_ice_lut = "CESM_ice"
         bulk_mie_ice_lut = "mie_ice_CESM_PSD"
@@ -344,37 +346,39 @@ def calc_lidar_bulk(instrument, model, is_conv, p_values, z_values, OD_from_sfc=
 
     Dims = model.ds["%s_q_subcolumns_cl" % cloud_str].shape
     model.ds['sub_col_beta_p_tot_%s' % cloud_str] = xr.DataArray(
-        np.zeros(Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        np.zeros(Dims, dtype=model.precision), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
     model.ds['sub_col_alpha_p_tot_%s' % cloud_str] = xr.DataArray(
-        np.zeros(Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        np.zeros(Dims, dtype=model.precision), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
     model.ds['sub_col_OD_tot_%s' % cloud_str] = xr.DataArray(
-        np.zeros(Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        np.zeros(Dims, dtype=model.precision), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
 
-    rhoa_dz = np.tile(np.abs(np.diff(p_values, axis=1, append=0.)) / instrument.g,
-                      (model.num_subcolumns, 1, 1))
-    dz = np.tile(np.diff(z_values, axis=1, append=0.), (model.num_subcolumns, 1, 1))
+    rhoa_dz = np.abs(np.diff(p_values, axis=1, append=0.)) / instrument.g
+    dz = np.diff(z_values, axis=1, append=0.)
     for hyd_type in hyd_types:
+        # Only the cells with the hydrometeor are calculated (grid-mean fields are indexed by column cell)
+        cells = get_active_cells(model, hyd_type, is_conv)
+        col_cells = cells % (Dims[1] * Dims[2])
         if hyd_type[-1] == 'l':
-            rho_b = model.Rho_hyd[hyd_type]  # bulk water
-            re_array = np.tile(model.ds[re_fields[hyd_type]], (model.num_subcolumns, 1, 1))
+            rho_b = model.Rho_hyd[hyd_type].magnitude  # bulk water
+            re_cells = model.ds[re_fields[hyd_type]].values.ravel()[col_cells]
             if model.lambda_field is not None:  # assuming my and lambda can be provided only for liq hydrometeors
                 if not model.lambda_field[hyd_type] is None:
                     lambda_array = model.ds[model.lambda_field[hyd_type]].values
                     mu_array = model.ds[model.mu_field[hyd_type]].values
         else:
-            rho_b = instrument.rho_i  # bulk ice
+            rho_b = instrument.rho_i.magnitude  # bulk ice
             rho_hyd = model.Rho_hyd[hyd_type]
             if rho_hyd == 'variable':
                 rho_hyd = model.ds[model.variable_density[hyd_type]].values
+            else:
+                rho_hyd = rho_hyd.magnitude
             fi_factor = model.fluffy[hyd_type].magnitude * rho_hyd / rho_b + \
                 (1 - model.fluffy[hyd_type].magnitude) * (rho_hyd / rho_b) ** (1 / 3)
-            re_array = np.tile(model.ds[re_fields[hyd_type]] * fi_factor,
-                               (model.num_subcolumns, 1, 1))
+            re_cells = (model.ds[re_fields[hyd_type]].values * fi_factor).ravel()[col_cells]
 
-        tau_hyd = np.where(model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)] > 0,
-                           3 * model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)] * rhoa_dz /
-                           (2 * rho_b * re_array * 1e-6), 0)
-        A_hyd = tau_hyd / (2 * dz)  # model assumes geometric scatterers
+        q_cells = model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)].values.ravel()[cells]
+        tau_hyd = 3 * q_cells * rhoa_dz.ravel()[col_cells] / (2 * rho_b * re_cells * 1e-6)
+        A_hyd = tau_hyd / (2 * dz.ravel()[col_cells])  # model assumes geometric scatterers
 
         if np.isin(hyd_type, optional_ice_classes):
             if mie_for_ice:
@@ -386,47 +390,38 @@ def calc_lidar_bulk(instrument, model, is_conv, p_values, z_values, OD_from_sfc=
                 Qback_bulk = instrument.bulk_table[bulk_ice_lut]["Q_back"].values
                 Qext_bulk = instrument.bulk_table[bulk_ice_lut]["Q_ext"].values
         else:
-            if model.model_name in ["E3SM", "CESM2"]:
-                mu_b = np.tile(instrument.bulk_table[bulk_liq_lut]["mu"].values,
-                               (instrument.bulk_table[bulk_liq_lut]["lambdas"].size)).flatten()
-                lambda_b = instrument.bulk_table[bulk_liq_lut]["lambda"].values.flatten()
-            else:
+            if model.model_name not in ["E3SM", "CESM2"]:
                 r_eff_bulk = instrument.bulk_table[bulk_liq_lut]["r_e"].values
             Qback_bulk = instrument.bulk_table[bulk_liq_lut]["Q_back"].values
             Qext_bulk = instrument.bulk_table[bulk_liq_lut]["Q_ext"].values
 
         if np.logical_and(np.isin(hyd_type, ["cl", "pl"]), model.model_name in ["E3SM", "CESM2"]):
-            print("2-D interpolation of bulk liq lidar backscattering using mu-lambda values")
+            print("2-D interpolation of bulk liq lidar backscattering and extinction using mu-lambda values")
             rel_locs = model.ds[model.q_names_stratiform[hyd_type]].values > 0.
-            back_tmp = np.ones_like(model.ds[model.q_names_stratiform[hyd_type]].values, dtype=float) * np.nan
+            back_tmp = np.full(model.ds[model.q_names_stratiform[hyd_type]].shape, np.nan)
             ext_tmp = np.copy(back_tmp)
-            interpolator = LinearNDInterpolator(np.stack((mu_b, lambda_b), axis=1), Qback_bulk.flatten())
-            interp_vals = interpolator(mu_array[rel_locs], lambda_array[rel_locs])
-            np.place(back_tmp, rel_locs, interp_vals)
-            print("2-D interpolation of bulk liq lidar extinction using mu-lambda values")
-            interpolator = LinearNDInterpolator(np.stack((mu_b, lambda_b), axis=1), Qext_bulk.flatten())
+            interpolator = _get_bulk_mu_lambda_interpolator(instrument, bulk_liq_lut)
             interp_vals = interpolator(mu_array[rel_locs], lambda_array[rel_locs])
-            np.place(ext_tmp, rel_locs, interp_vals)
-            model.ds["sub_col_beta_p_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
-                np.tile(back_tmp, (n_subcolumns, 1, 1)) * A_hyd,
-                dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims).fillna(0)
-            model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
-                np.tile(ext_tmp, (n_subcolumns, 1, 1)) * A_hyd,
-                dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims).fillna(0)
+            back_tmp[rel_locs] = interp_vals[:, 0]
+            ext_tmp[rel_locs] = interp_vals[:, 1]
+            beta_cells = back_tmp.ravel()[col_cells] * A_hyd
+            alpha_cells = ext_tmp.ravel()[col_cells] * A_hyd
         else:
-            model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
-                np.interp(re_array, r_eff_bulk, Qext_bulk) * A_hyd,
-                dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims).fillna(0)
-            model.ds["sub_col_beta_p_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
-                np.interp(re_array, r_eff_bulk, Qback_bulk) * A_hyd,
-                dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims).fillna(0)
+            Qback_cells = np.interp(re_cells, r_eff_bulk, Qback_bulk)
+            Qext_cells = np.interp(re_cells, r_eff_bulk, Qext_bulk)
+            alpha_cells = Qext_cells * A_hyd
+            beta_cells = Qback_cells * A_hyd
+        alpha_cells = np.where(np.isnan(alpha_cells), 0, alpha_cells).astype(model.precision)
+        beta_cells = np.where(np.isnan(beta_cells), 0, beta_cells).astype(model.precision)
+        model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
+            _scatter_cells(alpha_cells, cells, Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        model.ds["sub_col_beta_p_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
+            _scatter_cells(beta_cells, cells, Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
 
         model = accumulate_OD(model, is_conv, z_values, hyd_type, OD_from_sfc, **kwargs)
 
-        model.ds["sub_col_beta_p_tot_%s" % cloud_str] += \
-            model.ds["sub_col_beta_p_%s_%s" % (hyd_type, cloud_str)].fillna(0)
-        model.ds["sub_col_alpha_p_tot_%s" % cloud_str] += \
-            model.ds["sub_col_alpha_p_%s_%s" % (hyd_type, cloud_str)].fillna(0)
+        model.ds["sub_col_beta_p_tot_%s" % cloud_str].values.ravel()[cells] += beta_cells
+        model.ds["sub_col_alpha_p_tot_%s" % cloud_str].values.ravel()[cells] += alpha_cells
         model.ds["sub_col_OD_tot_%s" % cloud_str] += \
             model.ds["sub_col_OD_%s_%s" % (hyd_type, cloud_str)].fillna(0)
 
@@ -434,7 +429,8 @@ def calc_lidar_bulk(instrument, model, is_conv, p_values, z_values, OD_from_sfc=
 
 
 def calc_lidar_micro(instrument, model, z_values, OD_from_sfc=True,
-                     hyd_types=None, mie_for_ice=False, parallel=True, chunk=None, **kwargs):
+                     hyd_types=None, mie_for_ice=False, parallel=True, chunk=None,
+                     block_size=None, use_psd_tables=False, psd_table_rtol=1e-3, **kwargs):
     """
     Calculates the lidar backscatter, extinction, and optical depth
     in a given column for the given lidar using the microphysics (MG2) logic.
@@ -454,13 +450,25 @@ def calc_lidar_micro(instrument, model, z_values, OD_from_sfc=True,
     mie_for_ice: bool
         If True, using full mie caculation LUTs. Otherwise, currently using the C6
         scattering LUTs for 8-column severly roughned aggregate.
-    parallel: bool
-        If True, use parallelism in calculating lidar parameters.
+    parallel: bool, str or :py:class:`emc2.simulator.executor.Executor`
+        The executor of the column loop (see :py:func:`emc2.simulator.executor.get_executor`).
+        If True, use dask. If False, process the columns serially.
     chunk: int or None
-        The number of entries to process in one parallel loop. None will send all of
-        the entries to the Dask worker queue at once. Sometimes, Dask will freeze if
-        too many tasks are sent at once due to memory issues, so adjusting this number
-        might be needed if that happens.
+        The number of cell blocks (see block_size) to send to the executor at once. None
+        will send all of the blocks at once.
+    block_size: int or None
+        The number of (subcolumn, time, height) cells for which the PSD and the
+        backscatter and extinction integrals are evaluated together (each block is a
+        parallel task when parallel is True). None will tune the block size from the number
+        of cells and the number of workers, such that a block's N(D) array takes up at most
+        4 MB.
+    use_psd_tables: bool
+        If True, the PSD integrals are interpolated from (mu, lambda) lookup tables
+        that are calculated once per scattering LUT and cached in the instrument
+        (see :py:func:`emc2.simulator.psd.calc_psd_integral_table`) instead of
+        integrating the PSD in each cell. Cells outside of the tables are integrated.
+    psd_table_rtol: float
+        The relative error tolerance of the PSD integral lookup tables.
     Additonal keyword arguments are passed into
     :py:func:`emc2.psd.calc_mu_lambda`.
     :py:func:`emc2.simulator.lidar_moments.accumulate_OD`.
@@ -487,21 +495,20 @@ def calc_lidar_micro(instrument, model, z_values, OD_from_sfc=True,
         print("Generating stratiform lidar variables for hydrometeor class %s" % hyd_type)
         if not np.isin("sub_col_beta_p_tot_strat", [x for x in model.ds.keys()]):
             model.ds["sub_col_beta_p_tot_strat"] = xr.DataArray(
-                np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+                np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
             model.ds["sub_col_alpha_p_tot_strat"] = xr.DataArray(
-                np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+                np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
             model.ds["sub_col_OD_tot_strat"] = xr.DataArray(
-                np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+                np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
         model.ds["sub_col_beta_p_%s_strat" % hyd_type] = xr.DataArray(
-            np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+            np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
         model.ds["sub_col_alpha_p_%s_strat" % hyd_type] = xr.DataArray(
-            np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+            np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
         fits_ds = calc_mu_lambda(model, hyd_type, subcolumns=True, **kwargs).ds
         N_columns = len(model.ds["subcolumn"])
         total_hydrometeor = np.round(model.ds[frac_names].values * N_columns).astype(int)
         N_0 = fits_ds["N_0"].values
         mu = fits_ds["mu"].values
-        num_subcolumns = model.num_subcolumns
         if np.isin(hyd_type, optional_ice_classes):
             if mie_for_ice:
                 if hyd_type == "ci":
@@ -511,39 +518,27 @@ def calc_lidar_micro(instrument, model, z_values, OD_from_sfc=True,
                 p_diam = instrument.mie_table[hyd_type_2_use]["p_diam"].values
                 beta_p = instrument.mie_table[hyd_type_2_use]["beta_p"].values
                 alpha_p = instrument.mie_table[hyd_type_2_use]["alpha_p"].values
+                lut_name = "mie_%s" % hyd_type_2_use
             else:
                 p_diam = instrument.scat_table[ice_lut][ice_diam_var].values
                 beta_p = instrument.scat_table[ice_lut]["beta_p"].values
                 alpha_p = instrument.scat_table[ice_lut]["alpha_p"].values
+                lut_name = ice_lut
         else:  # Liquid classes (assuming only cl and pl)
             p_diam = instrument.mie_table[hyd_type]["p_diam"].values
             beta_p = instrument.mie_table[hyd_type]["beta_p"].values
             alpha_p = instrument.mie_table[hyd_type]["alpha_p"].values
+            lut_name = "mie_%s" % hyd_type
         lambdas = fits_ds["lambda"].values
-        _calc_lidar = lambda x: _calc_strat_lidar_properties(
-            x, N_0, lambdas, mu, p_diam, total_hydrometeor, hyd_type, num_subcolumns, p_diam,
-            beta_p, alpha_p)
-        if parallel:
+        psd_table = None
+        if use_psd_tables:
+            psd_table = _get_psd_integral_table(
+                instrument, lut_name, p_diam, beta_p, alpha_p, None, mu, lambdas, rtol=psd_table_rtol)
+        if get_executor(parallel).parallel:
             print("Doing parallel lidar calculations for %s" % hyd_type)
-            if chunk is None:
-                tt_bag = db.from_sequence(np.arange(0, Dims[1], 1))
-                lists = tt_bag.map(_calc_lidar).compute()
-            else:
-                lists = []
-                j = 0
-                while j < Dims[1]:
-                    if j + chunk >= Dims[1]:
-                        ind_max = Dims[1]
-                    else:
-                        ind_max = j + chunk
-                    print(" Processing columns %d-%d out of %d" % (j, ind_max, Dims[1]))
-                    tt_bag = db.from_sequence(np.arange(j, ind_max, 1))
-                    lists += tt_bag.map(_calc_lidar).compute()
-                    j += chunk
-        else:
-            lists = [x for x in map(_calc_lidar, np.arange(0, Dims[1], 1))]
-        beta_p_strat = np.stack([x[0] for x in lists], axis=1)
-        alpha_p_strat = np.stack([x[1] for x in lists], axis=1)
+        beta_p_strat, alpha_p_strat = _calc_lidar_micro_batched(
+            N_0, lambdas, mu, total_hydrometeor, p_diam, beta_p, alpha_p, block_size=block_size,
+            parallel=parallel, chunk=chunk, psd_table=psd_table, cells=get_active_cells(model, hyd_type, False))
 
         model.ds["sub_col_beta_p_%s_strat" % hyd_type][:, :, :] = beta_p_strat
         model.ds["sub_col_alpha_p_%s_strat" % hyd_type][:, :, :] = alpha_p_strat
@@ -589,15 +584,14 @@ def calc_lidar_moments(instrument, model, is_conv,
         If True, then calculate optical depth from the surface.
     hyd_types: list or None
         list of hydrometeor names to include in calcuation. using default Model subclass types if None.
-    parallel: bool
-        If True, use parallelism in calculating lidar parameters.
+    parallel: bool, str or :py:class:`emc2.simulator.executor.Executor`
+        The executor of the column loop (see :py:func:`emc2.simulator.executor.get_executor`).
+        If True, use dask. If False, process the columns serially.
     eta: float
         Multiple scattering coefficient.
     chunk: int or None
-        The number of entries to process in one parallel loop. None will send all of
-        the entries to the Dask worker queue at once. Sometimes, Dask will freeze if
-        too many tasks are sent at once due to memory issues, so adjusting this number
-        might be needed if that happens.
+        The number of cell blocks of the microphysics logic sent to the executor at once
+        (see :py:func:`calc_lidar_micro`). None will send all of the blocks at once.
     mie_for_ice: bool
         If True, using full mie caculation LUTs. Otherwise, currently using the C6
         scattering LUTs for 8-column severly roughned aggregate.
@@ -672,8 +666,8 @@ def calc_lidar_moments(instrument, model, is_conv,
     del p_temp, t_temp, z_temp
 
     model = calc_theory_beta_m(model, instrument.wavelength)
-    beta_m = np.tile(model.ds['sigma_180_vol'].values, (model.num_subcolumns, 1, 1))
-    T = np.tile(model.ds['tau'].values, (model.num_subcolumns, 1, 1))
+    beta_m = model.ds['sigma_180_vol'].values[np.newaxis, :, :]
+    T = model.ds['tau'].values[np.newaxis, :, :]
 
     t0 = time()
     if use_empiric_calc:
@@ -727,9 +721,9 @@ def calc_lidar_moments(instrument, model, is_conv,
     model.ds["sub_col_OD_tot_%s" % cloud_str].attrs["Processing method"] = method_str
     model.ds["sub_col_OD_tot_%s" % cloud_str].attrs["Ice scattering database"] = scat_str
 
-    model.ds["sub_col_beta_att_tot_%s" % cloud_str] = (
-        beta_m + model.ds["sub_col_beta_p_tot_%s" % cloud_str]) * \
-        T * np.exp(-2 * eta * model.ds["sub_col_OD_tot_%s" % cloud_str])
+    model.ds["sub_col_beta_att_tot_%s" % cloud_str] = ((
+        beta_m + model.ds["sub_col_beta_p_tot_%s" % cloud_str]) *
+        T * np.exp(-2 * eta * model.ds["sub_col_OD_tot_%s" % cloud_str])).astype(model.precision)
     model.ds["sub_col_beta_att_tot_%s" % cloud_str].attrs["long_name"] = \
         "Total attenuated backscatter from all %s hydrometeors (including atmospheric extinction)" % cloud_str_full
     model.ds["sub_col_beta_att_tot_%s" % cloud_str].attrs["units"] = r"$m^{-1} sr^{-1}$"
@@ -741,28 +735,107 @@ def calc_lidar_moments(instrument, model, is_conv,
     return model
 
 
-def _calc_strat_lidar_properties(tt, N_0, lambdas, mu, p_diam, total_hydrometeor,
-                                 hyd_type, num_subcolumns, D, beta_p, alpha_p):
-    Dims = total_hydrometeor.shape
-    beta_p_strat = np.zeros((num_subcolumns, Dims[2]))
-    alpha_p_strat = np.zeros((num_subcolumns, Dims[2]))
-
-    if tt % 50 == 0:
-        print('Stratiform moment for class %s progress: %d/%d' % (hyd_type, tt, Dims[1]))
-    for k in range(Dims[2]):
-        if np.all(total_hydrometeor[:, tt, k] == 0):
-            continue
-        N_D = []
-        for i in range(num_subcolumns):
-            N_0_tmp = N_0[i, tt, k]
-            lambda_tmp = lambdas[i, tt, k]
-            mu_temp = mu[i, tt, k]
-            N_D.append(N_0_tmp * p_diam ** mu_temp * np.exp(-lambda_tmp * p_diam))
-        N_D = np.stack(N_D, axis=0)
-
-        Calc_tmp = np.tile(beta_p, (num_subcolumns, 1)) * N_D
-        beta_p_strat[:, k] = np.trapz(Calc_tmp, x=D, axis=1).astype('float64')
-        Calc_tmp = np.tile(alpha_p, (num_subcolumns, 1)) * N_D
-        alpha_p_strat[:, k] = np.trapz(Calc_tmp, x=D, axis=1).astype('float64')
+def _calc_lidar_micro_block(N_0, lambdas, mu, p_diam, weights):
+    """
+    Evaluates the gamma PSD and the lidar backscatter and extinction integrals for a block
+    of cells. The PSD is evaluated once and both trapezoidal integrals are calculated
+    together as a matrix product with the quadrature weights.
+
+    Parameters
+    ----------
+    N_0, lambdas, mu: ndarray
+        1D arrays of the PSD intercept, slope, and dispersion in each cell.
+    p_diam: ndarray
+        The particle diameter grid of the scattering LUT.
+    weights: ndarray
+        The (p_diam, 2) array of the backscattering and extinction cross sections
+        multiplied by the trapezoidal quadrature weights of p_diam.
+
+    Returns
+    -------
+    integrals: ndarray
+        The (cell, 2) array of the backscatter and extinction integrals.
+    """
+    N_D = np.multiply.outer(-lambdas, p_diam)
+    np.exp(N_D, out=N_D)
+    if np.any(mu != 0):
+        N_D *= p_diam ** mu[:, np.newaxis]
+    N_D *= N_0[:, np.newaxis]
+
+    return N_D @ weights
+
+
+def _calc_lidar_micro_cell_block(edges, N_0_cells, lambda_cells, mu_cells, p_diam, weights):
+    j, ind_max = edges
+    return _calc_lidar_micro_block(
+        N_0_cells[j:ind_max], lambda_cells[j:ind_max], mu_cells[j:ind_max], p_diam, weights)
+
+
+def _calc_lidar_micro_batched(N_0, lambdas, mu, total_hydrometeor, p_diam, beta_p, alpha_p,
+                              block_size=None, parallel=True, chunk=None, psd_table=None, cells=None):
+    """
+    Calculates the lidar backscatter and extinction of a hydrometeor class for all
+    (subcolumn, time, height) cells by evaluating the PSD integrals in fixed-size blocks of cells.
+
+    Only cells with a valid PSD in (time, height) columns with the hydrometeor in any subcolumn
+    (total_hydrometeor) are evaluated;
+    all other cells are 0. If a PSD integral table is given, the integrals are interpolated
+    from it and only cells outside of the table are integrated. If the flat indices of the
+    cells with the hydrometeor are given (cells), only these cells are considered.
+
+    Returns
+    -------
+    beta_p_strat, alpha_p_strat: ndarray
+        Arrays with the shape of N_0.
+    """
+    Dims = N_0.shape
+    beta_p_strat = np.zeros(Dims)
+    alpha_p_strat = np.zeros(Dims)
+
+    in_column = np.any(total_hydrometeor != 0, axis=0)
+    if cells is None:
+        valid = np.logical_and(np.isfinite(N_0), np.isfinite(lambdas))
+        cells = np.flatnonzero(np.logical_and(np.broadcast_to(in_column, Dims), valid))
+    else:
+        cells = cells[in_column.ravel()[cells % in_column.size]]
+        cells = cells[np.logical_and(np.isfinite(N_0.ravel()[cells]), np.isfinite(lambdas.ravel()[cells]))]
+    N_0_cells = N_0.ravel()[cells]
+    lambda_cells = lambdas.ravel()[cells]
+    mu_cells = mu.ravel()[cells]
+
+    if psd_table is not None:
+        table_vals = interp_psd_integral_table(psd_table, N_0_cells, lambda_cells, mu_cells)
+        beta_p_strat.ravel()[cells] = table_vals[0]
+        alpha_p_strat.ravel()[cells] = table_vals[3]
+        outside = ~np.isfinite(table_vals[0])
+        cells = cells[outside]
+        N_0_cells = N_0_cells[outside]
+        lambda_cells = lambda_cells[outside]
+        mu_cells = mu_cells[outside]
+        del table_vals
+
+    # Trapezoidal quadrature weights of the backscatter and extinction integrals
+    dD = np.diff(p_diam) / 2
+    weights = np.zeros((p_diam.size, 2))
+    weights[:-1] += dD[:, np.newaxis]
+    weights[1:] += dD[:, np.newaxis]
+    weights *= np.stack([beta_p, alpha_p], axis=1)
+
+    executor = get_executor(parallel)
+    if block_size is None:
+        # Small blocks keep the N(D) array of a block in the CPU cache
+        block_size = get_block_size(N_0_cells.size, 8 * p_diam.size, executor, max_nbytes=2**22)
+    block_edges = [(i, min(i + block_size, N_0_cells.size))
+                   for i in range(0, N_0_cells.size, block_size)]
+    if len(block_edges) <= 1:
+        executor = get_executor(False)
+    my_tuple = executor.map(_calc_lidar_micro_cell_block, block_edges, shared=dict(
+        N_0_cells=N_0_cells, lambda_cells=lambda_cells, mu_cells=mu_cells, p_diam=p_diam,
+        weights=weights), chunk=chunk)
+
+    if len(my_tuple) > 0:
+        integrals = np.concatenate(my_tuple, axis=0)
+        beta_p_strat.ravel()[cells] = integrals[:, 0]
+        alpha_p_strat.ravel()[cells] = integrals[:, 1]
 
     return beta_p_strat, alpha_p_strat
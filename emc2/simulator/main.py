@@ -1,4 +1,7 @@
+import copy
+import os
 import numpy as np
+import xarray as xr
 from .subcolumn import set_convective_sub_col_frac, set_precip_sub_col_frac
 from .subcolumn import set_stratiform_sub_col_frac, set_q_n
 from .lidar_moments import calc_lidar_moments, calc_LDR_and_ext, calc_total_alpha_beta
@@ -6,11 +9,12 @@ from .radar_moments import calc_radar_moments, calc_total_reflectivity
 from .attenuation import calc_radar_Ze_min
 from .classification import lidar_classify_phase, lidar_emulate_cosp_phase, radar_classify_phase
 from .psd import calc_re_thompson
+from ..io import write_chunked_netcdf
 
 
 def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack_dims=False,
                         calc_re=False, skip_subcol_gen=False, finalize_fields=False, 
-                        **kwargs):
+                        time_block_size=None, out_file=None, **kwargs):
     """
     This procedure will make all of the subcolumns and simulated data for each model column.
 
@@ -46,6 +50,43 @@ def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack
     finalize_fields: bool
         True - set absolute 0 values in"sub_col"-containing fields to np.nan enabling analysis
         and visualization.
+    time_block_size: int or None
+        If not None, process the model in blocks of this number of time steps. The output of
+        each block is written to disk (see out_file) before the next block is processed, such
+        that the peak memory usage is bounded by the block size rather than the record length.
+        The subcolumn output fields in the returned model are then lazily loaded from the written
+        files.
+    out_file: str or None
+        The name of the output file when processing in time blocks. The output of each block is
+        appended to this chunked and compressed netCDF4 file (see
+        :py:func:`emc2.io.write_chunked_netcdf`). An existing file is overwritten.
+    seed: int or None
+        Keyword argument. The seed of the subcolumn generator. If an int, each time column
+        uses an independent random number generator derived from the seed and the column index,
+        so that the subcolumns are reproducible regardless of parallel or chunk. If None
+        (default), the global numpy random state is used.
+    parallel: bool, str or :py:class:`emc2.simulator.executor.Executor`
+        Keyword argument. The executor of the column loops of the subcolumn generator and the
+        microphysics forward models (see :py:func:`emc2.simulator.executor.get_executor`).
+        True (default) uses dask, False runs the loops serially, and 'thread' or 'process' use a
+        thread pool or a process pool with the shared inputs in shared memory, respectively.
+    batched_precip: bool
+        Keyword argument. If True (default), use the batched precipitation subcolumn allocator
+        (see :func:`emc2.simulator.subcolumn.set_precip_sub_col_frac`).
+    chunk: int or None
+        Keyword argument. The number of time columns processed together in one block by the
+        subcolumn generator. None (default) tunes the block size from the array sizes, the
+        available memory, and the number of workers.
+    cell_chunk: int or None
+        Keyword argument. The number of (subcolumn, time, height) cell blocks of the
+        microphysics forward models sent to the executor at once (the chunk argument of
+        :func:`emc2.simulator.calc_radar_moments` and :func:`emc2.simulator.calc_lidar_moments`).
+        None sends all of the blocks at once. If not given, chunk is used, such that setting
+        chunk alone still limits the number of forward model tasks sent at once.
+    precision: str or None
+        Keyword argument. The floating point precision of the model and subcolumn fields
+        ('float64' or 'float32'; see :py:meth:`emc2.core.Model.set_precision`). If None
+        (default), the current precision of the model is used.
     Additional keyword arguments are passed into :func:`emc2.simulator.calc_lidar_moments` or
     :func:`emc2.simulator.calc_radar_moments`
 
@@ -54,6 +95,12 @@ def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack
     model: :func:`emc2.core.Model`
         The model with all of the simulated parameters generated.
     """
+    if time_block_size is not None:
+        return _make_simulated_data_in_time_blocks(
+            model, instrument, N_columns, time_block_size, out_file, do_classify=do_classify,
+            unstack_dims=unstack_dims, calc_re=calc_re, skip_subcol_gen=skip_subcol_gen,
+            finalize_fields=finalize_fields, **kwargs)
+
     print("## Creating subcolumns...")
     hydrometeor_classes = model.conv_frac_names.keys()
 
@@ -81,6 +128,12 @@ def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack
     else:
         chunk = None
 
+    if 'cell_chunk' in kwargs.keys():
+        cell_chunk = kwargs['cell_chunk']
+        del kwargs['cell_chunk']
+    else:
+        cell_chunk = chunk
+
     if 'convert_zeros_to_nan' in kwargs.keys():
         convert_zeros_to_nan = kwargs['convert_zeros_to_nan']
         del kwargs['convert_zeros_to_nan']
@@ -114,6 +167,23 @@ def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack
     else:
         use_empiric_calc = False
 
+    if 'seed' in kwargs.keys():
+        seed = kwargs['seed']
+        del kwargs['seed']
+    else:
+        seed = None
+
+    if 'batched_precip' in kwargs.keys():
+        batched_precip = kwargs['batched_precip']
+        del kwargs['batched_precip']
+    else:
+        batched_precip = True
+
+    if 'precision' in kwargs.keys():
+        if kwargs['precision'] is not None:
+            model.set_precision(kwargs['precision'])
+        del kwargs['precision']
+
     if skip_subcol_gen:
         print('Skipping subcolumn generator (make sure subcolumns were already generated).')
     else:
@@ -127,7 +197,8 @@ def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack
 
         # Subcolumn Generator
         model = set_stratiform_sub_col_frac(
-            model, use_rad_logic=use_rad_logic, N_columns=N_columns, parallel=parallel, chunk=chunk)
+            model, use_rad_logic=use_rad_logic, N_columns=N_columns, parallel=parallel, chunk=chunk,
+            seed=seed)
         precip_types = list(hydrometeor_classes)
         if "cl" in precip_types:
             precip_types.remove("cl")
@@ -137,27 +208,32 @@ def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack
         
         model = set_precip_sub_col_frac(
                 model, is_conv=False, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk,
-                precip_types=precip_types)
+                precip_types=precip_types, batched=batched_precip, seed=seed)
         if model.process_conv:
             model = set_precip_sub_col_frac(
-                model, is_conv=True, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk)
+                model, is_conv=True, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk,
+                batched=batched_precip, seed=seed)
         for hyd_type in hydrometeor_classes:
             if hyd_type != 'cl':
                 model = set_q_n(
                     model, hyd_type, is_conv=False,
-                    qc_flag=False, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk)
+                    qc_flag=False, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk,
+                    seed=seed)
                 if model.process_conv:
                     model = set_q_n(
                         model, hyd_type, is_conv=True,
-                        qc_flag=False, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk)
+                        qc_flag=False, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk,
+                        seed=seed)
             else:
                 model = set_q_n(
                     model, hyd_type, is_conv=False,
-                    qc_flag=True, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk)
+                    qc_flag=True, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk,
+                    seed=seed)
                 if model.process_conv:
                     model = set_q_n(
                         model, hyd_type, is_conv=True,
-                        qc_flag=False, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk)
+                        qc_flag=False, use_rad_logic=use_rad_logic, parallel=parallel, chunk=chunk,
+                        seed=seed)
 
     # Calcualte r_eff if requested
     if np.logical_or(calc_re, model.model_name == "WRF"):
@@ -185,13 +261,13 @@ def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack
 
         model = calc_radar_moments(
             instrument, model, False, OD_from_sfc=OD_from_sfc, hyd_types=hyd_types,
-            parallel=parallel, chunk=chunk, mie_for_ice=mie_for_ice["strat"],
+            parallel=parallel, chunk=cell_chunk, mie_for_ice=mie_for_ice["strat"],
             use_rad_logic=use_rad_logic,
             use_empiric_calc=use_empiric_calc, **kwargs)
         if model.process_conv:
             model = calc_radar_moments(
                 instrument, model, True, OD_from_sfc=OD_from_sfc, hyd_types=hyd_types,
-                parallel=parallel, chunk=chunk, mie_for_ice=mie_for_ice["conv"],
+                parallel=parallel, chunk=cell_chunk, mie_for_ice=mie_for_ice["conv"],
                 use_rad_logic=use_rad_logic,
                 use_empiric_calc=use_empiric_calc, **kwargs)
 
@@ -218,13 +294,13 @@ def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack
             eta = instrument.eta
         model = calc_lidar_moments(
             instrument, model, False, OD_from_sfc=OD_from_sfc, hyd_types=hyd_types,
-            parallel=parallel, eta=eta, chunk=chunk,
+            parallel=parallel, eta=eta, chunk=cell_chunk,
             mie_for_ice=mie_for_ice["strat"], use_rad_logic=use_rad_logic,
             use_empiric_calc=use_empiric_calc, **kwargs)
         if model.process_conv:
             model = calc_lidar_moments(
                 instrument, model, True, OD_from_sfc=OD_from_sfc, hyd_types=hyd_types,
-                parallel=parallel, eta=eta, chunk=chunk,
+                parallel=parallel, eta=eta, chunk=cell_chunk,
                 mie_for_ice=mie_for_ice["conv"], use_rad_logic=use_rad_logic,
                 use_empiric_calc=use_empiric_calc, **kwargs)
         model = calc_total_alpha_beta(model, OD_from_sfc=OD_from_sfc, eta=eta)
@@ -247,3 +323,43 @@ def make_simulated_data(model, instrument, N_columns, do_classify=False, unstack
         print("Unstacking the %s dimension (time, lat, and lon dimensions)" % model.stacked_time_dim)
         model.unstack_time_lat_lon()
     return model
+
+
+def _make_simulated_data_in_time_blocks(model, instrument, N_columns, time_block_size, out_file,
+                                        unstack_dims=False, **kwargs):
+    """
+    Runs make_simulated_data over blocks of time steps, appending the output variables of
+    each block to a netCDF file before processing the next block.
+
+    Returns
+    -------
+    model: :func:`emc2.core.Model`
+        The model with the simulated parameters lazily loaded from the written files.
+    """
+    if out_file is None:
+        raise ValueError("An output file name (out_file) must be specified when processing in time blocks.")
+    if unstack_dims:
+        raise ValueError("The time, lat, and lon dimensions cannot be unstacked when processing in "
+                         "time blocks. Please unstack the dimensions after loading the output.")
+
+    full_ds = model.ds
+    t_dim = full_ds.sizes[model.time_dim]
+    if os.path.isfile(out_file):
+        os.remove(out_file)
+    for t_start in range(0, t_dim, time_block_size):
+        t_end = min(t_start + time_block_size, t_dim)
+        print("## Processing time steps %d-%d out of %d" % (t_start, t_end, t_dim))
+        block_model = copy.copy(model)
+        block_model.ds = full_ds.isel({model.time_dim: slice(t_start, t_end)})
+        block_model.time_offset = model.time_offset + t_start
+        block_model.active_cells = {}
+        in_vars = [x for x in block_model.ds.variables.keys() if x != model.time_dim]
+        block_model = make_simulated_data(block_model, instrument, N_columns, **kwargs)
+        write_chunked_netcdf(block_model.ds.drop_vars(in_vars), out_file, time_dim=model.time_dim,
+                             append=True, time_chunk=time_block_size)
+        del block_model
+
+    out_ds = xr.open_dataset(out_file, chunks={})
+    model.ds = xr.merge([full_ds.drop_vars([x for x in out_ds.variables if x in full_ds.variables],
+                                           errors="ignore"), out_ds])
+    return model
@@ -2,6 +2,7 @@ import xarray as xr
 import numpy as np
 
 from scipy.special import gamma
+from scipy.interpolate import LinearNDInterpolator, RegularGridInterpolator
 from ..core.instrument import ureg, quantity
 
 
@@ -121,9 +122,8 @@ def calc_mu_lambda(model, hyd_type="cl",
             frac_name = model.conv_frac_names[hyd_type]
 
     
-    frac_array = np.tile(
-        model.ds[frac_name].values, (model.num_subcolumns, 1, 1))
-    frac_array = np.where(frac_array == 0, 1, frac_array)
+    frac_array = model.ds[frac_name].values
+    frac_array = np.where(frac_array == 0, 1, frac_array)[np.newaxis, :, :]
     if model.Rho_hyd[hyd_type] == 'variable':    
         Rho_hyd = model.ds[model.variable_density[hyd_type]].values
     else:
@@ -140,13 +140,13 @@ def calc_mu_lambda(model, hyd_type="cl",
             mus = 1 / mus**2 - 1
             mus = np.where(mus < dispersion_mu_bounds[0], dispersion_mu_bounds[0], mus)
             mus = np.where(mus > dispersion_mu_bounds[1], dispersion_mu_bounds[1], mus)
-            column_ds["mu"] = xr.DataArray(mus, dims=column_ds[q_name].dims).astype('float64')
+            column_ds["mu"] = xr.DataArray(mus, dims=column_ds[q_name].dims).astype(model.precision)
         else:
             mus = 1 / 0.09 * np.ones_like(column_ds[N_name].values)
-            column_ds["mu"] = xr.DataArray(mus, dims=column_ds[q_name].dims).astype('float64')
+            column_ds["mu"] = xr.DataArray(mus, dims=column_ds[q_name].dims).astype(model.precision)
     else:
         column_ds["mu"] = xr.DataArray(
-            np.zeros_like(column_ds[q_name].values), dims=column_ds[q_name].dims).astype('float64')
+            np.zeros_like(column_ds[q_name].values), dims=column_ds[q_name].dims).astype(model.precision)
 
     column_ds["mu"].attrs["long_name"] = "Gamma fit dispersion"
     column_ds["mu"].attrs["units"] = "1"
@@ -162,17 +162,368 @@ def calc_mu_lambda(model, hyd_type="cl",
                       (column_ds[q_name].astype('float64') * gamma(column_ds["mu"] + 1.))) ** (1 / d)
 
     # Eventually need to make this unit aware, pint as a dependency?
-    column_ds["lambda"] = fit_lambda.where(column_ds[q_name] > 0).astype(float)
+    fit_lambda = fit_lambda.where(column_ds[q_name] > 0).astype(float)
+    column_ds["lambda"] = fit_lambda.astype(model.precision)
     column_ds["lambda"].attrs["long_name"] = "Slope of gamma distribution fit"
     column_ds["lambda"].attrs["units"] = r"$m^{-1}$"
+    # N_0 is always double precision (lambda ** (mu + 1) can overflow float32)
     column_ds["N_0"] = column_ds[N_name].astype(float) * 1e6 * \
-        column_ds["lambda"]**(column_ds["mu"] + 1.) / gamma(column_ds["mu"] + 1.)
+        fit_lambda**(column_ds["mu"].astype(float) + 1.) / gamma(column_ds["mu"].astype(float) + 1.)
     column_ds["N_0"].attrs["long_name"] = "Intercept of gamma fit"
     column_ds["N_0"].attrs["units"] = r"$m^{-4}$"
     model.ds = column_ds
     return model
 
 
+def calc_psd_integral_table(p_diam, beta_p, alpha_p, v_tmp=None, mu_range=(0., 0.),
+                            lambda_range=(1e3, 1e6), rtol=1e-3, max_refinements=6):
+    r"""
+    Calculates a lookup table of the gamma PSD integrals of a scattering LUT as a
+    function of :math:`\mu` and :math:`\lambda` for :math:`N_{0} = 1`.
+
+    The tabulated quantities are the logarithms of the integrals
+
+    .. math::
+         I_{x} = \int x(D) D^{\mu} e^{-\lambda D} dD
+
+    for :math:`x = \beta_{p}, \alpha_{p}` and, if a terminal velocity is given,
+    :math:`|v|\beta_{p}` and :math:`v^{2}\beta_{p}`, together with their exact second
+    derivatives with respect to :math:`\mu` and :math:`\log_{10}\lambda`, which
+    are used to correct the curvature error of the bilinear interpolation. All
+    integrals scale linearly with :math:`N_{0}`. The grid is refined until the
+    interpolated backscatter and extinction integrals, mean Doppler velocity, and
+    spectral width at the grid cell midpoints are within rtol of the exact values.
+
+    Parameters
+    ----------
+    p_diam: ndarray
+        The particle diameter grid of the scattering LUT in m.
+    beta_p: ndarray
+        The backscattering cross section on the p_diam grid.
+    alpha_p: ndarray
+        The extinction cross section on the p_diam grid.
+    v_tmp: ndarray or None
+        The terminal velocity on the p_diam grid. None to skip the velocity moments.
+    mu_range: 2-tuple
+        The range of :math:`\mu` values to cover.
+    lambda_range: 2-tuple
+        The range of :math:`\lambda` values (in :math:`m^{-1}`) to cover.
+    rtol: float
+        The relative error tolerance of the interpolated integrals.
+    max_refinements: int
+        The maximum number of times the grid spacing is halved to meet rtol.
+
+    Returns
+    -------
+    table: xarray.Dataset or None
+        The lookup table with dimensions of mu and log10_lambda. None if the
+        tolerance could not be met or if the terminal velocity changes sign.
+    """
+    if v_tmp is not None and not np.logical_or(np.all(v_tmp <= 0), np.all(v_tmp >= 0)):
+        print("PSD integral table requires a single-signed terminal velocity; "
+              "using exact integration")
+        return None
+
+    mu_step = 1.
+    log_step = 0.1
+    log_lambda_range = np.log10(lambda_range)
+    for i in range(max_refinements + 1):
+        mu_nodes = _lattice_nodes(mu_range, mu_step)
+        log_lambda_nodes = _lattice_nodes(log_lambda_range, log_step)
+        table = _calc_psd_integrals(p_diam, beta_p, alpha_p, v_tmp, mu_nodes, log_lambda_nodes)
+
+        mu_mid = (mu_nodes[1:] + mu_nodes[:-1]) / 2
+        log_lambda_mid = (log_lambda_nodes[1:] + log_lambda_nodes[:-1]) / 2
+        mu_err = _calc_psd_table_error(
+            table, p_diam, beta_p, alpha_p, v_tmp, mu_mid, log_lambda_nodes)
+        lambda_err = _calc_psd_table_error(
+            table, p_diam, beta_p, alpha_p, v_tmp, mu_nodes, log_lambda_mid)
+        max_err = max(mu_err, lambda_err)
+        if max_err <= rtol / 2:
+            if mu_mid.size > 0:
+                max_err = max(max_err, _calc_psd_table_error(
+                    table, p_diam, beta_p, alpha_p, v_tmp, mu_mid, log_lambda_mid))
+            if max_err <= rtol:
+                table.attrs["max_rel_error"] = max_err
+                table.attrs["rtol"] = rtol
+                return table
+            mu_err = lambda_err = rtol
+        if mu_err > rtol / 2:
+            mu_step /= 2
+        if lambda_err > rtol / 2:
+            log_step /= 2
+
+    print("PSD integral table could not meet rtol=%.1e (max. error %.1e); "
+          "using exact integration" % (rtol, max_err))
+    return None
+
+
+def interp_psd_integral_table(table, N_0, lambdas, mu):
+    """
+    Interpolates a PSD integral lookup table (see
+    :py:func:`emc2.simulator.psd.calc_psd_integral_table`) to the given PSD parameters.
+
+    Parameters
+    ----------
+    table: xarray.Dataset
+        The PSD integral lookup table.
+    N_0, lambdas, mu: ndarray
+        1D arrays of the PSD intercept, slope, and dispersion.
+
+    Returns
+    -------
+    moment_denom, V_d_numer, sigma_d_numer, tmp_od: ndarray
+        The backscatter integral, its velocity and velocity variance-weighted
+        counterparts (NaN if the table has no velocity moments), and the extinction
+        integral. NaN where the PSD parameters are outside of the table.
+    """
+    mu_nodes = table["mu"].values
+    log_lambda_nodes = table["log10_lambda"].values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_lambda = np.log10(lambdas)
+    i_mu, w_mu, out_mu = _lattice_weights(mu_nodes, mu)
+    i_lam, w_lam, out_lam = _lattice_weights(log_lambda_nodes, log_lambda)
+    outside = np.logical_or(out_mu, out_lam)
+    mu_step = mu_nodes[1] - mu_nodes[0] if mu_nodes.size > 1 else 0.
+    lambda_step = log_lambda_nodes[1] - log_lambda_nodes[0]
+
+    def _bilinear(values):
+        out = values[i_mu, i_lam] * (1 - w_mu) * (1 - w_lam) + \
+            values[i_mu, i_lam + 1] * (1 - w_mu) * w_lam
+        if mu_nodes.size > 1:
+            out += values[i_mu + 1, i_lam] * w_mu * (1 - w_lam) + \
+                values[i_mu + 1, i_lam + 1] * w_mu * w_lam
+        return out
+
+    def _interp_log_I(var_name):
+        log_I = _bilinear(table["log_I_%s" % var_name].values) - \
+            0.5 * w_mu * (1 - w_mu) * mu_step ** 2 * _bilinear(table["d2mu_log_I_%s" % var_name].values) - \
+            0.5 * w_lam * (1 - w_lam) * lambda_step ** 2 * \
+            _bilinear(table["d2lambda_log_I_%s" % var_name].values)
+        return np.where(outside, np.nan, log_I)
+
+    moment_denom = N_0 * np.exp(_interp_log_I("beta"))
+    tmp_od = N_0 * np.exp(_interp_log_I("alpha"))
+    if "log_I_v_beta" in table.variables:
+        V_d_numer = table.attrs["V_d_sign"] * N_0 * np.exp(_interp_log_I("v_beta"))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sigma_d_numer = N_0 * np.exp(_interp_log_I("v2_beta")) - V_d_numer ** 2 / moment_denom
+        sigma_d_numer = np.where(sigma_d_numer < 0, 0, sigma_d_numer)
+    else:
+        V_d_numer = np.full(moment_denom.shape, np.nan)
+        sigma_d_numer = np.full(moment_denom.shape, np.nan)
+
+    return moment_denom, V_d_numer, sigma_d_numer, tmp_od
+
+
+def _get_psd_integral_table(instrument, lut_name, p_diam, beta_p, alpha_p, v_tmp,
+                            mu, lambdas, rtol=1e-3):
+    """
+    Returns a PSD integral table covering the given PSD parameters from the instrument's
+    table cache, (re)calculating it if the cached table does not cover them.
+    Returns None if no valid table could be calculated. This outcome is cached as well,
+    such that the exact integration fallback is decided once per table.
+    """
+    valid = np.logical_and(np.isfinite(mu), np.logical_and(np.isfinite(lambdas), lambdas > 0))
+    if not np.any(valid):
+        return None
+    mu_range = (mu[valid].min(), mu[valid].max())
+    lambda_range = (lambdas[valid].min(), lambdas[valid].max())
+    if v_tmp is None:
+        key = (lut_name, None, rtol)
+    else:
+        key = (lut_name, hash(np.asarray(v_tmp, dtype=float).tobytes()), rtol)
+
+    if key in instrument.psd_integral_tables and instrument.psd_integral_tables[key] is None:
+        return None
+    table = instrument.psd_integral_tables.get(key)
+    if table is not None:
+        mu_nodes = table["mu"].values
+        lambda_nodes = 10 ** table["log10_lambda"].values
+        if mu_nodes.size == 1:
+            covers_mu = mu_range[0] == mu_range[1] == mu_nodes[0]
+        else:
+            covers_mu = mu_nodes[0] <= mu_range[0] and mu_range[1] <= mu_nodes[-1]
+        if covers_mu and lambda_nodes[0] <= lambda_range[0] and lambda_range[1] <= lambda_nodes[-1]:
+            return table
+        if mu_nodes.size > 1 or mu_range[0] != mu_range[1] or mu_range[0] != mu_nodes[0]:
+            mu_range = (min(mu_range[0], mu_nodes[0]), max(mu_range[1], mu_nodes[-1]))
+        lambda_range = (min(lambda_range[0], lambda_nodes[0]), max(lambda_range[1], lambda_nodes[-1]))
+
+    print("Calculating PSD integral table for %s" % lut_name)
+    table = calc_psd_integral_table(p_diam, beta_p, alpha_p, v_tmp, mu_range=mu_range,
+                                    lambda_range=lambda_range, rtol=rtol)
+    instrument.psd_integral_tables[key] = table
+    return table
+
+
+def _calc_psd_table_error(table, p_diam, beta_p, alpha_p, v_tmp, mu_nodes, log_lambda_nodes):
+    """
+    Returns the maximum relative error of a PSD integral table on a (mu, lambda) grid.
+    """
+    if mu_nodes.size == 0 or log_lambda_nodes.size == 0:
+        return 0.
+    exact = _calc_psd_integrals(p_diam, beta_p, alpha_p, v_tmp, mu_nodes, log_lambda_nodes)
+    mu, log_lambda = np.meshgrid(mu_nodes, log_lambda_nodes, indexing="ij")
+    interp = interp_psd_integral_table(
+        table, np.ones(mu.size), 10 ** log_lambda.ravel(), mu.ravel())
+    exact = interp_psd_integral_table(
+        exact, np.ones(mu.size), 10 ** log_lambda.ravel(), mu.ravel())
+    max_err = 0.
+    for interp_vals, exact_vals in zip(_psd_table_observables(*interp),
+                                       _psd_table_observables(*exact)):
+        scale = np.maximum(np.abs(exact_vals), 1e-12 * np.nanmax(np.abs(exact_vals)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            max_err = max(max_err, np.nanmax(np.abs(interp_vals - exact_vals) / scale))
+    return max_err
+
+
+def _psd_table_observables(moment_denom, V_d_numer, sigma_d_numer, tmp_od):
+    """
+    Returns the backscatter and extinction integrals, mean Doppler velocity, and spectral
+    width from the interpolated PSD integrals.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (moment_denom, tmp_od, V_d_numer / moment_denom,
+                np.sqrt(sigma_d_numer / moment_denom))
+
+
+def _lattice_nodes(val_range, step):
+    """
+    Returns the nodes of a grid with a given step that covers a value range. The nodes
+    are multiples of the step so that tables covering overlapping ranges share nodes.
+    """
+    if val_range[0] == val_range[1]:
+        return np.array([float(val_range[0])])
+    return np.arange(np.floor(val_range[0] / step), np.ceil(val_range[1] / step) + 1) * step
+
+
+def _lattice_weights(nodes, values):
+    """
+    Returns the lower node index, the linear interpolation weight, and an out-of-range
+    mask of values on a regular grid.
+    """
+    if nodes.size == 1:
+        return (np.zeros(values.shape, dtype=int), np.zeros(values.shape),
+                ~np.isclose(values, nodes[0], rtol=1e-12, atol=0))
+    step = nodes[1] - nodes[0]
+    with np.errstate(invalid="ignore"):
+        pos = (values - nodes[0]) / step
+        outside = ~np.logical_and(pos >= 0, pos <= nodes.size - 1)
+    pos = np.where(outside, 0, pos)
+    ind = np.minimum(np.floor(pos).astype(int), nodes.size - 2)
+    return ind, pos - ind, outside
+
+
+def _calc_psd_integrals(p_diam, beta_p, alpha_p, v_tmp, mu_nodes, log_lambda_nodes):
+    """
+    Integrates the scattering properties over an N_0 = 1 gamma PSD on a (mu, lambda) grid.
+
+    The second derivative of log(I) with respect to mu is the variance of ln(D), and
+    with respect to log10(lambda) it is ln(10)^2 * (lambda^2 Var(D) - lambda E(D)),
+    where the moments are weighted by the integrand.
+    """
+    weights = {"beta": beta_p, "alpha": alpha_p}
+    if v_tmp is not None:
+        weights["v_beta"] = np.abs(v_tmp) * beta_p
+        weights["v2_beta"] = v_tmp ** 2 * beta_p
+    tiny = np.finfo(float).tiny
+    shape = (mu_nodes.size, log_lambda_nodes.size)
+    lambdas = 10 ** log_lambda_nodes
+    ln_diam = np.log(np.where(p_diam > 0, p_diam, tiny))
+    block_size = max(1, 2 ** 22 // p_diam.size)
+    table = xr.Dataset(coords={"mu": mu_nodes, "log10_lambda": log_lambda_nodes})
+    for var_name, weight in weights.items():
+        log_I = np.zeros(shape)
+        d2mu = np.zeros(shape)
+        d2lambda = np.zeros(shape)
+        for i, mu in enumerate(mu_nodes):
+            for j in range(0, lambdas.size, block_size):
+                ind = slice(j, j + block_size)
+                lambda_tmp = lambdas[ind, np.newaxis]
+                Calc_tmp = weight * p_diam ** mu * np.exp(-lambda_tmp * p_diam)
+                I_x = np.trapz(Calc_tmp, x=p_diam, axis=1)[:, np.newaxis]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    mean_ln_diam = np.trapz(Calc_tmp * ln_diam, x=p_diam, axis=1)[:, np.newaxis] / I_x
+                    mean_diam = np.trapz(Calc_tmp * p_diam, x=p_diam, axis=1)[:, np.newaxis] / I_x
+                    d2mu[i, ind] = np.trapz(
+                        Calc_tmp * (ln_diam - mean_ln_diam) ** 2, x=p_diam, axis=1) / I_x[:, 0]
+                    var_diam = np.trapz(
+                        Calc_tmp * (p_diam - mean_diam) ** 2, x=p_diam, axis=1) / I_x[:, 0]
+                d2lambda[i, ind] = np.log(10) ** 2 * (
+                    lambda_tmp[:, 0] ** 2 * var_diam - lambda_tmp[:, 0] * mean_diam[:, 0])
+                log_I[i, ind] = np.log(np.maximum(I_x[:, 0], tiny))
+        table["log_I_%s" % var_name] = (("mu", "log10_lambda"), log_I)
+        table["d2mu_log_I_%s" % var_name] = (("mu", "log10_lambda"), np.nan_to_num(d2mu))
+        table["d2lambda_log_I_%s" % var_name] = (("mu", "log10_lambda"), np.nan_to_num(d2lambda))
+    if v_tmp is not None:
+        table.attrs["V_d_sign"] = -1. if np.all(v_tmp <= 0) else 1.
+    return table
+
+
+def calc_bulk_mu_lambda_interpolator(table, fields=("Q_back", "Q_ext")):
+    """
+    Returns an interpolator of bulk scattering LUT fields tabulated on a (lambdas, mu) grid
+    (e.g., the CESM_liq LUT), where the lambda values of the grid (lambda) depend on mu.
+
+    If the lambda values of each mu column are the same multiples of a reference lambda
+    (the first row of the LUT), which is the case for the bounded MG2 lambda range, the
+    LUT is a regular grid in (mu, lambda / reference lambda) and is interpolated with
+    scipy.interpolate.RegularGridInterpolator. Otherwise, the LUT is triangulated and
+    interpolated with scipy.interpolate.LinearNDInterpolator.
+
+    Parameters
+    ----------
+    table: xarray.Dataset
+        The bulk scattering LUT.
+    fields: tuple of str
+        The LUT fields to interpolate together.
+
+    Returns
+    -------
+    interpolator: callable
+        A function of the 1D mu and lambda arrays that returns a (point, field) array of the
+        interpolated fields. NaN where mu and lambda are outside of the LUT.
+    """
+    mu_nodes = table["mu"].values
+    lambda_nodes = table["lambda"].values
+    values = np.stack([table[field].values for field in fields], axis=-1)
+    lambda_ratio = lambda_nodes / lambda_nodes[0]
+    if np.all(np.diff(mu_nodes) > 0) and np.allclose(lambda_ratio, lambda_ratio[:, :1], rtol=1e-10, atol=0):
+        lambda_ratio = lambda_ratio[:, 0]
+        order = np.argsort(lambda_ratio)
+        if np.all(np.diff(lambda_ratio[order]) > 0):
+            interpolator = RegularGridInterpolator(
+                (mu_nodes, lambda_ratio[order]), np.swapaxes(values[order], 0, 1),
+                bounds_error=False, fill_value=np.nan)
+            lambda_ref = lambda_nodes[0]
+            ratio_range = (lambda_ratio[order[0]], lambda_ratio[order[-1]])
+
+            def _interp_regular(mu, lambdas):
+                ratio = lambdas / np.interp(mu, mu_nodes, lambda_ref)
+                # Points on the LUT edges must not fall outside of it due to round-off
+                for bound in ratio_range:
+                    ratio = np.where(np.isclose(ratio, bound, rtol=1e-12, atol=0), bound, ratio)
+                return interpolator(np.stack((mu, ratio), axis=-1))
+            return _interp_regular
+
+    mu_b = np.broadcast_to(mu_nodes, lambda_nodes.shape).flatten()
+    interpolator = LinearNDInterpolator(np.stack((mu_b, lambda_nodes.flatten()), axis=1),
+                                        values.reshape(-1, len(fields)))
+    return lambda mu, lambdas: interpolator(mu, lambdas)
+
+
+def _get_bulk_mu_lambda_interpolator(instrument, lut_name):
+    """
+    Returns the (mu, lambda) interpolator of the Q_back and Q_ext fields of a bulk scattering
+    LUT from the instrument's cache, calculating it on first use.
+    """
+    if lut_name not in instrument.bulk_interpolators:
+        instrument.bulk_interpolators[lut_name] = calc_bulk_mu_lambda_interpolator(
+            instrument.bulk_table[lut_name])
+    return instrument.bulk_interpolators[lut_name]
+
+
 def calc_re_thompson(model, hyd_type,
                      is_conv=True, subcolumns=False, **kwargs):
     """
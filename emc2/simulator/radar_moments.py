@@ -1,13 +1,14 @@
 import xarray as xr
 import numpy as np
-import dask.bag as db
 import dask.array as da
 
 from time import time
-from scipy.interpolate import LinearNDInterpolator
 
 from .attenuation import calc_radar_atm_attenuation
-from .psd import calc_mu_lambda, calc_velocity_nssl
+from .psd import calc_mu_lambda, calc_velocity_nssl, interp_psd_integral_table
+from .psd import _get_psd_integral_table, _get_bulk_mu_lambda_interpolator
+from .executor import get_executor, get_block_size
+from .subcolumn import get_active_cells, _scatter_cells
 from ..core.instrument import ureg, quantity
 
 
@@ -28,12 +29,13 @@ def calc_total_reflectivity(model, detect_mask=False):
         The xarray Dataset containing the calculated radar moments.
     """
     Ze_tot = np.where(np.isfinite(model.ds["sub_col_Ze_tot_strat"].values),
-                      10 ** (model.ds["sub_col_Ze_tot_strat"].values / 10.), 0)
+                      10 ** (model.ds["sub_col_Ze_tot_strat"].values.astype('float64') / 10.), 0)
     if model.process_conv:
         Ze_tot = np.where(np.isfinite(model.ds["sub_col_Ze_tot_conv"].values), Ze_tot +
-                          10 ** (model.ds["sub_col_Ze_tot_conv"].values / 10.), Ze_tot)
+                          10 ** (model.ds["sub_col_Ze_tot_conv"].values.astype('float64') / 10.), Ze_tot)
 
-    model.ds['sub_col_Ze_tot'] = xr.DataArray(10 * np.log10(Ze_tot), dims=model.ds["sub_col_Ze_tot_strat"].dims)
+    model.ds['sub_col_Ze_tot'] = xr.DataArray((10 * np.log10(Ze_tot)).astype(model.precision),
+                                              dims=model.ds["sub_col_Ze_tot_strat"].dims)
     model.ds['sub_col_Ze_tot'].values = np.where(np.isinf(model.ds['sub_col_Ze_tot'].values), np.nan,
                                                  model.ds['sub_col_Ze_tot'].values)
     model.ds['sub_col_Ze_tot'].attrs["long_name"] = \
@@ -56,6 +58,7 @@ def calc_total_reflectivity(model, detect_mask=False):
     model.ds["sub_col_Ze_tot"] = model.ds["sub_col_Ze_tot"].where(np.isfinite(model.ds["sub_col_Ze_tot"]))
     model.ds["sub_col_Ze_att_tot"] = model.ds["sub_col_Ze_att_tot"].where(
         np.isfinite(model.ds["sub_col_Ze_att_tot"]))
+    model.ds["sub_col_Ze_att_tot"] = model.ds["sub_col_Ze_att_tot"].astype(model.precision)
     model.ds["detect_mask"] = model.ds["Ze_min"] >= model.ds["sub_col_Ze_att_tot"]
     model.ds["detect_mask"].attrs["long_name"] = "Radar detectability mask"
     model.ds["detect_mask"].attrs["units"] = ("1 = radar signal below noise floor, 0 = signal detected")
@@ -105,33 +108,35 @@ def accumulate_attenuation(model, is_conv, z_values, hyd_ext, atm_ext, OD_from_s
     else:
         OD_str = "model layer top"
 
-    n_subcolumns = model.num_subcolumns
-
     Dims = model.ds["%s_q_subcolumns_cl" % cloud_str].shape
+    # Layer optical depths are accumulated in a single double precision buffer, with dz broadcast
+    # over the subcolumns
+    layer_ext = np.zeros(Dims, dtype='float64')
     if OD_from_sfc:
         dz = np.diff(z_values / 1e3, axis=1, prepend=0.)
-        hyd_ext = np.cumsum(
-            np.tile(dz, (n_subcolumns, 1, 1)) *
-            np.concatenate((np.zeros(Dims[:2] + (1,)), hyd_ext[:, :, :-1]), axis=2), axis=2)
+        layer_ext[:, :, 1:] = hyd_ext[:, :, :-1]
+        layer_ext *= dz[np.newaxis, :, :]
+        hyd_ext = np.cumsum(layer_ext, axis=2, out=layer_ext)
         atm_ext = np.cumsum(dz * np.concatenate((np.zeros((Dims[1],) + (1,)),
                                                  atm_ext[:, :-1]), axis=1), axis=1)
     else:
         dz = np.diff(z_values / 1e3, axis=1, append=0.)
-        hyd_ext = np.flip(
-            np.cumsum(np.flip(np.tile(dz, (n_subcolumns, 1, 1)) *
-                      np.concatenate((hyd_ext[:, :, 1:],
-                                      np.zeros(Dims[:2] + (1,))), axis=2),
-                      axis=2), axis=2), axis=2)
+        layer_ext[:, :, :-1] = hyd_ext[:, :, 1:]
+        layer_ext *= dz[np.newaxis, :, :]
+        np.cumsum(layer_ext[:, :, ::-1], axis=2, out=layer_ext[:, :, ::-1])
+        hyd_ext = layer_ext
         atm_ext = np.flip(
             np.cumsum(np.flip(dz * np.concatenate((atm_ext[:, 1:],
                       np.zeros((Dims[1],) + (1,))), axis=1), axis=1), axis=1), axis=1)
 
     if use_empiric_calc:
-        model.ds['hyd_ext_%s' % cloud_str] = xr.DataArray(10 ** (-2 * hyd_ext / 10.),
-                                                          dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        hyd_ext = 10 ** (-2 * hyd_ext / 10.)
     else:
-        model.ds['hyd_ext_%s' % cloud_str] = \
-            xr.DataArray(np.exp(-2 * hyd_ext), dims=model.ds["sub_col_Ze_tot_%s" % cloud_str].dims)
+        hyd_ext = np.exp(-2 * hyd_ext)
+    # Fully attenuated signals stay finite (and undetectable) when the precision is float32
+    hyd_ext = np.where(hyd_ext > 0, np.maximum(hyd_ext, np.finfo(model.precision).tiny), hyd_ext)
+    model.ds['hyd_ext_%s' % cloud_str] = xr.DataArray(
+        hyd_ext.astype(model.precision), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
     model.ds['atm_ext'] = xr.DataArray(10 ** (-2 * atm_ext / 10), dims=model.ds[model.T_field].dims)
 
     model.ds['hyd_ext_%s' % cloud_str].attrs["long_name"] = \
@@ -190,39 +195,43 @@ def calc_radar_empirical(instrument, model, is_conv, p_values, t_values, z_value
 
     Dims = model.ds["%s_q_subcolumns_cl" % cloud_str].shape
     model.ds["sub_col_Ze_tot_%s" % cloud_str] = xr.DataArray(
-        np.zeros(Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        np.zeros(Dims, dtype=model.precision), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
 
     for hyd_type in hyd_types:
         q_field = "%s_q_subcolumns_%s" % (cloud_str, hyd_type)
-        WC_tot = np.zeros(Dims)
-        WC = model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)] * p_values / \
-            (instrument.R_d * (t_values + 273.15)) * 1e3
+        WC_tot = np.zeros(Dims, dtype=model.precision)
+        cells = get_active_cells(model, hyd_type, is_conv)
+        col_cells = cells % (Dims[1] * Dims[2])
+        t_cells = t_values.ravel()[col_cells]
+        WC = model.ds[q_field].values.ravel()[cells] * p_values.ravel()[col_cells] / \
+            (instrument.R_d * (t_cells + 273.15)) * 1e3
         # Fox and Illingworth (1997)
         if hyd_type.lower() == "cl":
             Ze_emp = 0.031 * WC ** 1.56
-            WC_tot += WC
+            WC_tot.ravel()[cells] += WC
         # Hagen and Yuter (2003)
         elif hyd_type.lower() == "pl":
             Ze_emp = ((WC * 1e3) / 3.4) ** 1.75
-            WC_tot += WC
+            WC_tot.ravel()[cells] += WC
         else:
             # Hogan et al. (2006)
             if 2e9 <= instrument.freq < 4e9:
-                Ze_emp = 10 ** (((np.log10(WC) + 0.0197 * t_values + 1.7) / 0.060) / 10.)
+                Ze_emp = 10 ** (((np.log10(WC) + 0.0197 * t_cells + 1.7) / 0.060) / 10.)
             elif 27e9 <= instrument.freq < 40e9:
-                Ze_emp = 10 ** (((np.log10(WC) + 0.0186 * t_values + 1.63) /
-                                 (0.000242 * t_values + 0.0699)) / 10.)
+                Ze_emp = 10 ** (((np.log10(WC) + 0.0186 * t_cells + 1.63) /
+                                 (0.000242 * t_cells + 0.0699)) / 10.)
             elif 75e9 <= instrument.freq < 110e9:
-                Ze_emp = 10 ** (((np.log10(WC) + 0.00706 * t_values + 0.992) /
-                                 (0.000580 * t_values + 0.0923)) / 10.)
+                Ze_emp = 10 ** (((np.log10(WC) + 0.00706 * t_cells + 0.992) /
+                                 (0.000580 * t_cells + 0.0923)) / 10.)
             else:
-                Ze_emp = 10 ** (((np.log10(WC) + 0.0186 * t_values + 1.63) /
-                                 (0.000242 * t_values + 0.0699)) / 10.)
+                Ze_emp = 10 ** (((np.log10(WC) + 0.0186 * t_cells + 1.63) /
+                                 (0.000242 * t_cells + 0.0699)) / 10.)
 
         var_name = "sub_col_Ze_%s_%s" % (hyd_type, cloud_str)
         model.ds[var_name] = xr.DataArray(
-            Ze_emp.values, dims=model.ds[q_field].dims)
-        model.ds["sub_col_Ze_tot_%s" % cloud_str] += Ze_emp.fillna(0)
+            _scatter_cells(Ze_emp, cells, Dims, dtype=model.precision), dims=model.ds[q_field].dims)
+        model.ds["sub_col_Ze_tot_%s" % cloud_str].values.ravel()[cells] += \
+            np.where(np.isnan(Ze_emp), 0, Ze_emp).astype(model.precision)
     Rho_hyd_cl = model.Rho_hyd["cl"].magnitude
     kappa_f = 6 * np.pi / (instrument.wavelength * Rho_hyd_cl) * \
         ((instrument.eps_liq - 1) / (instrument.eps_liq + 2)).imag * 4.34e6  # dB m^3 g^-1 km^-1
@@ -273,7 +282,6 @@ def calc_radar_bulk(instrument, model, is_conv, p_values, z_values, atm_ext, OD_
 
     optional_ice_classes = ["ci", "pi", "sn", "gr", "ha", "pir", "pid", "pif"]
 
-    n_subcolumns = model.num_subcolumns
     if is_conv:
         cloud_str = "conv"
         re_fields = model.conv_re_fields
@@ -292,18 +300,18 @@ def calc_radar_bulk(instrument, model, is_conv, p_values, z_values, atm_ext, OD_
 
     Dims = model.ds["%s_q_subcolumns_cl" % cloud_str].shape
     model.ds["sub_col_Ze_tot_%s" % cloud_str] = xr.DataArray(
-        np.zeros(Dims), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
-    hyd_ext = np.zeros(Dims)
-    rhoa_dz = np.tile(
-        np.abs(np.diff(p_values, axis=1, append=0.)) / instrument.g,
-        (n_subcolumns, 1, 1))
-    dz = np.tile(
-        np.diff(z_values, axis=1, append=0.), (n_subcolumns, 1, 1))
+        np.zeros(Dims, dtype=model.precision), dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+    hyd_ext = np.zeros(Dims, dtype=model.precision)
+    rhoa_dz = np.abs(np.diff(p_values, axis=1, append=0.)) / instrument.g
+    dz = np.diff(z_values, axis=1, append=0.)
 
     for hyd_type in hyd_types:
+        # Only the cells with the hydrometeor are calculated (grid-mean fields are indexed by column cell)
+        cells = get_active_cells(model, hyd_type, is_conv)
+        col_cells = cells % (Dims[1] * Dims[2])
         if hyd_type[-1] == 'l':
-            rho_b = model.Rho_hyd[hyd_type]  # bulk water
-            re_array = np.tile(model.ds[re_fields[hyd_type]].values, (n_subcolumns, 1, 1))
+            rho_b = model.Rho_hyd[hyd_type].magnitude  # bulk water
+            re_cells = model.ds[re_fields[hyd_type]].values.ravel()[col_cells]
             if model.lambda_field is not None:  # assuming my and lambda can be provided only for liq hydrometeors
                 if not model.lambda_field[hyd_type] is None:
                     lambda_array = model.ds[model.lambda_field[hyd_type]].values
@@ -316,13 +324,11 @@ def calc_radar_bulk(instrument, model, is_conv, p_values, z_values, atm_ext, OD_
                 rho_hyd = model.Rho_hyd[hyd_type].magnitude
             fi_factor = model.fluffy[hyd_type].magnitude * rho_hyd / rho_b + \
                 (1 - model.fluffy[hyd_type].magnitude) * (rho_hyd / rho_b) ** (1 / 3)
-            re_array = np.tile(model.ds[re_fields[hyd_type]].values * fi_factor,
-                               (n_subcolumns, 1, 1))
+            re_cells = (model.ds[re_fields[hyd_type]].values * fi_factor).ravel()[col_cells]
 
-        tau_hyd = np.where(model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)] > 0,
-                           3 * model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)] * rhoa_dz /
-                           (2 * rho_b * re_array * 1e-6), 0)
-        A_hyd = tau_hyd / (2 * dz)  # model assumes geometric scatterers
+        q_cells = model.ds["%s_q_subcolumns_%s" % (cloud_str, hyd_type)].values.ravel()[cells]
+        tau_hyd = 3 * q_cells * rhoa_dz.ravel()[col_cells] / (2 * rho_b * re_cells * 1e-6)
+        A_hyd = tau_hyd / (2 * dz.ravel()[col_cells])  # model assumes geometric scatterers
 
         if np.isin(hyd_type, optional_ice_classes):
             if mie_for_ice:
@@ -334,42 +340,36 @@ def calc_radar_bulk(instrument, model, is_conv, p_values, z_values, atm_ext, OD_
                 Qback_bulk = instrument.bulk_table[bulk_ice_lut]["Q_back"].values
                 Qext_bulk = instrument.bulk_table[bulk_ice_lut]["Q_ext"].values
         else:
-            if model.model_name in ["E3SM", "CESM2"]:
-                mu_b = np.tile(instrument.bulk_table[bulk_liq_lut]["mu"].values,
-                               (instrument.bulk_table[bulk_liq_lut]["lambdas"].size)).flatten()
-                lambda_b = instrument.bulk_table[bulk_liq_lut]["lambda"].values.flatten()
-            else:
+            if model.model_name not in ["E3SM", "CESM2"]:
                 r_eff_bulk = instrument.bulk_table[bulk_liq_lut]["r_e"].values
             Qback_bulk = instrument.bulk_table[bulk_liq_lut]["Q_back"].values
             Qext_bulk = instrument.bulk_table[bulk_liq_lut]["Q_ext"].values
 
         if np.logical_and(np.isin(hyd_type, ["cl", "pl"]), model.model_name in ["E3SM", "CESM2"]):
-            print("2-D interpolation of bulk liq radar backscattering using mu-lambda values")
+            print("2-D interpolation of bulk liq radar backscattering and extinction using mu-lambda values")
             rel_locs = model.ds[model.q_names_stratiform[hyd_type]].values > 0.
-            interpolator = LinearNDInterpolator(np.stack((mu_b, lambda_b), axis=1), Qback_bulk.flatten())
+            interpolator = _get_bulk_mu_lambda_interpolator(instrument, bulk_liq_lut)
             interp_vals = interpolator(mu_array[rel_locs], lambda_array[rel_locs])
-            back_tmp = np.ones_like(model.ds[model.q_names_stratiform[hyd_type]].values, dtype=float) * np.nan
+            back_tmp = np.full(model.ds[model.q_names_stratiform[hyd_type]].shape, np.nan)
             ext_tmp = np.copy(back_tmp)
-            np.place(back_tmp, rel_locs,
-                     (interp_vals * instrument.wavelength ** 4) /
-                     (instrument.K_w * np.pi ** 5) * 1e-6)
-            model.ds["sub_col_Ze_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
-                np.tile(back_tmp, (n_subcolumns, 1, 1)) * A_hyd,
-                dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
-            print("2-D interpolation of bulk liq radar extinction using mu-lambda values")
-            interpolator = LinearNDInterpolator(np.stack((mu_b, lambda_b), axis=1), Qext_bulk.flatten())
-            interp_vals = interpolator(mu_array[rel_locs], lambda_array[rel_locs])
-            np.place(ext_tmp, rel_locs, interp_vals)
-            hyd_ext += np.tile(ext_tmp, (n_subcolumns, 1, 1)) * A_hyd
+            back_tmp[rel_locs] = (interp_vals[:, 0] * instrument.wavelength ** 4) / \
+                (instrument.K_w * np.pi ** 5) * 1e-6
+            ext_tmp[rel_locs] = interp_vals[:, 1]
+            Ze_cells = back_tmp.ravel()[col_cells] * A_hyd
+            ext_cells = ext_tmp.ravel()[col_cells] * A_hyd
         else:
-            model.ds["sub_col_Ze_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
-                (np.interp(re_array, r_eff_bulk, Qback_bulk) * A_hyd * instrument.wavelength ** 4) /
-                (instrument.K_w * np.pi ** 5) * 1e-6,
-                dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
-            hyd_ext += np.interp(re_array, r_eff_bulk, Qext_bulk) * A_hyd
-
-        model.ds["sub_col_Ze_tot_%s" % cloud_str] += model.ds["sub_col_Ze_%s_%s" % (
-            hyd_type, cloud_str)].fillna(0)
+            Qback_cells = np.interp(re_cells, r_eff_bulk, Qback_bulk)
+            Qext_cells = np.interp(re_cells, r_eff_bulk, Qext_bulk)
+            Ze_cells = (Qback_cells * A_hyd * instrument.wavelength ** 4) / \
+                (instrument.K_w * np.pi ** 5) * 1e-6
+            ext_cells = Qext_cells * A_hyd
+
+        model.ds["sub_col_Ze_%s_%s" % (hyd_type, cloud_str)] = xr.DataArray(
+            _scatter_cells(Ze_cells, cells, Dims, dtype=model.precision),
+            dims=model.ds["%s_q_subcolumns_cl" % cloud_str].dims)
+        hyd_ext.ravel()[cells] += ext_cells.astype(model.precision)
+        model.ds["sub_col_Ze_tot_%s" % cloud_str].values.ravel()[cells] += \
+            np.where(np.isnan(Ze_cells), 0, Ze_cells).astype(model.precision)
 
     model = accumulate_attenuation(model, is_conv, z_values, hyd_ext, atm_ext,
                                    OD_from_sfc=OD_from_sfc, use_empiric_calc=False, **kwargs)
@@ -379,7 +379,7 @@ def calc_radar_bulk(instrument, model, is_conv, p_values, z_values, atm_ext, OD_
 
 def calc_radar_micro(instrument, model, z_values, atm_ext, OD_from_sfc=True,
                      hyd_types=None, mie_for_ice=True, parallel=True, chunk=None,
-                     **kwargs):
+                     block_size=None, use_psd_tables=False, psd_table_rtol=1e-3, **kwargs):
     """
     Calculates the first 3 radar moments (reflectivity, mean Doppler velocity and spectral
     width) in a given column for the given radar using the microphysics (MG2) logic.
@@ -401,13 +401,27 @@ def calc_radar_micro(instrument, model, z_values, atm_ext, OD_from_sfc=True,
     mie_for_ice: bool
         If True, using full mie caculation LUTs. Otherwise, currently using the C6
         scattering LUTs for 8-column severly roughned aggregate.
-    parallel: bool
-        If True, use parallelism in calculating lidar parameters.
+    parallel: bool, str or :py:class:`emc2.simulator.executor.Executor`
+        The executor of the column loop (see :py:func:`emc2.simulator.executor.get_executor`).
+        If True, use dask. If False, process the columns serially.
     chunk: int or None
-        The number of entries to process in one parallel loop. None will send all of
-        the entries to the Dask worker queue at once. Sometimes, Dask will freeze if
+        The number of cell blocks to process in one parallel loop. None will send all of
+        the blocks to the worker queue at once. Sometimes, Dask will freeze if
         too many tasks are sent at once due to memory issues, so adjusting this number
         might be needed if that happens.
+    block_size: int or None
+        The number of (subcolumn, time, height) cells for which the PSD and the
+        moment integrals are evaluated together (each block is a parallel task when
+        parallel is True). None will tune the block size from the number of cells, the
+        available memory, and the number of workers, such that a block's N(D) array holds
+        at most about 2**22 elements.
+    use_psd_tables: bool
+        If True, the PSD integrals are interpolated from (mu, lambda) lookup tables
+        that are calculated once per scattering LUT and cached in the instrument
+        (see :py:func:`emc2.simulator.psd.calc_psd_integral_table`) instead of
+        integrating the PSD in each cell. Cells outside of the tables are integrated.
+    psd_table_rtol: float
+        The relative error tolerance of the PSD integral lookup tables.
     Additonal keyword arguments are passed into
     :py:func:`emc2.simulator.psd.calc_mu_lambda`.
     :py:func:`emc2.simulator.lidar_moments.accumulate_attenuation`.
@@ -437,9 +451,9 @@ def calc_radar_micro(instrument, model, z_values, atm_ext, OD_from_sfc=True,
             ice_lut = "E3_ice"
             ice_diam_var = "p_diam_eq_V"
 
-    moment_denom_tot = np.zeros(Dims)
-    V_d_numer_tot = np.zeros(Dims)
-    sigma_d_numer_tot = np.zeros(Dims)
+    moment_denom_tot = np.zeros(Dims, dtype=model.precision)
+    V_d_numer_tot = np.zeros(Dims, dtype=model.precision)
+    sigma_d_numer_tot = np.zeros(Dims, dtype=model.precision)
 
     for hyd_type in hyd_types:
         print("Calculating moments for hydrometeor %s" % hyd_type)
@@ -447,27 +461,24 @@ def calc_radar_micro(instrument, model, z_values, atm_ext, OD_from_sfc=True,
         n_names = model.N_field[hyd_type]
         if not np.isin("sub_col_Ze_tot_strat", [x for x in model.ds.keys()]):
             model.ds["sub_col_Ze_tot_strat"] = xr.DataArray(
-                np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+                np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
             model.ds["sub_col_Vd_tot_strat"] = xr.DataArray(
-                np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+                np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
             model.ds["sub_col_sigma_d_tot_strat"] = xr.DataArray(
-                np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+                np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
 
         model.ds["sub_col_Ze_%s_strat" % hyd_type] = xr.DataArray(
-            np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+            np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
         model.ds["sub_col_Vd_%s_strat" % hyd_type] = xr.DataArray(
-            np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+            np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
         model.ds["sub_col_sigma_d_%s_strat" % hyd_type] = xr.DataArray(
-            np.zeros(Dims), dims=model.ds.strat_q_subcolumns_cl.dims)
+            np.zeros(Dims, dtype=model.precision), dims=model.ds.strat_q_subcolumns_cl.dims)
         fits_ds = calc_mu_lambda(model, hyd_type, subcolumns=True, **kwargs).ds
         N_0 = fits_ds["N_0"].values
         lambdas = fits_ds["lambda"].values
         mu = fits_ds["mu"].values
         total_hydrometeor = model.ds[frac_names].values * model.ds[n_names].values
 
-        beta_pv = None
-        kdp_factor = None
-
         if np.isin(hyd_type, optional_ice_classes):
             if mie_for_ice:
                 if hyd_type == "ci":
@@ -477,16 +488,18 @@ def calc_radar_micro(instrument, model, z_values, atm_ext, OD_from_sfc=True,
                 p_diam = instrument.mie_table[hyd_type_2_use]["p_diam"].values
                 beta_p = instrument.mie_table[hyd_type_2_use]["beta_p"].values
                 alpha_p = instrument.mie_table[hyd_type_2_use]["alpha_p"].values
+                lut_name = "mie_%s" % hyd_type_2_use
             else:
                 p_diam = instrument.scat_table[ice_lut][ice_diam_var].values
                 beta_p = instrument.scat_table[ice_lut]["beta_p"].values
                 alpha_p = instrument.scat_table[ice_lut]["alpha_p"].values
+                lut_name = ice_lut
         else:  # Liquid classes (assuming only cl and pl)
             p_diam = instrument.mie_table[hyd_type]["p_diam"].values
             beta_p = instrument.mie_table[hyd_type]["beta_p"].values
             alpha_p = instrument.mie_table[hyd_type]["alpha_p"].values
+            lut_name = "mie_%s" % hyd_type
 
-        num_subcolumns = model.num_subcolumns
         if model.mcphys_scheme == "nssl":
             rhoe = model.Rho_hyd[hyd_type]
             if rhoe == 'variable':
@@ -500,83 +513,34 @@ def calc_radar_micro(instrument, model, z_values, atm_ext, OD_from_sfc=True,
             rhoe = None
 
         if hyd_type == "cl":
-            _calc_liquid = lambda x: _calculate_observables_liquid(
-                x, total_hydrometeor, N_0, lambdas, mu,
-                alpha_p, beta_p, v_tmp, num_subcolumns, instrument, p_diam)
-            if parallel:
-                print("Doing parallel radar calculations for %s" % hyd_type)
-                if chunk is None:
-                    tt_bag = db.from_sequence(np.arange(0, Dims[1], 1))
-                    my_tuple = tt_bag.map(_calc_liquid).compute()
-                else:
-                    my_tuple = []
-                    j = 0
-                    while j < Dims[1]:
-                        if j + chunk >= Dims[1]:
-                            ind_max = Dims[1]
-                        else:
-                            ind_max = j + chunk
-                        print("Stage 1 of 2: processing columns %d-%d out of %d" % (j, ind_max, Dims[1]))
-                        tt_bag = db.from_sequence(np.arange(j, ind_max, 1))
-                        my_tuple += tt_bag.map(_calc_liquid).compute()
-                        j += chunk
-            else:
-                my_tuple = [x for x in map(
-                    _calc_liquid, np.arange(0, Dims[1], 1))]
-
-            
-            V_d_numer_tot = np.nan_to_num(
-                np.stack([x[0] for x in my_tuple], axis=1))
-            moment_denom_tot = np.nan_to_num(
-                np.stack([x[1] for x in my_tuple], axis=1))
-            hyd_ext = np.nan_to_num(np.stack([x[2] for x in my_tuple], axis=1))
-
-            model.ds["sub_col_Ze_cl_strat"][:, :, :] = np.stack(
-                [x[3] for x in my_tuple], axis=1)
-            model.ds["sub_col_Vd_cl_strat"][:, :, :] = np.stack(
-                [x[4] for x in my_tuple], axis=1)
-            model.ds["sub_col_sigma_d_cl_strat"][:, :, :] = np.stack(
-                [x[5] for x in my_tuple], axis=1)
-
-            del my_tuple
+            sub_q_array = None
         else:
             sub_q_array = model.ds["strat_q_subcolumns_%s" % hyd_type].values
-            _calc_other = lambda x: _calculate_other_observables(
-                x, total_hydrometeor, N_0, lambdas, model.num_subcolumns,
-                beta_p, alpha_p, v_tmp,
-                instrument.wavelength, instrument.K_w,
-                sub_q_array, hyd_type, p_diam, beta_pv, rhoe)
-
-            if parallel:
-                print("Doing parallel radar calculation for %s" % hyd_type)
-                if chunk is None:
-                    tt_bag = db.from_sequence(np.arange(0, Dims[1], 1))
-                    my_tuple = tt_bag.map(_calc_other).compute()
-                else:
-                    my_tuple = []
-                    j = 0
-                    while j < Dims[1]:
-                        if j + chunk >= Dims[1]:
-                            ind_max = Dims[1]
-                        else:
-                            ind_max = j + chunk
-                        print("Stage 1 of 2: Processing columns %d-%d out of %d" % (j, ind_max, Dims[1]))
-                        tt_bag = db.from_sequence(np.arange(j, ind_max, 1))
-                        my_tuple += tt_bag.map(_calc_other).compute()
-                        j += chunk
-            else:
-                my_tuple = [x for x in map(
-                    _calc_other, np.arange(0, Dims[1], 1))]
-
-            V_d_numer_tot += np.nan_to_num(np.stack([x[0] for x in my_tuple], axis=1))
-            moment_denom_tot += np.nan_to_num(np.stack([x[1] for x in my_tuple], axis=1))
-            hyd_ext = np.nan_to_num(np.stack([x[2] for x in my_tuple], axis=1))
-            model.ds["sub_col_Ze_%s_strat" % hyd_type][:, :, :] = np.stack([x[3] for x in my_tuple], axis=1)
-            model.ds["sub_col_Vd_%s_strat" % hyd_type][:, :, :] = np.stack([x[4] for x in my_tuple], axis=1)
-            model.ds["sub_col_sigma_d_%s_strat" % hyd_type][:, :, :] = np.stack([x[5] for x in my_tuple], axis=1)
-            if beta_pv is not None:
-                Zv = np.nan_to_num(np.stack([x[6] for x in my_tuple], axis=1))
-                model.ds["sub_col_Zdr_%s_strat" % hyd_type] = model.ds["sub_col_Ze_%s_strat" % hyd_type] / Zv
+        psd_table = None
+        if use_psd_tables and not isinstance(v_tmp, str):
+            psd_table = _get_psd_integral_table(
+                instrument, lut_name, p_diam, beta_p, alpha_p, v_tmp,
+                mu if hyd_type == "cl" else np.zeros_like(mu), lambdas, rtol=psd_table_rtol)
+        if get_executor(parallel).parallel:
+            print("Doing parallel radar calculations for %s" % hyd_type)
+        V_d_numer, moment_denom, sigma_d_numer, tmp_ext, Ze, V_d, sigma_d = _calc_radar_micro_batched(
+            N_0, lambdas, mu, total_hydrometeor, sub_q_array, p_diam, beta_p, alpha_p,
+            v_tmp, instrument.wavelength, instrument.K_w, hyd_type, rhoe=rhoe,
+            block_size=block_size, parallel=parallel, chunk=chunk, psd_table=psd_table,
+            cells=get_active_cells(model, hyd_type, False))
+
+        V_d_numer = np.where(np.isnan(V_d_numer), 0, V_d_numer)
+        moment_denom = np.where(np.isnan(moment_denom), 0, moment_denom)
+        sigma_d_numer_tot[:] = _combine_sigma_d_numer(
+            moment_denom_tot, V_d_numer_tot, sigma_d_numer_tot,
+            moment_denom, V_d_numer, np.where(np.isnan(sigma_d_numer), 0, sigma_d_numer))
+        V_d_numer_tot += V_d_numer
+        moment_denom_tot += moment_denom
+        hyd_ext = np.where(np.isnan(tmp_ext), 0, tmp_ext)
+        model.ds["sub_col_Ze_%s_strat" % hyd_type][:, :, :] = Ze
+        model.ds["sub_col_Vd_%s_strat" % hyd_type][:, :, :] = V_d
+        model.ds["sub_col_sigma_d_%s_strat" % hyd_type][:, :, :] = sigma_d
+        del V_d_numer, moment_denom, sigma_d_numer, tmp_ext, Ze, V_d, sigma_d
 
         if "sub_col_Ze_tot_strat" in model.ds.variables.keys():
             model.ds["sub_col_Ze_tot_strat"] += model.ds["sub_col_Ze_%s_strat" % hyd_type].fillna(0)
@@ -593,103 +557,6 @@ def calc_radar_micro(instrument, model, z_values, atm_ext, OD_from_sfc=True,
         model.ds["sub_col_sigma_d_%s_strat" % hyd_type].attrs["Processing method"] = method_str
     model.ds["sub_col_Vd_tot_strat"] = xr.DataArray(V_d_numer_tot / moment_denom_tot,
                                                     dims=model.ds["sub_col_Ze_tot_strat"].dims)
-    print("Now calculating total spectral width (this may take some time)")
-    for hyd_type in hyd_types:
-        fits_ds = calc_mu_lambda(model, hyd_type, subcolumns=True, **kwargs).ds
-        N_0 = fits_ds["N_0"].values
-        lambdas = fits_ds["lambda"].values
-        mu = fits_ds["mu"].values
-
-        if np.isin(hyd_type, optional_ice_classes):
-            if mie_for_ice:
-                if hyd_type == "ci":
-                    hyd_type_2_use = "ci"
-                else:
-                    hyd_type_2_use = "pi"  # Currently, all optional precipitating ice classes
-                p_diam = instrument.mie_table[hyd_type_2_use]["p_diam"].values
-                beta_p = instrument.mie_table[hyd_type_2_use]["beta_p"].values
-                alpha_p = instrument.mie_table[hyd_type_2_use]["alpha_p"].values
-            else:
-                p_diam = instrument.scat_table[ice_lut][ice_diam_var].values
-                beta_p = instrument.scat_table[ice_lut]["beta_p"].values
-                alpha_p = instrument.scat_table[ice_lut]["alpha_p"].values
-        else:  # Liquid classes (assuming only cl and pl)
-            p_diam = instrument.mie_table[hyd_type]["p_diam"].values
-            beta_p = instrument.mie_table[hyd_type]["beta_p"].values
-            alpha_p = instrument.mie_table[hyd_type]["alpha_p"].values
-        if model.mcphys_scheme == "nssl":
-            rhoe = model.Rho_hyd[hyd_type]
-            if rhoe == 'variable':
-                rhoe = model.ds[model.variable_density[hyd_type]].values[:]
-                v_tmp = 'variable'
-            else:
-                v_tmp = calc_velocity_nssl(p_diam, rhoe, hyd_type)
-        else:
-            v_tmp = model.vel_param_a[hyd_type] * p_diam ** model.vel_param_b[hyd_type]
-            v_tmp = -v_tmp.magnitude
-            rhoe = None
-
-        vel_param_a = model.vel_param_a
-        vel_param_b = model.vel_param_b
-        frac_names = model.strat_frac_names[hyd_type]
-        n_names = model.N_field[hyd_type]
-        total_hydrometeor = model.ds[frac_names] * model.ds[model.N_field[hyd_type]]
-
-        Vd_tot = model.ds["sub_col_Vd_tot_strat"].values
-        if hyd_type == "cl":
-
-            _calc_sigma_d_liq = lambda x: _calc_sigma_d_tot_cl(
-                x, N_0, lambdas, mu, instrument,
-                vel_param_a, vel_param_b, total_hydrometeor,
-                p_diam, Vd_tot, num_subcolumns)
-
-            if parallel:
-                if chunk is None:
-                    tt_bag = db.from_sequence(np.arange(0, Dims[1], 1))
-                    sigma_d_numer = tt_bag.map(_calc_sigma_d_liq).compute()
-                else:
-                    sigma_d_numer = []
-                    j = 0
-                    while j < Dims[1]:
-                        if j + chunk >= Dims[1]:
-                            ind_max = Dims[1]
-                        else:
-                            ind_max = j + chunk
-                        print("Stage 2 of 2: Processing columns %d-%d out of %d" % (j, ind_max, Dims[1]))
-                        tt_bag = db.from_sequence(np.arange(j, ind_max, 1))
-                        sigma_d_numer += tt_bag.map(_calc_sigma_d_liq).compute()
-                        j += chunk
-            else:
-                sigma_d_numer = [x for x in map(_calc_sigma_d_liq, np.arange(0, Dims[1], 1))]
-
-            sigma_d_numer_tot = np.nan_to_num(np.stack([x[0] for x in sigma_d_numer], axis=1))
-        else:
-            sub_q_array = model.ds["strat_q_subcolumns_%s" % hyd_type].values
-            _calc_sigma = lambda x: _calc_sigma_d_tot(
-                x, num_subcolumns, v_tmp, N_0, lambdas, mu,
-                total_hydrometeor, Vd_tot, sub_q_array, p_diam, beta_p,
-                rhoe, hyd_type)
-
-            if parallel:
-                if chunk is None:
-                    tt_bag = db.from_sequence(np.arange(0, Dims[1], 1))
-                    sigma_d_numer = tt_bag.map(_calc_sigma).compute()
-                else:
-                    sigma_d_numer = []
-                    j = 0
-                    while j < Dims[1]:
-                        if j + chunk >= Dims[1]:
-                            ind_max = Dims[1]
-                        else:
-                            ind_max = j + chunk
-                        print("Stage 2 of 2: processing columns %d-%d out of %d" % (j, ind_max, Dims[1]))
-                        tt_bag = db.from_sequence(np.arange(j, ind_max, 1))
-                        sigma_d_numer += tt_bag.map(_calc_sigma).compute()
-                        j += chunk
-            else:
-                sigma_d_numer = [x for x in map(_calc_sigma, np.arange(0, Dims[1], 1))]
-            sigma_d_numer_tot += np.nan_to_num(np.stack([x[0] for x in sigma_d_numer], axis=1))
-            
     model.ds = model.ds.drop_vars(("N_0", "lambda", "mu"))
 
     model.ds["sub_col_sigma_d_tot_strat"] = xr.DataArray(np.sqrt(sigma_d_numer_tot / moment_denom_tot),
@@ -741,12 +608,14 @@ def calc_radar_moments(instrument, model, is_conv,
         If True, then calculate optical depth from the surface.
     hyd_types: list or None
         list of hydrometeor names to include in calculation. using default Model subclass types if None.
-    parallel: bool
-        If True, then use parallelism to calculate each column quantity.
+    parallel: bool, str or :py:class:`emc2.simulator.executor.Executor`
+        The executor of the column loop (see :py:func:`emc2.simulator.executor.get_executor`).
+        If True, use dask. If False, process the columns serially.
     chunk: None or int
-        If using parallel processing, only send this number of time periods to the
-        parallel loop at one time. Sometimes Dask will crash if there are too many
-        tasks in the queue, so setting this value will help avoid that.
+        If using parallel processing, only send this number of cell blocks of the
+        microphysics logic to the executor at one time (see :py:func:`calc_radar_micro`).
+        Sometimes Dask will crash if there are too many tasks in the queue, so setting this
+        value will help avoid that.
     mie_for_ice: bool
         If True, using full mie caculation LUTs. Otherwise, currently using the C6
         scattering LUTs for 8-column aggregate at 270 K.
@@ -851,8 +720,9 @@ def calc_radar_moments(instrument, model, is_conv,
         model.ds["sub_col_Ze_%s_%s" % (hyd_type, cloud_str)].attrs["Ice scattering database"] = scat_str
 
 
-    model.ds['sub_col_Ze_att_tot_%s' % cloud_str] = model.ds["sub_col_Ze_tot_%s" % cloud_str] * \
-        model.ds['hyd_ext_%s' % cloud_str].fillna(1) * model.ds['atm_ext'].fillna(1)
+    model.ds['sub_col_Ze_att_tot_%s' % cloud_str] = (model.ds["sub_col_Ze_tot_%s" % cloud_str] *
+                                                     model.ds['hyd_ext_%s' % cloud_str].fillna(1) *
+                                                     model.ds['atm_ext'].fillna(1)).astype(model.precision)
     model.ds["sub_col_Ze_tot_%s" % cloud_str] = model.ds["sub_col_Ze_tot_%s" % cloud_str].where(
         np.isfinite(model.ds["sub_col_Ze_tot_%s" % cloud_str]))
     model.ds["sub_col_Ze_att_tot_%s" % cloud_str] = model.ds["sub_col_Ze_att_tot_%s" % cloud_str].where(
@@ -883,179 +753,179 @@ def calc_radar_moments(instrument, model, is_conv,
     return model
 
 
-def _calc_sigma_d_tot_cl(tt, N_0, lambdas, mu, instrument,
-                         vel_param_a, vel_param_b, total_hydrometeor,
-                         p_diam, Vd_tot, num_subcolumns):
-    hyd_type = "cl"
-    Dims = Vd_tot.shape
-
-    sigma_d_numer = np.zeros((Dims[0], Dims[2]), dtype='float64')
-    moment_denom = np.zeros((Dims[0], Dims[2]), dtype='float64')
-    if tt % 50 == 0:
-        print('Stratiform moment for class cl progress: %d/%d' % (tt, total_hydrometeor.shape[1]))
-    num_diam = len(p_diam)
-    Dims = Vd_tot.shape
-    for k in range(Dims[2]):
-        if np.all(total_hydrometeor[tt, k] == 0):
-            continue
-        N_0_tmp = N_0[:, tt, k].astype('float64')
-        N_0_tmp, d_diam_tmp = np.meshgrid(N_0_tmp, p_diam)
-        lambda_tmp = lambdas[:, tt, k].astype('float64')
-        lambda_tmp, d_diam_tmp = np.meshgrid(lambda_tmp, p_diam)
-        mu_temp = mu[:, tt, k] * np.ones_like(lambda_tmp)
-        N_D = N_0_tmp * d_diam_tmp ** mu_temp * np.exp(-lambda_tmp * d_diam_tmp)
-        Calc_tmp = np.tile(
-            instrument.mie_table[hyd_type]["beta_p"].values,
-            (num_subcolumns, 1)) * N_D.T
-        moment_denom = np.trapz(Calc_tmp, x=p_diam, axis=1).astype('float64')
-        v_tmp = vel_param_a[hyd_type] * p_diam ** vel_param_b[hyd_type]
-        v_tmp = -v_tmp.magnitude.astype('float64')
-        Calc_tmp2 = (v_tmp - np.tile(Vd_tot[:, tt, k], (num_diam, 1)).T) ** 2 * Calc_tmp.astype('float64')
-        sigma_d_numer[:, k] = np.trapz(Calc_tmp2, x=p_diam, axis=1)
-
-    return sigma_d_numer, moment_denom
-
-
-def _calc_sigma_d_tot(tt, num_subcolumns, v_tmp, N_0, lambdas, mu,
-                      total_hydrometeor, vd_tot, sub_q_array, p_diam, beta_p, rhoe,
-                      hyd_type):
-    Dims = vd_tot.shape
-    sigma_d_numer = np.zeros((Dims[0], Dims[2]), dtype='float64')
-    moment_denom = np.zeros((Dims[0], Dims[2]), dtype='float64')
-    num_diam = len(p_diam)
-    mu = mu.max()
-    if tt % 50 == 0:
-        print('Stratiform moment for class progress: %d/%d' % (tt, Dims[1]))
-    for k in range(Dims[2]):
-        if np.all(total_hydrometeor[tt, k] == 0):
-            continue
-        N_0_tmp = N_0[:, tt, k]
-        lambda_tmp = lambdas[:, tt, k]
-        if np.all(np.isnan(N_0_tmp)):
-            continue
-        N_D = []
-        for i in range(Dims[0]):
-            N_D.append(N_0_tmp[i] * p_diam ** mu * np.exp(-lambda_tmp[i] * p_diam))
-        N_D = np.stack(N_D, axis=1).astype('float64')
-        Calc_tmp = np.tile(beta_p, (num_subcolumns, 1)) * N_D.T
-        moment_denom = np.trapz(Calc_tmp, x=p_diam, axis=1).astype('float64')
-        if rhoe is not None:
-            if isinstance(v_tmp, str):
-                v_tmp2 = calc_velocity_nssl(rhoe[tt, k], p_diam, hyd_type)
-            else:
-                v_tmp2 = v_tmp
-        else:
-            v_tmp2 = v_tmp
-        Calc_tmp2 = (v_tmp2 - np.tile(vd_tot[:, tt, k], (num_diam, 1)).T) ** 2 * Calc_tmp.astype('float64')
-        Calc_tmp2 = np.trapz(Calc_tmp2, x=p_diam, axis=1)
-        sigma_d_numer[:, k] = np.where(sub_q_array[:, tt, k] == 0, 0, Calc_tmp2)
-
-    return sigma_d_numer, moment_denom
-
-
-def _calculate_observables_liquid(tt, total_hydrometeor, N_0, lambdas, mu,
-                                  alpha_p, beta_p, v_tmp, num_subcolumns, instrument, p_diam):
-    height_dims = N_0.shape[2]
-    V_d_numer_tot = np.zeros((N_0.shape[0], height_dims))
-    V_d = np.zeros((N_0.shape[0], height_dims))
-    Ze = np.zeros_like(V_d)
-    Zv = np.zeros_like(V_d)
-    sigma_d = np.zeros_like(V_d)
-    moment_denom_tot = np.zeros_like(V_d_numer_tot)
-    hyd_ext = np.zeros_like(V_d_numer_tot)
-    num_diam = len(p_diam)
-    if tt % 50 == 0:
-        print("Processing column %d/%d" % (tt, N_0.shape[1]))
-    np.seterr(all="ignore")
-    for k in range(height_dims):
-        if np.all(total_hydrometeor[tt, k] == 0):
-            continue
-        if num_subcolumns > 1:
-            N_0_tmp = np.squeeze(N_0[:, tt, k])
-            lambda_tmp = np.squeeze(lambdas[:, tt, k])
-            mu_temp = np.squeeze(mu[:, tt, k])
-        else:
-            N_0_tmp = N_0[:, tt, k]
-            lambda_tmp = lambdas[:, tt, k]
-            mu_temp = mu[:, tt, k]
-        if np.all([np.all(np.isnan(x)) for x in N_0_tmp]):
-            continue
-
-        N_D = []
-        for i in range(N_0_tmp.shape[0]):
-            N_D.append(N_0_tmp[i] * p_diam ** mu_temp[i] * np.exp(-lambda_tmp[i] * p_diam))
-
-        N_D = np.stack(N_D, axis=0)
-        Calc_tmp = beta_p * N_D
-        tmp_od = np.trapz(alpha_p * N_D, x=p_diam, axis=1)
-        moment_denom = np.trapz(Calc_tmp, x=p_diam, axis=1).astype('float64')
-        Ze[:, k] = \
-            (moment_denom * instrument.wavelength ** 4) / (instrument.K_w * np.pi ** 5) * 1e-6
-        Calc_tmp2 = v_tmp * Calc_tmp.astype('float64')
-        V_d_numer = np.trapz(Calc_tmp2, x=p_diam, axis=1)
-        V_d[:, k] = V_d_numer / moment_denom
-        Calc_tmp2 = (v_tmp - np.tile(V_d[:, k], (num_diam, 1)).T) ** 2 * Calc_tmp
-        sigma_d_numer = np.trapz(Calc_tmp2, x=p_diam, axis=1)
-        sigma_d[:, k] = np.sqrt(sigma_d_numer / moment_denom)
-        V_d_numer_tot[:, k] += V_d_numer
-        moment_denom_tot[:, k] += moment_denom
-        hyd_ext[:, k] += tmp_od
-
-    return V_d_numer_tot, moment_denom_tot, hyd_ext, Ze, V_d, sigma_d
-
-
-def _calculate_other_observables(tt, total_hydrometeor, N_0, lambdas,
-                                 num_subcolumns, beta_p, alpha_p, v_tmp, wavelength,
-                                 K_w, sub_q_array, hyd_type, p_diam, beta_pv,
-                                 rhoe):
-    Dims = sub_q_array.shape
-    if tt % 100 == 0:
-        print("Processing column %d/%d" % (tt, Dims[1]))
-    Ze = np.zeros((num_subcolumns, Dims[2]))
-    Zv = np.zeros((num_subcolumns, Dims[2]))
-    V_d = np.zeros_like(Ze)
-    sigma_d = np.zeros_like(Ze)
-    V_d_numer_tot = np.zeros_like(Ze)
-    moment_denom_tot = np.zeros_like(Ze)
-    hyd_ext = np.zeros_like(Ze)
-    for k in range(Dims[2]):
-        if np.all(total_hydrometeor[tt, k] == 0):
-            continue
-
-        num_diam = len(p_diam)
-        N_D = []
-        for i in range(V_d.shape[0]):
-            N_0_tmp = N_0[i, tt, k]
-            lambda_tmp = lambdas[i, tt, k]
-            N_D.append(N_0_tmp * np.exp(-lambda_tmp * p_diam))
-        N_D = np.stack(N_D, axis=0)
-        Calc_tmp = np.tile(beta_p, (num_subcolumns, 1)) * N_D
-        tmp_od = np.tile(alpha_p, (num_subcolumns, 1)) * N_D
-        tmp_od = np.trapz(tmp_od, x=p_diam, axis=1)
-        tmp_od = np.where(sub_q_array[:, tt, k] == 0, 0, tmp_od)
-        moment_denom = np.trapz(Calc_tmp, x=p_diam, axis=1)
-        moment_denom = np.where(sub_q_array[:, tt, k] == 0, 0, moment_denom)
-        Ze[:, k] = \
-            (moment_denom * wavelength ** 4) / (K_w * np.pi ** 5) * 1e-6
-        if beta_pv is not None:
-            Calc_tmp = np.tile(beta_pv, (num_subcolumns, 1)) * N_D
-            moment_denom = np.trapz(Calc_tmp, x=p_diam, axis=1).astype('float64')
-            Zv[:, k] = \
-                (moment_denom * wavelength ** 4) / (K_w * np.pi ** 5) * 1e-6
-        else:
-            Zv[:, k] = np.nan
-        if rhoe is not None and isinstance(v_tmp, str):
-            v_tmp = calc_velocity_nssl(rhoe[tt, k], p_diam, hyd_type)
-        Calc_tmp2 = Calc_tmp * v_tmp
-        V_d_numer = np.trapz(Calc_tmp2, axis=1, x=p_diam)
-        V_d_numer = np.where(sub_q_array[:, tt, k] == 0, 0, V_d_numer)
-        V_d[:, k] = V_d_numer / moment_denom
-        Calc_tmp2 = (v_tmp - np.tile(V_d[:, k], (num_diam, 1)).T) ** 2 * Calc_tmp
-        Calc_tmp2 = np.trapz(Calc_tmp2, axis=1, x=p_diam)
-        sigma_d_numer = np.where(sub_q_array[:, tt, k] == 0, 0, Calc_tmp2)
-        sigma_d[:, k] = np.sqrt(sigma_d_numer / moment_denom)
-        V_d_numer_tot[:, k] += V_d_numer
-        moment_denom_tot[:, k] += moment_denom
-        hyd_ext[:, k] += tmp_od
-
-    return V_d_numer_tot, moment_denom_tot, hyd_ext, Ze, V_d, sigma_d, Zv
+def _combine_sigma_d_numer(moment_denom_a, V_d_numer_a, sigma_d_numer_a,
+                           moment_denom_b, V_d_numer_b, sigma_d_numer_b):
+    """
+    Combines the spectral width numerators (backscatter-weighted velocity variance
+    integrals about each population's own mean Doppler velocity) of two hydrometeor
+    populations into the numerator of the combined population.
+
+    The numerators are merged using the first moments only (parallel axis theorem),
+    so the total spectral width is accumulated in the same pass as Ze and Vd without
+    re-integrating the PSDs around the total mean Doppler velocity.
+
+    Returns
+    -------
+    sigma_d_numer: ndarray
+        The spectral width numerator of the combined population.
+    """
+    moment_denom = moment_denom_a + moment_denom_b
+    both = np.logical_and(moment_denom_a > 0, moment_denom_b > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta_V_d = V_d_numer_b / moment_denom_b - V_d_numer_a / moment_denom_a
+        cross_term = np.where(
+            both, delta_V_d ** 2 * moment_denom_a * moment_denom_b / moment_denom, 0)
+    return sigma_d_numer_a + sigma_d_numer_b + cross_term
+
+
+def _calc_radar_micro_cell_block(edges, N_0_cells, lambda_cells, mu_cells, p_diam, beta_p, alpha_p,
+                                 v_tmp, rhoe_cells, hyd_type):
+    j, ind_max = edges
+    rhoe_block = None if rhoe_cells is None else rhoe_cells[j:ind_max]
+    return _calc_radar_micro_block(
+        N_0_cells[j:ind_max], lambda_cells[j:ind_max], mu_cells[j:ind_max],
+        p_diam, beta_p, alpha_p, v_tmp, rhoe_block, hyd_type)
+
+
+def _calc_radar_micro_block(N_0, lambdas, mu, p_diam, beta_p, alpha_p, v_tmp,
+                            rhoe=None, hyd_type=None):
+    """
+    Evaluates the gamma PSD and the radar moment integrals for a block of cells.
+
+    Parameters
+    ----------
+    N_0, lambdas, mu: ndarray
+        1D arrays of the PSD intercept, slope, and dispersion in each cell.
+    p_diam: ndarray
+        The particle diameter grid of the scattering LUT.
+    beta_p, alpha_p: ndarray
+        Backscattering and extinction cross sections on the p_diam grid.
+    v_tmp: ndarray or str
+        Terminal velocity on the p_diam grid or 'variable' when the velocity
+        depends on the effective density in each cell (NSSL).
+    rhoe: ndarray or None
+        1D array of the effective density in each cell when v_tmp is 'variable'.
+    hyd_type: str or None
+        The hydrometeor class (used for the NSSL velocity calculation).
+
+    Returns
+    -------
+    moment_denom, V_d_numer, sigma_d_numer, tmp_od: ndarray
+        1D arrays of the backscatter, velocity-weighted backscatter, and
+        velocity variance-weighted backscatter integrals, and the extinction integral.
+    """
+    if isinstance(v_tmp, str):
+        v_tmp = calc_velocity_nssl(rhoe[:, np.newaxis], p_diam[np.newaxis, :], hyd_type)
+        v_tmp = np.broadcast_to(v_tmp, (N_0.size, p_diam.size))
+    N_D = N_0[:, np.newaxis] * p_diam ** mu[:, np.newaxis] * np.exp(-lambdas[:, np.newaxis] * p_diam)
+    tmp_od = np.trapz(alpha_p * N_D, x=p_diam, axis=1)
+    Calc_tmp = beta_p * N_D
+    del N_D
+    moment_denom = np.trapz(Calc_tmp, x=p_diam, axis=1)
+    V_d_numer = np.trapz(v_tmp * Calc_tmp, x=p_diam, axis=1)
+    V_d = V_d_numer / moment_denom
+    sigma_d_numer = np.trapz((v_tmp - V_d[:, np.newaxis]) ** 2 * Calc_tmp, x=p_diam, axis=1)
+
+    return moment_denom, V_d_numer, sigma_d_numer, tmp_od
+
+
+def _calc_radar_micro_batched(N_0, lambdas, mu, total_hydrometeor, sub_q_array, p_diam,
+                              beta_p, alpha_p, v_tmp, wavelength, K_w, hyd_type, rhoe=None,
+                              block_size=None, parallel=True, chunk=None, psd_table=None, cells=None):
+    """
+    Calculates the radar moments of a hydrometeor class for all (subcolumn, time, height)
+    cells by evaluating the PSD integrals in fixed-size blocks of cells.
+
+    Cells in (time, height) columns without the hydrometeor are skipped. For the cloud
+    liquid class the PSD follows the gamma distribution with the dispersion in mu,
+    whereas for all other classes an exponential PSD is assumed and the moments are
+    zeroed in subcolumns where the class mixing ratio is 0 (sub_q_array). If a PSD
+    integral table is given, the integrals are interpolated from it and only cells
+    outside of the table are integrated. If the flat indices of the cells with the
+    hydrometeor are given (cells), only these cells are considered.
+
+    Returns
+    -------
+    V_d_numer, moment_denom, sigma_d_numer, hyd_ext, Ze, V_d, sigma_d: ndarray
+        Arrays with the shape of N_0.
+    """
+    Dims = N_0.shape
+    V_d_numer = np.zeros(Dims)
+    moment_denom = np.zeros(Dims)
+    hyd_ext = np.zeros(Dims)
+    sigma_d_numer = np.zeros(Dims)
+
+    in_column = total_hydrometeor != 0
+    if hyd_type == "cl":
+        in_column = np.logical_and(in_column, ~np.all(np.isnan(N_0), axis=0))
+    in_column_cells = in_column
+    in_column = np.broadcast_to(in_column, Dims)
+
+    # Cells without a valid PSD are NaN in all integrals, so only cells with one are evaluated.
+    V_d_numer[in_column] = np.nan
+    moment_denom[in_column] = np.nan
+    hyd_ext[in_column] = np.nan
+    sigma_d_numer[in_column] = np.nan
+    if cells is None:
+        valid = np.logical_and(np.isfinite(N_0), np.isfinite(lambdas))
+        cell_inds = np.nonzero(np.logical_and(in_column, valid))
+    else:
+        cells = cells[in_column_cells.ravel()[cells % in_column_cells.size]]
+        cells = cells[np.logical_and(np.isfinite(N_0.ravel()[cells]), np.isfinite(lambdas.ravel()[cells]))]
+        cell_inds = np.unravel_index(cells, Dims)
+
+    if hyd_type == "cl":
+        mu_cells = mu[cell_inds]
+    else:
+        mu_cells = np.zeros(cell_inds[0].size)
+    N_0_cells = N_0[cell_inds]
+    lambda_cells = lambdas[cell_inds]
+    if isinstance(v_tmp, str):
+        rhoe_cells = rhoe[cell_inds[1], cell_inds[2]]
+    else:
+        rhoe_cells = None
+
+    if psd_table is not None:
+        table_vals = interp_psd_integral_table(psd_table, N_0_cells, lambda_cells, mu_cells)
+        moment_denom[cell_inds] = table_vals[0]
+        V_d_numer[cell_inds] = table_vals[1]
+        sigma_d_numer[cell_inds] = table_vals[2]
+        hyd_ext[cell_inds] = table_vals[3]
+        outside = ~np.isfinite(table_vals[0])
+        cell_inds = tuple([x[outside] for x in cell_inds])
+        N_0_cells = N_0_cells[outside]
+        lambda_cells = lambda_cells[outside]
+        mu_cells = mu_cells[outside]
+        del table_vals
+
+    executor = get_executor(parallel)
+    if block_size is None:
+        block_size = get_block_size(N_0_cells.size, 8 * p_diam.size, executor)
+    block_edges = [(i, min(i + block_size, N_0_cells.size))
+                   for i in range(0, N_0_cells.size, block_size)]
+    if len(block_edges) <= 1:
+        executor = get_executor(False)
+    my_tuple = executor.map(_calc_radar_micro_cell_block, block_edges, shared=dict(
+        N_0_cells=N_0_cells, lambda_cells=lambda_cells, mu_cells=mu_cells, p_diam=p_diam, beta_p=beta_p,
+        alpha_p=alpha_p, v_tmp=v_tmp, rhoe_cells=rhoe_cells, hyd_type=hyd_type), chunk=chunk)
+
+    if len(my_tuple) > 0:
+        moment_denom[cell_inds] = np.concatenate([x[0] for x in my_tuple])
+        V_d_numer[cell_inds] = np.concatenate([x[1] for x in my_tuple])
+        sigma_d_numer[cell_inds] = np.concatenate([x[2] for x in my_tuple])
+        hyd_ext[cell_inds] = np.concatenate([x[3] for x in my_tuple])
+    del my_tuple
+
+    if hyd_type != "cl":
+        no_q = np.logical_and(in_column, sub_q_array == 0)
+        moment_denom[no_q] = 0
+        V_d_numer[no_q] = 0
+        sigma_d_numer[no_q] = 0
+        hyd_ext[no_q] = 0
+
+    Ze = (moment_denom * wavelength ** 4) / (K_w * np.pi ** 5) * 1e-6
+    with np.errstate(divide="ignore", invalid="ignore"):
+        V_d = np.where(in_column, V_d_numer / moment_denom, 0)
+        sigma_d = np.where(in_column, np.sqrt(sigma_d_numer / moment_denom), 0)
+
+    return V_d_numer, moment_denom, sigma_d_numer, hyd_ext, Ze, V_d, sigma_d
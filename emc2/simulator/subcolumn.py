@@ -1,8 +1,25 @@
 import numpy as np
 import xarray as xr
-import dask.bag as db
+import weakref
+import zlib
+from collections import namedtuple
 from time import time
 
+from .executor import get_executor, get_block_size
+
+
+class _ActiveCells(namedtuple("_ActiveCells", ["cells", "source", "shape"])):
+    """
+    Cached active cells of a subcolumn mixing ratio field (see get_active_cells).
+    A weak reference to the source array is dropped when pickled, such that the cells
+    are found again after unpickling.
+    """
+    __slots__ = ()
+
+    def __reduce__(self):
+        source = None if isinstance(self.source, weakref.ref) else self.source
+        return (_ActiveCells, (self.cells, source, self.shape))
+
 
 def set_convective_sub_col_frac(model, hyd_type, N_columns=None, use_rad_logic=True):
     """
@@ -82,7 +99,8 @@ def set_convective_sub_col_frac(model, hyd_type, N_columns=None, use_rad_logic=T
     return model
 
 
-def set_stratiform_sub_col_frac(model, N_columns=None, use_rad_logic=True, parallel=True, chunk=None):
+def set_stratiform_sub_col_frac(model, N_columns=None, use_rad_logic=True, parallel=True, chunk=None,
+                                seed=None):
     """
     Sets the hydrometeor fraction due to stratiform cloud particles in each subcolumn.
 
@@ -100,13 +118,19 @@ def set_stratiform_sub_col_frac(model, N_columns=None, use_rad_logic=True, paral
         Therefore, after those are generated this must either be
         equal to None or the number of subcolumns in the model. Setting this to None will
         use the number of subcolumns in the model parameter.
-    parallel: bool
-        If True, use parallelism in calculating lidar parameters.
+    parallel: bool, str or :py:class:`emc2.simulator.executor.Executor`
+        The executor of the column blocks (see :py:func:`emc2.simulator.executor.get_executor`).
+        If True, use dask. If False, process the blocks serially.
     chunk: int or None
-        The number of entries to process in one parallel loop. None will send all of
-        the entries to the Dask worker queue at once. Sometimes, Dask will freeze if
-        too many tasks are sent at once due to memory issues, so adjusting this number
-        might be needed if that happens.
+        The number of time columns allocated together in one block (each block is a
+        parallel task when parallel is True). None will tune the block size from the array
+        sizes, the available memory, and the number of workers (blocks of at most about
+        2**22 subcolumn voxels). Reduce this number to limit memory usage.
+    seed: int or None
+        The seed of the random number generators. If an int, each time column uses an
+        independent generator derived from the seed and the column index, so that the
+        output does not depend on parallel or chunk. If None, the global numpy random
+        state is used.
 
     Returns
     -------
@@ -161,42 +185,17 @@ def set_stratiform_sub_col_frac(model, N_columns=None, use_rad_logic=True, paral
         data_frac2 = np.round(data_frac2.values * N_columns).astype(int)
         full_overcast_cl_ci = 0
 
-        is_cloud = np.logical_or(data_frac1 > 0, data_frac2 > 0)
-        is_cloud_one_above = np.roll(is_cloud, -1, axis=1)
-        overlapping_cloud = np.logical_and(is_cloud, is_cloud_one_above)
-
-        cld_2_assigns = np.stack([data_frac1, data_frac2], axis=0)
-        I_min = np.argmin(cld_2_assigns, axis=0)
-        I_max = np.argmax(cld_2_assigns, axis=0)
-
-        _allocate_strat_sub_cols = lambda x: _allocate_strat_sub_col(
-            x, cld_2_assigns, I_min, I_max, conv_profs,
-            full_overcast_cl_ci, data_frac1, data_frac2, N_columns, overlapping_cloud)
-
-        t_dim = data_frac1.shape[0]
-        if parallel:
+        executor = get_executor(parallel)
+        t_blocks = _get_time_blocks(data_frac1.shape, N_columns, chunk, executor)
+        if executor.parallel:
             print("Now performing parallel stratiform hydrometeor allocation in subcolumns")
-            if chunk is None:
-                tt_bag = db.from_sequence(np.arange(0, t_dim, 1))
-                my_tuple = tt_bag.map(_allocate_strat_sub_cols).compute()
-            else:
-                my_tuple = []
-                j = 0
-                while j < t_dim:
-                    if j + chunk >= t_dim:
-                        ind_max = t_dim
-                    else:
-                        ind_max = j + chunk
-                    print("Stage 1 of 2: Processing columns %d-%d out of %d" % (j, ind_max, t_dim))
-                    tt_bag = db.from_sequence(np.arange(j, ind_max, 1))
-                    my_tuple += tt_bag.map(_allocate_strat_sub_cols).compute()
-                    j += chunk
-        else:
-            my_tuple = [x for x in map(_allocate_strat_sub_cols, np.arange(0, t_dim, 1))]
+        my_tuple = executor.map(_allocate_strat_sub_col_block, t_blocks, shared=dict(
+            data_frac1=data_frac1, data_frac2=data_frac2, conv_profs=conv_profs, N_columns=N_columns,
+            seed=seed, time_offset=model.time_offset))
 
         full_overcast_cl_ci += np.sum([x[0] for x in my_tuple])
-        strat_profs1 = np.stack([x[1] for x in my_tuple], axis=1)
-        strat_profs2 = np.stack([x[2] for x in my_tuple], axis=1)
+        strat_profs1 = np.concatenate([x[1] for x in my_tuple], axis=1)
+        strat_profs2 = np.concatenate([x[2] for x in my_tuple], axis=1)
 
         print("Fully overcast cl & ci in %s voxels" % full_overcast_cl_ci)
         model.ds['strat_frac_subcolumns_cl'] = xr.DataArray(strat_profs1,
@@ -221,7 +220,7 @@ def set_stratiform_sub_col_frac(model, N_columns=None, use_rad_logic=True, paral
 
 def set_precip_sub_col_frac(model, is_conv, N_columns=None, use_rad_logic=True,
                             parallel=True, chunk=None, 
-                            precip_types=["pl", "pi"]):
+                            precip_types=["pl", "pi"], batched=True, seed=None):
     """
     Sets the hydrometeor fraction due to precipitation in each subcolumn. This
     module works for both stratiform and convective precipitation.
@@ -241,15 +240,24 @@ def set_precip_sub_col_frac(model, is_conv, N_columns=None, use_rad_logic=True,
         When True using the cloud fraction utilized in a model radiative scheme. Otherwise,
         using the microphysics scheme (note that these schemes do not necessarily
         use exactly the same cloud fraction logic).
-    parallel: bool
-        If True, use parallelism in calculating lidar parameters.
+    parallel: bool, str or :py:class:`emc2.simulator.executor.Executor`
+        The executor of the column loop (see :py:func:`emc2.simulator.executor.get_executor`).
+        If True, use dask. If False, process the columns serially.
     chunk: int or None
-        The number of entries to process in one parallel loop. None will send all of
-        the entries to the Dask worker queue at once. Sometimes, Dask will freeze if
-        too many tasks are sent at once due to memory issues, so adjusting this number
-        might be needed if that happens.
-    ice_hyd_type: str
-        The ice hydrometeor type to include in the subcolumn distribution for precipitation
+        The number of time columns allocated together in one block (each block is a
+        parallel task when parallel is True). None will tune the block size from the array
+        sizes, the available memory, and the number of workers (blocks of at most about
+        2**22 subcolumn voxels). Reduce this number to limit memory usage.
+    precip_types: list of str
+        The precipitation hydrometeor types to include in the subcolumn distribution.
+    batched: bool
+        If True, allocate the precipitation in all of the time columns of a block at once,
+        level by level. If False, use the per-column allocator.
+    seed: int or None
+        The seed of the random number generators. If an int, each time column uses an
+        independent generator derived from the seed and the column index, so that the
+        output does not depend on parallel or chunk. If None, the global numpy random
+        state is used.
 
     Returns
     -------
@@ -344,42 +352,31 @@ def set_precip_sub_col_frac(model, is_conv, N_columns=None, use_rad_logic=True,
             data_frac[i] = np.round(data_frac[i] * model.num_subcolumns).astype(int)
         strat_profs = np.logical_or(model.ds[in_prof_cloud_name_ice].values,
                                     model.ds[in_prof_cloud_name_liq].values)
-        is_cloud = data_frac[0] > 0
-        for i in range(1, len(data_frac)):
-            is_cloud = np.logical_or(is_cloud, data_frac[i] > 0)
-        is_cloud_one_above = np.roll(is_cloud, -1, axis=1)
-        is_cloud_one_above[:, -1] = False
-        overlapping_cloud = np.logical_and(is_cloud, is_cloud_one_above)
-        precip_exist = np.stack([frac > 0 for frac in data_frac])
-        PF_val = np.max(np.stack(data_frac), axis=0)
-        cond = [strat_profs, ~strat_profs]
-        _allocate_precip_sub_cols = lambda x: _allocate_precip_sub_col(
-            x, cond, N_columns, data_frac, PF_val,
-            precip_exist, full_overcast_pl_pi, overlapping_cloud)
-
-        t_dim = data_frac[0].shape[0]
-        if parallel:
+        executor = get_executor(parallel)
+        if executor.parallel:
             print("Now performing parallel %s precipitation allocation in subcolumns" % precip_type)
-            if chunk is None:
-                tt_bag = db.from_sequence(np.arange(0, t_dim, 1))
-                my_tuple = tt_bag.map(_allocate_precip_sub_cols).compute()
-            else:
-                my_tuple = []
-                j = 0
-                while j < t_dim:
-                    if j + chunk >= t_dim:
-                        ind_max = t_dim
-                    else:
-                        ind_max = j + chunk
-                    print("Stage 1 of 2: Processing columns %d-%d out of %d" % (j, ind_max, t_dim))
-                    tt_bag = db.from_sequence(np.arange(j, ind_max, 1))
-                    my_tuple += tt_bag.map(_allocate_precip_sub_cols).compute()
-                    j += chunk
+        t_blocks = _get_time_blocks(strat_profs.shape[1:], N_columns, chunk, executor)
+        if batched:
+            my_tuple = executor.map(_allocate_precip_sub_col_block, t_blocks, shared=dict(
+                data_frac=np.stack(data_frac), strat_profs=strat_profs, N_columns=N_columns,
+                seed=seed, time_offset=model.time_offset, stream=precip_type + "_precip_frac"))
         else:
-            my_tuple = [x for x in map(_allocate_precip_sub_cols, np.arange(0, t_dim, 1))]
+            is_cloud = data_frac[0] > 0
+            for i in range(1, len(data_frac)):
+                is_cloud = np.logical_or(is_cloud, data_frac[i] > 0)
+            is_cloud_one_above = np.roll(is_cloud, -1, axis=1)
+            is_cloud_one_above[:, -1] = False
+            overlapping_cloud = np.logical_and(is_cloud, is_cloud_one_above)
+            precip_exist = np.stack([frac > 0 for frac in data_frac])
+            PF_val = np.max(np.stack(data_frac), axis=0)
+            my_tuple = executor.map(_allocate_precip_sub_col_columns, t_blocks, shared=dict(
+                strat_profs=strat_profs, N_columns=N_columns, data_frac=np.stack(data_frac), PF_val=PF_val,
+                precip_exist=precip_exist, full_overcast_pl_pi=full_overcast_pl_pi,
+                overlapping_cloud=overlapping_cloud, seed=seed, time_offset=model.time_offset,
+                stream=precip_type + "_precip_frac"))
 
         full_overcast_pl_pi += np.sum([x[0] for x in my_tuple])
-        p_strat_profs = np.stack([x[1] for x in my_tuple], axis=1)
+        p_strat_profs = np.concatenate([x[1] for x in my_tuple], axis=1)
         typ_string = ""
         for typ in precip_types:
             typ_string = typ_string + " & " + typ
@@ -403,7 +400,7 @@ def set_precip_sub_col_frac(model, is_conv, N_columns=None, use_rad_logic=True,
 
 
 def set_q_n(model, hyd_type, is_conv=True, qc_flag=False, inv_rel_var=1, use_rad_logic=True,
-            parallel=True, chunk=None):
+            parallel=True, chunk=None, seed=None):
     """
 
     This function distributes the mixing ratio and number concentration into the subcolumns.
@@ -428,13 +425,19 @@ def set_q_n(model, hyd_type, is_conv=True, qc_flag=False, inv_rel_var=1, use_rad
         uniformly distributed qc (setting qc_flag to False) to maintain radiation scheme logic.
         Otherwise, using the microphysics scheme (note that these schemes do not necessarily
         use exactly the same cloud fraction logic).
-    parallel: bool
-        If True, use parallelism in calculating lidar parameters.
+    parallel: bool, str or :py:class:`emc2.simulator.executor.Executor`
+        The executor of the column blocks (see :py:func:`emc2.simulator.executor.get_executor`).
+        If True, use dask. If False, process the blocks serially.
     chunk: int or None
-        The number of entries to process in one parallel loop. None will send all of
-        the entries to the Dask worker queue at once. Sometimes, Dask will freeze if
-        too many tasks are sent at once due to memory issues, so adjusting this number
-        might be needed if that happens.
+        The number of time columns processed together in one block when distributing q
+        with qc_flag (each block is a parallel task when parallel is True). None will tune
+        the block size from the array sizes, the available memory, and the number of workers
+        (blocks of at most about 2**22 subcolumn voxels).
+    seed: int or None
+        The seed of the random number generators. If an int, each time column uses an
+        independent generator derived from the seed and the column index, so that the
+        output does not depend on parallel or chunk. If None, the global numpy random
+        state is used.
 
     Returns
     -------
@@ -458,30 +461,29 @@ def set_q_n(model, hyd_type, is_conv=True, qc_flag=False, inv_rel_var=1, use_rad
         frac_fieldname = 'strat_frac_subcolumns_%s' % hyd_type
         if use_rad_logic:
             method_str = "Radiation logic"
-            data_frac = model.ds[model.strat_frac_names_for_rad[hyd_type]].astype('float64').values
+            data_frac = model.ds[model.strat_frac_names_for_rad[hyd_type]].astype(model.precision).values
             data_frac = np.where(model.ds[model.q_names_stratiform[hyd_type]].values > 0, data_frac, 0)
         else:
             method_str = "Microphysics logic"
-            data_frac = model.ds[model.strat_frac_names[hyd_type]].astype('float64').values
-        N_profs = model.ds[model.N_field[hyd_type]].astype('float64').values
+            data_frac = model.ds[model.strat_frac_names[hyd_type]].astype(model.precision).values
+        N_profs = model.ds[model.N_field[hyd_type]].astype(model.precision).values
         N_profs = N_profs / data_frac
         sub_data_frac = model.ds[frac_fieldname].values
-        N_profs = np.tile(N_profs, (model.num_subcolumns, 1, 1))
-        N_profs = np.where(sub_data_frac, N_profs, 0)
-        q_array = model.ds[model.q_names_stratiform[hyd_type]].astype('float64').values
+        N_profs = np.where(sub_data_frac, N_profs[np.newaxis, :, :], 0)
+        q_array = model.ds[model.q_names_stratiform[hyd_type]].astype(model.precision).values
         q_name = "strat_q_subcolumns_%s" % hyd_type
         n_name = "strat_n_subcolumns_%s" % hyd_type
     else:
         frac_fieldname = 'conv_frac_subcolumns_%s' % hyd_type
         if use_rad_logic:
             method_str = "Radiation logic"
-            data_frac = model.ds[model.conv_frac_names_for_rad[hyd_type]].astype('float64').values
+            data_frac = model.ds[model.conv_frac_names_for_rad[hyd_type]].astype(model.precision).values
             data_frac = np.where(model.ds[model.q_names_convective[hyd_type]].values > 0, data_frac, 0)
         else:
             method_str = "Microphysics logic"
-            data_frac = model.ds[model.conv_frac_names[hyd_type]].astype('float64').values
+            data_frac = model.ds[model.conv_frac_names[hyd_type]].astype(model.precision).values
         sub_data_frac = model.ds[frac_fieldname]
-        q_array = model.ds[model.q_names_convective[hyd_type]].astype('float64').values
+        q_array = model.ds[model.q_names_convective[hyd_type]].astype(model.precision).values
         q_name = "conv_q_subcolumns_%s" % hyd_type
 
     if model.num_subcolumns == 1:
@@ -490,49 +492,33 @@ def set_q_n(model, hyd_type, is_conv=True, qc_flag=False, inv_rel_var=1, use_rad
         model.ds[q_name] = xr.DataArray(np.tile(q_array, (1, 1, 1)), dims=model.ds[frac_fieldname].dims)
         if not is_conv:
             model.ds[n_name] = xr.DataArray(
-                np.tile(model.ds[model.N_field[hyd_type]].astype('float64').values, (1, 1, 1)),
+                np.tile(model.ds[model.N_field[hyd_type]].astype(model.precision).values, (1, 1, 1)),
                                             dims=model.ds[frac_fieldname].dims)
     else:
         if qc_flag:
             q_ic_mean = np.where(q_array > 0, q_array / data_frac, 0)
             q_ic_mean = np.where(np.isnan(q_ic_mean), 0, q_ic_mean)
-            tot_hyd_in_sub = sub_data_frac.sum(axis=0)
-
-            _distribute_cl_q_n_sub_cols = lambda x: _distribute_cl_q_n(
-                x, sub_data_frac, inv_rel_var, model.num_subcolumns, tot_hyd_in_sub, q_ic_mean)
 
-            t_dim = data_frac.shape[0]
-            if parallel:
+            executor = get_executor(parallel)
+            t_blocks = _get_time_blocks(q_ic_mean.shape, model.num_subcolumns, chunk, executor)
+            if executor.parallel:
                 print("Now distributing q in subcolumns in parallel")
-                if chunk is None:
-                    tt_bag = db.from_sequence(np.arange(0, t_dim, 1))
-                    my_tuple = tt_bag.map(_distribute_cl_q_n_sub_cols).compute()
-                else:
-                    my_tuple = []
-                    j = t_dim - 1
-                    while j >= 0:
-                        if j + chunk > t_dim:
-                            ind_max = t_dim
-                        else:
-                            ind_max = j + chunk
-                        print("Stage 1 of 2: Processing columns %d-%d out of %d" % (j, ind_max, t_dim))
-                        tt_bag = db.from_sequence(np.arange(j, ind_max, 1))
-                        my_tuple += tt_bag.map(_distribute_cl_q_n_sub_cols).compute()
-                        j -= chunk
-            else:
-                my_tuple = [x for x in map(_distribute_cl_q_n_sub_cols, np.arange(0, t_dim, 1))]
+            my_tuple = executor.map(_distribute_cl_q_n_block, t_blocks, shared=dict(
+                sub_data_frac=np.asarray(sub_data_frac), inv_rel_var=inv_rel_var, q_ic_mean=q_ic_mean,
+                seed=seed, time_offset=model.time_offset, stream=q_name))
 
-            q_profs = np.stack([x for x in my_tuple], axis=1)
+            q_profs = np.concatenate(my_tuple, axis=1)
 
         else:
             q_profs = np.where(q_array > 0, q_array / data_frac, 0)
-            q_profs = np.tile(q_profs, (model.num_subcolumns, 1, 1))
-            q_profs = np.where(sub_data_frac, q_profs, 0)
+            q_profs = np.where(sub_data_frac, q_profs[np.newaxis, :, :], 0)
         q_profs = np.where(np.isnan(q_profs), 0, q_profs)
-        model.ds[q_name] = xr.DataArray(q_profs, dims=model.ds[frac_fieldname].dims)
+        model.ds[q_name] = xr.DataArray(q_profs.astype(model.precision, copy=False),
+                                        dims=model.ds[frac_fieldname].dims)
         if not is_conv:
             N_profs = np.where(np.isnan(N_profs), 0, N_profs)
-            model.ds[n_name] = xr.DataArray(N_profs, dims=model.ds[frac_fieldname].dims)
+            model.ds[n_name] = xr.DataArray(N_profs.astype(model.precision, copy=False),
+                                            dims=model.ds[frac_fieldname].dims)
 
     model.ds[q_name].attrs["long_name"] = "q in subcolumns"
     model.ds[q_name].attrs["units"] = r"$kg\ kg^{-1}$"
@@ -541,116 +527,203 @@ def set_q_n(model, hyd_type, is_conv=True, qc_flag=False, inv_rel_var=1, use_rad
         model.ds[n_name].attrs["long_name"] = "N in subcolumns"
         model.ds[n_name].attrs["units"] = r"$cm^{-3}$"
         model.ds[n_name].attrs["Processing method"] = method_str
+    model.active_cells[q_name] = _find_active_cells(model.ds[q_name])
 
     return model
 
 
-def _randperm(x, size=None):
+def get_active_cells(model, hyd_type, is_conv):
+    """
+    Returns the cells of a hydrometeor class with a positive subcolumn mixing ratio.
+
+    The cells are stored in the model by :py:func:`set_q_n`, such that the forward
+    operators only evaluate these cells and scatter the results to the dense
+    (subcolumn, time, height) output fields. Each stored entry remembers the array of the
+    subcolumn mixing ratio it was found in. If the subcolumn mixing ratio was not set by
+    :py:func:`set_q_n` (e.g., loaded from a file), or the field was replaced since (e.g.,
+    by cropping or permuting the model dataset), the cells are found and stored again.
+
+    Parameters
+    ----------
+    model: :func:`emc2.core.Model`
+        The model with the generated subcolumns.
+    hyd_type: str
+        The hydrometeor type.
+    is_conv: bool
+        True for the convective subcolumns.
+
+    Returns
+    -------
+    cells: numpy array
+        The flat indices of the (subcolumn, time, height) cells with a positive mixing ratio.
+    """
+    if is_conv:
+        q_name = "conv_q_subcolumns_%s" % hyd_type
+    else:
+        q_name = "strat_q_subcolumns_%s" % hyd_type
+    q = model.ds[q_name]
+    active_cells = model.active_cells.get(q_name)
+    if active_cells is None or not _is_source(active_cells, q.data):
+        active_cells = _find_active_cells(q)
+        model.active_cells[q_name] = active_cells
+    return active_cells.cells
+
+
+def _find_active_cells(q):
+    """
+    Returns the active cells of a subcolumn mixing ratio DataArray, with a reference to
+    the array they were found in (a weak reference for numpy arrays or the name of a dask
+    array).
+    """
+    data = q.data
+    if isinstance(data, np.ndarray):
+        source = weakref.ref(data)
+    else:
+        source = getattr(data, "name", None)
+    return _ActiveCells(np.flatnonzero(q.values > 0), source, data.shape)
+
+
+def _is_source(active_cells, data):
+    if active_cells.shape != data.shape:
+        return False
+    if isinstance(active_cells.source, weakref.ref):
+        return active_cells.source() is data
+    return active_cells.source is not None and active_cells.source == getattr(data, "name", None)
+
+
+def _scatter_cells(values, cells, shape, fill_value=0., dtype=None):
+    """
+    Scatters the values of a set of cells (flat indices) to a dense array.
+    """
+    out = np.full(shape, fill_value, dtype=values.dtype if dtype is None else dtype)
+    out.ravel()[cells] = values
+    return out
+
+
+def _randperm(x, size=None, rng=None):
+    if rng is None:
+        rng = np.random
     if size is None:
         size = len(x)
-    return np.random.permutation(x)[0:int(size)].astype(int)
+    return rng.permutation(x)[0:int(size)].astype(int)
+
 
+def _get_column_rng(seed, tt, stream):
+    """
+    Returns the random number generator of a time column, or None if seed is None.
+    The generator is seeded by the child of the seed spawned by the column index,
+    with one independent stream for each subcolumn generator step.
+    """
+    if seed is None:
+        return None
+    seed_seq = np.random.SeedSequence(seed, spawn_key=(int(tt), zlib.crc32(stream.encode())))
+    return np.random.Generator(np.random.PCG64(seed_seq))
 
-def _setxor(x, y):
-    first_set = np.setdiff1d(x, y)
-    second_set = np.setdiff1d(y, x)
-    return np.concatenate([first_set, second_set])
 
+def _get_column_rngs(seed, t_inds, stream):
+    if seed is None:
+        return None
+    return [_get_column_rng(seed, tt, stream) for tt in t_inds]
 
-def _allocate_strat_sub_col(tt, cld_2_assigns, I_min, I_max, conv_profs,
-                            full_overcast_cl_ci, data_frac1, data_frac2, N_columns, overlapping_cloud):
 
-    strat_profs = np.zeros((2, N_columns, data_frac1.shape[1]), dtype=bool)
+def _get_rand_keys(rngs, shape):
+    """
+    Returns uniform random keys of a block of time columns with the given shape
+    (time, ...), drawn from the generator of each time column if rngs is not None.
+    """
+    if rngs is None:
+        return np.random.random(shape)
+    return np.stack([rng.random(shape[1:]) for rng in rngs])
 
-    for j in range(data_frac1.shape[1] - 2, -1, -1):
-        cld_2_assign = np.array([data_frac1[tt, j], data_frac2[tt, j]])
-        I_min = np.argmin(cld_2_assign)
-        I_max = np.argmax(cld_2_assign)
-        if cld_2_assign[I_max] == 0:
-            continue
-        if cld_2_assign[I_min] == N_columns:
-            strat_profs[:, :, j] = True
-            full_overcast_cl_ci += 1
-            continue
-        elif I_min == I_max:  # This is the case of cl_frac == ci_frac != 1
-            I_max = 1
-        if overlapping_cloud[tt, j]:
-            overlying_locs = np.zeros((2, strat_profs.shape[1]))
-            overlying_locs1 = np.argwhere(np.logical_and(strat_profs[0, :, j + 1], ~conv_profs[:, tt, j]))
-            overlying_locs2 = np.argwhere(np.logical_and(strat_profs[1, :, j + 1], ~conv_profs[:, tt, j]))
-            overlying_num = np.array([len(overlying_locs1), len(overlying_locs2)], dtype=int)
-            over_diff = abs(overlying_num[1] - overlying_num[0])
-            Iover_min = np.argmin(overlying_num)
-            Iover_max = np.argmax(overlying_num)
-            over_unique_lo = _setxor(overlying_locs1, overlying_locs2)
-
-            if overlying_num[Iover_min] > cld_2_assign[I_max]:
-                if cld_2_assign[I_max] > 0:
-                    rand_locs = _randperm(overlying_num.min(), size=cld_2_assign[I_max])
-                    inds = locals()["overlying_locs%d" % (Iover_min + 1)][rand_locs[0:cld_2_assign[I_min]]]
-                    strat_profs[I_min, inds, j] = True
-                    inds = locals()["overlying_locs%d" % (Iover_min + 1)][rand_locs]
-                    strat_profs[I_max, inds, j] = True
-                cld_2_assign = np.zeros(2)
-            elif overlying_num[Iover_min] > cld_2_assign[I_min]:  # overlying_num[Iover_min] <= cld_2_assign[I_max]
-                if cld_2_assign[I_min] > 0: 
-                    rand_locs = _randperm(overlying_num.min(), size=cld_2_assign[I_min])
-                    inds = locals()["overlying_locs%d" % (Iover_min + 1)][rand_locs]
-                    strat_profs[I_min, inds, j] = True
-                    inds = locals()["overlying_locs%d" % (Iover_min + 1)]
-                    strat_profs[I_max, inds, j] = True
-                cld_2_assign[I_min] = 0
-                cld_2_assign[I_max] -= overlying_num[Iover_min]
-
-                if over_diff > cld_2_assign[I_max]:  # over_n[Iover_min] < cld_2_assign[I_max] < over_n[Iover_max]
-                    rand_locs = _randperm(over_diff, size=cld_2_assign[I_max])
-                    inds = over_unique_lo[rand_locs]
-                    strat_profs[I_max, inds, j] = True
-                    cld_2_assign[I_max] = 0.
-                else:
-                    strat_profs[I_max, over_unique_lo, j] = True
-                    cld_2_assign[I_max] -= over_diff
-            elif overlying_num[Iover_max] > cld_2_assign[I_min]:
-                inds = locals()["overlying_locs%d" % (Iover_min + 1)]
-                strat_profs[I_min, inds, j] = True
-                strat_profs[I_max, inds, j] = True
-                cld_2_assign -= overlying_num[Iover_min]
-
-                if over_diff > cld_2_assign[I_max]:
-                    rand_locs = _randperm(over_diff, size=cld_2_assign[I_max])
-                    inds = over_unique_lo[rand_locs[0:cld_2_assign[I_min]]]
-                    strat_profs[I_min, inds, j] = True
-                    inds = over_unique_lo[rand_locs]
-                    strat_profs[I_max, inds, j] = True
-                    cld_2_assign = np.zeros(2)
-                else:
-                    if cld_2_assign[I_min] > 0:
-                        rand_locs = _randperm(over_diff, size=cld_2_assign[I_min])
-                        inds = over_unique_lo[rand_locs]
-                        strat_profs[I_min, inds, j] = True
-                    cld_2_assign[I_min] = 0
-                    strat_profs[I_max, over_unique_lo, j] = True
-                    cld_2_assign[I_max] -= over_diff
-            else:
-                inds = locals()["overlying_locs%d" % (Iover_max + 1)]
-                strat_profs[I_min, inds, j] = True
-                strat_profs[I_max, inds, j] = True
-                cld_2_assign -= overlying_num[Iover_max]
 
-        if cld_2_assign[I_max] > 0:
-            sprof = strat_profs[I_max, :, :]
-            free_locs_max = np.where(np.logical_and(~sprof[:, j], ~conv_profs[:, tt, j]))[0]
-            free_num = len(free_locs_max)
-            rand_locs = _randperm(free_num, size=int(cld_2_assign[I_max]))
-            strat_profs[I_max, free_locs_max[rand_locs], j] = True
-            if cld_2_assign[I_min] > 0.:
-                strat_profs[I_min, free_locs_max[rand_locs[0:cld_2_assign[I_min]]], j] = True
+def _get_time_blocks(frac_shape, N_columns, chunk=None, executor=None):
+    """
+    Returns the (start, end) time indices of the blocks of time columns. If chunk is None,
+    the block size is tuned for blocks of at most about 2**22 subcolumn voxels (see
+    :py:func:`emc2.simulator.executor.get_block_size`).
+    """
+    t_dim = frac_shape[0]
+    if chunk is None:
+        chunk = get_block_size(t_dim, 8 * N_columns * int(np.prod(frac_shape[1:])), executor)
+    return [(j, min(j + chunk, t_dim)) for j in range(0, t_dim, chunk)]
+
 
-    return full_overcast_cl_ci, strat_profs[0, :, :], strat_profs[1, :, :]
+def _allocate_strat_sub_col(data_frac1, data_frac2, conv_profs, N_columns, rngs=None):
+    """
+    Allocates the stratiform cloud liquid and ice in the subcolumns of a block of time columns
+    using maximum-random overlap. Each height level is processed for all time columns at once.
+
+    At each level, the subcolumns are ranked by a random key per subcolumn and time column,
+    offset by the number of classes present in the overlying level, so that subcolumns with
+    overlying cloud are filled first (maximum overlap) and the remaining subcolumns are filled
+    at random (random overlap). Both classes take the highest-ranked subcolumns, so the class
+    with the smaller fraction is nested in the class with the larger fraction. Subcolumns
+    occupied by convection are skipped unless the level is fully overcast.
+
+    Parameters
+    ----------
+    data_frac1, data_frac2: numpy array
+        The number of subcolumns to allocate to cloud liquid and ice, respectively
+        (time, height).
+    conv_profs: numpy array
+        True where a subcolumn is occupied by convective cloud (subcolumn, time, height).
+    N_columns: int
+        The number of subcolumns.
+    rngs: list of numpy.random.Generator or None
+        The random number generator of each time column. None to use the global numpy
+        random state.
+
+    Returns
+    -------
+    full_overcast_cl_ci: int
+        The number of fully overcast voxels.
+    strat_profs1, strat_profs2: numpy array
+        The cloud liquid and ice presence in each subcolumn (subcolumn, time, height).
+    """
+    t_dim, z_dim = data_frac1.shape
+    strat_profs = np.zeros((2, N_columns, t_dim, z_dim), dtype=bool)
+    full_overcast = np.minimum(data_frac1, data_frac2) >= N_columns
+    full_overcast[:, -1] = False
+    sub_col_inds = np.tile(np.arange(N_columns), (t_dim, 1))
+    sub_col_rank = np.empty((t_dim, N_columns), dtype=int)
+    all_rand_keys = _get_rand_keys(rngs, (t_dim, z_dim, N_columns))
+    for j in range(z_dim - 2, -1, -1):
+        rand_keys = all_rand_keys[:, j] + strat_profs[:, :, :, j + 1].sum(axis=0).T
+        rand_keys = np.where(conv_profs[:, :, j].T, -1., rand_keys)
+        np.put_along_axis(sub_col_rank, np.argsort(-rand_keys, axis=1), sub_col_inds, axis=1)
+        strat_profs[0, :, :, j] = np.logical_and(sub_col_rank.T < data_frac1[:, j], ~conv_profs[:, :, j])
+        strat_profs[1, :, :, j] = np.logical_and(sub_col_rank.T < data_frac2[:, j], ~conv_profs[:, :, j])
+        strat_profs[:, :, full_overcast[:, j], j] = True
+
+    return full_overcast.sum(), strat_profs[0], strat_profs[1]
+
+
+def _allocate_strat_sub_col_block(t_block, data_frac1, data_frac2, conv_profs, N_columns, seed, time_offset):
+    t_start, t_end = t_block
+    return _allocate_strat_sub_col(
+        data_frac1[t_start:t_end], data_frac2[t_start:t_end], conv_profs[:, t_start:t_end], N_columns,
+        rngs=_get_column_rngs(seed, time_offset + np.arange(t_start, t_end), "strat_frac"))
+
+
+def _allocate_precip_sub_col_columns(t_block, strat_profs, N_columns, data_frac, PF_val, precip_exist,
+                                     full_overcast_pl_pi, overlapping_cloud, seed, time_offset, stream):
+    # The remaining fraction (PF_val) is updated in place, so each task works on its own copy
+    t_start, t_end = t_block
+    cols = slice(t_start, t_end)
+    cond = [strat_profs[:, cols], ~strat_profs[:, cols]]
+    data_frac = list(data_frac[:, cols])
+    PF_val = PF_val[cols].copy()
+    my_tuple = [_allocate_precip_sub_col(
+        tt - t_start, cond, N_columns, data_frac, PF_val, precip_exist[:, cols], full_overcast_pl_pi,
+        overlapping_cloud[cols], rng=_get_column_rng(seed, time_offset + tt, stream))
+        for tt in range(t_start, t_end)]
+    return np.sum([x[0] for x in my_tuple]), np.concatenate([x[1] for x in my_tuple], axis=1)
 
 
 def _allocate_precip_sub_col(tt, cond, N_columns, data_frac, PF_val,
-                             precip_exist, full_overcast_pl_pi, overlapping_cloud):
+                             precip_exist, full_overcast_pl_pi, overlapping_cloud, rng=None):
+    if rng is None:
+        rng = np.random
     p_strat_profs = np.zeros(
         (N_columns, data_frac[0].shape[1], len(data_frac)), dtype=bool)
 
@@ -672,13 +745,13 @@ def _allocate_precip_sub_col(tt, cond, N_columns, data_frac, PF_val,
             overlying_locs = np.where(np.any(p_strat_profs[:, j + 1, :], axis=1))[0]
             overlying_num = len(overlying_locs)
             if overlying_num > PF_val[tt, j]:  # more overlying than the class w/ maximum frac
-                rand_locs = _randperm(overlying_num, PF_val[tt, j])
+                rand_locs = _randperm(overlying_num, PF_val[tt, j], rng=rng)
                 for i in range(len(data_frac)):
                     if precip_exist[i, tt, j]:
                         p_strat_profs[overlying_locs[rand_locs[:PF_per_val[i]]], j, i] = True
                 PF_val[tt, j] = 0
             else:
-                rand_locs = np.random.permutation(overlying_num)  # random before loop to ensure max overlap
+                rand_locs = rng.permutation(overlying_num)  # random before loop to ensure max overlap
                 for i in range(len(data_frac)):
                     if precip_exist[i, tt, j]:
                         if overlying_num > PF_per_val[i]:  # more overlying than current precip class frac
@@ -696,13 +769,13 @@ def _allocate_precip_sub_col(tt, cond, N_columns, data_frac, PF_val,
                 free_num = len(free_locs)
                 if free_num > 0:
                     if free_num > PF_val[tt, j]:
-                        rand_locs = _randperm(free_num, PF_val[tt, j])
+                        rand_locs = _randperm(free_num, PF_val[tt, j], rng=rng)
                         for i in range(len(data_frac)):
                             if precip_exist[i, tt, j]:
                                 p_strat_profs[free_locs[rand_locs[:PF_per_val[i]]], j, i] = True
                         PF_val[tt, j] = 0
                     else:
-                        rand_locs = np.random.permutation(free_num)  # random before loop to ensure max overlap
+                        rand_locs = rng.permutation(free_num)  # random before loop to ensure max overlap
                         for i in range(len(data_frac)):
                             if precip_exist[i, tt, j]:
                                 if free_num > PF_per_val[i]:  # more free locs than current precip class frac
@@ -713,31 +786,127 @@ def _allocate_precip_sub_col(tt, cond, N_columns, data_frac, PF_val,
                                     PF_per_val[i] -= free_num
                         PF_val[tt, j] -= free_num
 
-    return full_overcast_pl_pi, p_strat_profs
-
-
-def _distribute_cl_q_n(tt, sub_data_frac, inv_rel_var, N_columns, tot_hyd_in_sub, q_ic_mean):
-    q_profs = np.zeros((N_columns, q_ic_mean.shape[1]), dtype=float)
-    for j in range(q_ic_mean.shape[1]):
-        hyd_in_sub_loc = np.where(sub_data_frac[:, tt, j])[0]
-        if tot_hyd_in_sub[tt, j] == 1:
-            q_profs[hyd_in_sub_loc, j] = q_ic_mean[tt, j]
-        elif tot_hyd_in_sub[tt, j] > 1:
-            alpha = inv_rel_var / q_ic_mean[tt, j]
-            a = inv_rel_var
-            b = 1 / alpha
-            randlocs = np.random.permutation(tot_hyd_in_sub[tt, j])
-            rand_gamma_vals = np.random.gamma(a, b, tot_hyd_in_sub[tt, j])  # extra entry 2 prevent indexing issues
-            valid_vals = False
-            counter_4_valid = 0
-            while not valid_vals:  # Finding first index w/ random value sum > cell mean --> randomize up to there
-                counter_4_valid += 1
-                valid_vals = (q_ic_mean[tt, j] * tot_hyd_in_sub[tt, j] -
-                              rand_gamma_vals[:-counter_4_valid].sum()) > 0
-            q_profs[hyd_in_sub_loc[randlocs[:-counter_4_valid]], j] = \
-                rand_gamma_vals[:-counter_4_valid]
-            q_profs[hyd_in_sub_loc[randlocs[-counter_4_valid:]], j] = (
-                q_ic_mean[tt, j] * tot_hyd_in_sub[tt, j] -
-                np.sum(rand_gamma_vals[:-counter_4_valid])) / float(counter_4_valid)
-
-    return q_profs
+    return full_overcast_pl_pi, p_strat_profs[:, np.newaxis]
+
+
+def _allocate_precip_sub_col_batched(data_frac, strat_profs, N_columns, rngs=None):
+    """
+    Allocates the precipitation classes in the subcolumns of a block of time columns.
+    Each height level is processed for all time columns at once.
+
+    At each level, the subcolumns are ranked by a random key per subcolumn and time column,
+    offset so that subcolumns with overlying precipitation come first, followed by cloudy
+    subcolumns and then by hydrometeor-free subcolumns. Each precipitation class takes the
+    highest-ranked subcolumns, which gives the same maximum-random overlap as
+    :code:`_allocate_precip_sub_col`, with the classes nested in one another.
+
+    Parameters
+    ----------
+    data_frac: list of numpy arrays
+        The number of subcolumns to allocate to each precipitation class (time, height).
+    strat_profs: numpy array
+        True where a subcolumn is cloudy (subcolumn, time, height).
+    N_columns: int
+        The number of subcolumns.
+    rngs: list of numpy.random.Generator or None
+        The random number generator of each time column. None to use the global numpy
+        random state.
+
+    Returns
+    -------
+    full_overcast_pl_pi: int
+        The number of voxels that are fully overcast with all of the precipitation classes.
+    p_strat_profs: numpy array
+        The presence of each precipitation class in each subcolumn (subcolumn, time, height, class).
+    """
+    t_dim, z_dim = data_frac[0].shape
+    p_strat_profs = np.zeros((N_columns, t_dim, z_dim, len(data_frac)), dtype=bool)
+    full_overcast = np.all(np.stack(data_frac) == N_columns, axis=0)
+    full_overcast[:, -1] = False
+    cloudy_keys = np.where(strat_profs, 1., 0.)
+    sub_col_inds = np.tile(np.arange(N_columns), (t_dim, 1))
+    sub_col_rank = np.empty((t_dim, N_columns), dtype=int)
+    all_rand_keys = _get_rand_keys(rngs, (t_dim, z_dim, N_columns))
+    for j in range(z_dim - 2, -1, -1):
+        overlying = np.any(p_strat_profs[:, :, j + 1, :], axis=2)
+        rand_keys = all_rand_keys[:, j] + np.where(overlying, 2., cloudy_keys[:, :, j]).T
+        np.put_along_axis(sub_col_rank, np.argsort(-rand_keys, axis=1), sub_col_inds, axis=1)
+        for i in range(len(data_frac)):
+            p_strat_profs[:, :, j, i] = sub_col_rank.T < data_frac[i][:, j]
+
+    return full_overcast.sum(), p_strat_profs
+
+
+def _allocate_precip_sub_col_block(t_block, data_frac, strat_profs, N_columns, seed, time_offset, stream):
+    t_start, t_end = t_block
+    return _allocate_precip_sub_col_batched(
+        list(data_frac[:, t_start:t_end]), strat_profs[:, t_start:t_end], N_columns,
+        rngs=_get_column_rngs(seed, time_offset + np.arange(t_start, t_end), stream))
+
+
+def _distribute_cl_q_n_block(t_block, sub_data_frac, inv_rel_var, q_ic_mean, seed, time_offset, stream):
+    t_start, t_end = t_block
+    return _distribute_cl_q_n(
+        sub_data_frac[:, t_start:t_end], inv_rel_var, q_ic_mean[t_start:t_end],
+        rngs=_get_column_rngs(seed, time_offset + np.arange(t_start, t_end), stream))
+
+
+def _distribute_cl_q_n(sub_data_frac, inv_rel_var, q_ic_mean, rngs=None):
+    """
+    Distributes the in-cloud mixing ratio in the subcolumns of a block of time columns
+    following Equation 8 of Morrison and Gettelman (2008).
+
+    In each voxel with n > 1 hydrometeor-containing subcolumns, gamma-distributed values
+    are assigned to the subcolumns in a random order. The values are kept up to the last
+    one whose cumulative sum is below the voxel total (n times the in-cloud mean), and the
+    remainder of the total is split evenly between the remaining subcolumns, which conserves
+    the mass. All of the gamma variates of the block are drawn at once.
+
+    Parameters
+    ----------
+    sub_data_frac: numpy array
+        True where a subcolumn contains the hydrometeor (subcolumn, time, height).
+    inv_rel_var: float
+        The inverse of the relative subgrid qc PDF variance.
+    q_ic_mean: numpy array
+        The in-cloud mean mixing ratio (time, height).
+    rngs: list of numpy.random.Generator or None
+        The random number generator of each time column. None to use the global numpy
+        random state.
+
+    Returns
+    -------
+    q_profs: numpy array
+        The mixing ratio in each subcolumn (subcolumn, time, height).
+    """
+    hyd_in_sub = np.moveaxis(sub_data_frac, 0, -1).astype(bool)
+    tot_hyd_in_sub = hyd_in_sub.sum(axis=-1)
+    # The mean is not used without subcolumns with the hydrometeor (and may be infinite there)
+    q_ic_mean = np.where(tot_hyd_in_sub > 0, q_ic_mean, 0.)
+    if rngs is None:
+        gamma_vals = np.random.standard_gamma(inv_rel_var, hyd_in_sub.shape)
+    else:
+        gamma_vals = np.stack([rng.standard_gamma(inv_rel_var, hyd_in_sub.shape[1:]) for rng in rngs])
+    gamma_vals *= (q_ic_mean / inv_rel_var)[..., np.newaxis]
+
+    # Number of gamma values kept: prefix sums of up to n - 1 values below the total
+    q_tot = q_ic_mean * tot_hyd_in_sub
+    cum_gamma_vals = np.cumsum(gamma_vals, axis=-1)
+    sample_ind = np.arange(hyd_in_sub.shape[-1])
+    num_kept = np.sum(np.logical_and(cum_gamma_vals < q_tot[..., np.newaxis],
+                                     sample_ind < (tot_hyd_in_sub - 1)[..., np.newaxis]), axis=-1)
+    kept_sum = np.take_along_axis(
+        cum_gamma_vals, np.maximum(num_kept - 1, 0)[..., np.newaxis], axis=-1)[..., 0]
+    kept_sum = np.where(num_kept > 0, kept_sum, 0.)
+    q_remainder = (q_tot - kept_sum) / np.maximum(tot_hyd_in_sub - num_kept, 1)
+    sample_vals = np.where(sample_ind < num_kept[..., np.newaxis], gamma_vals, q_remainder[..., np.newaxis])
+
+    # Random order of the samples in the hydrometeor-containing subcolumns
+    rand_keys = _get_rand_keys(rngs, hyd_in_sub.shape)
+    rand_keys = np.where(hyd_in_sub, rand_keys, 2.)
+    sub_col_rank = np.empty(hyd_in_sub.shape, dtype=int)
+    np.put_along_axis(sub_col_rank, np.argsort(rand_keys, axis=-1),
+                      np.broadcast_to(sample_ind, hyd_in_sub.shape), axis=-1)
+    q_profs = np.where(hyd_in_sub, np.take_along_axis(sample_vals, sub_col_rank, axis=-1), 0.)
+
+    return np.moveaxis(q_profs, -1, 0)
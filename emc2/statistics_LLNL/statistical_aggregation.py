@@ -1,10 +1,18 @@
 import copy
 import numpy as np
+import dask.array as da
+import scipy.sparse as sparse
 import warnings
+
+from collections import OrderedDict
+from ..simulator.executor import get_block_size
 warnings.filterwarnings("ignore")
 
+# Vertical regridders of each height grid (see get_vertical_regridder)
+_vertical_regridders = {}
+
 
-def get_radar_lidar_signals(model):
+def get_radar_lidar_signals(model, lazy=False):
     """
     Get or calculate radar and lidar signals.
 
@@ -12,6 +20,9 @@ def get_radar_lidar_signals(model):
     ----------
     model: func:`emc2.core.Model` class
         The model to read in some of pre-calculated variables.
+    lazy: bool
+        If True, return the signals as dask arrays that are computed on demand (the
+        molecular backscatter is broadcast to the subcolumns without copying).
 
     Returns
     -------
@@ -26,27 +37,33 @@ def get_radar_lidar_signals(model):
     Ze_att_total_4D: float
         radar reflectivity after attenuation, unit: dBZ
     """
-
-    atb_total_4D = np.empty_like(model.ds.sub_col_beta_att_tot.values)
-    atb_mol_4D = np.empty_like(model.ds.sub_col_beta_att_tot.values)
-
-    z_full_km_3D = np.empty_like(model.ds.Z3.values)
-    z_half_km_3D = np.empty_like(model.ds.Z3.values)
-
-    # newly added for Ze att tot
-    Ze_att_total_4D = np.empty_like(model.ds.sub_col_beta_att_tot.values)
-
-    subcolum_num = len(model.ds.subcolumn)
-    time_num = len(model.ds.time)
-    col_num = len(model.ds.ncol)
-
-    for i in np.arange(subcolum_num):
-        for j in np.arange(time_num):
-            for k in np.arange(col_num):
-                atb_total_4D[i, j, :, k], atb_mol_4D[i, j, :, k],\
-                    z_full_km_3D[j, :, k], z_half_km_3D[j, :, k],\
-                    Ze_att_total_4D[i, j, :, k] = get_ATB_ATBmol(
-                        model, i, j, k)
+    # The same profiles as get_ATB_ATBmol for all (subcolumn, time, ncol) indices at once
+    if lazy:
+        beta_att_tot = da.asarray(model.ds.sub_col_beta_att_tot.data)
+        atb_mol = da.asarray(model.ds.sigma_180_vol.data) * da.asarray(model.ds.tau.data)
+        Ze_att_tot = da.asarray(model.ds.sub_col_Ze_att_tot.data)
+        z_full_km_3D = da.asarray(model.ds.Z3.data) / 1000.
+        concatenate = da.concatenate
+    else:
+        beta_att_tot = model.ds.sub_col_beta_att_tot.values
+        atb_mol = model.ds.sigma_180_vol.values * model.ds.tau.values
+        Ze_att_tot = model.ds.sub_col_Ze_att_tot.values
+        z_full_km_3D = model.ds.Z3.values / 1000.
+        concatenate = np.concatenate
+
+    dtype = beta_att_tot.dtype
+    atb_total_4D = beta_att_tot.astype(dtype, copy=not lazy)
+    atb_mol_4D = atb_mol.astype(dtype)[np.newaxis]
+    if lazy:
+        atb_mol_4D = da.broadcast_to(atb_mol_4D, beta_att_tot.shape)
+    else:
+        atb_mol_4D = np.broadcast_to(atb_mol_4D, beta_att_tot.shape).copy()
+    Ze_att_total_4D = Ze_att_tot.astype(dtype)
+
+    z_dtype = model.ds.Z3.dtype
+    z_half_km_3D = concatenate([z_full_km_3D[:, :-1] + (z_full_km_3D[:, 1:] - z_full_km_3D[:, :-1]) / 2.,
+                                z_full_km_3D[:, -1:]], axis=1).astype(z_dtype)
+    z_full_km_3D = z_full_km_3D.astype(z_dtype)
 
     return atb_total_4D, atb_mol_4D, z_full_km_3D, z_half_km_3D, Ze_att_total_4D
 
@@ -153,33 +170,10 @@ def calculate_SR(atb_total_4D, atb_mol_4D, subcolum_num, time_num, z_full_km_3D,
     c = copy.deepcopy(atb_mol_4D)
     atb_mol_4D_num = np.nan_to_num(c, nan=R_UNDEF)
 
-    Regrided_atb_total_reorder_4D = np.empty(
-        (subcolum_num, time_num, Nglevels, col_num))
-    Regrided_atb_mol_reorder_4D = np.empty(
-        (subcolum_num, time_num, Nglevels, col_num))
-
-    for kk in np.arange(col_num):
-        zfull = z_full_km_3D[:, :, kk]
-        zhalf = z_half_km_3D[:, :, kk]
-        y_input_atbtot = np.transpose(
-            atb_total_4D_num[:, :, :, kk], axes=(1, 0, 2))  # loop through columns
-        y_input_abtmol = np.transpose(
-            atb_mol_4D_num[:, :, :, kk], axes=(1, 0, 2))  # loop through columns
-
-        Regrided_atb_total_3D = COSP_CHANGE_VERTICAL_GRID(Npoints, Ncolumns, Nlevels,
-                                                          zfull, zhalf, y_input_atbtot,
-                                                          Nglevels, newgrid_bot, newgrid_top,
-                                                          lunits=False)
-        Regrided_atb_mol_3D = COSP_CHANGE_VERTICAL_GRID(Npoints, Ncolumns, Nlevels,
-                                                        zfull, zhalf, y_input_abtmol,
-                                                        Nglevels, newgrid_bot, newgrid_top,
-                                                        lunits=False)
-
-        # need to covert to right dimension order
-        Regrided_atb_total_reorder_4D[:, :, :, kk] = np.transpose(
-            Regrided_atb_total_3D, axes=(1, 0, 2))  # loop through columns
-        Regrided_atb_mol_reorder_4D[:, :, :, kk] = np.transpose(
-            Regrided_atb_mol_3D, axes=(1, 0, 2))  # loop through columns
+    # All columns and both signals are regridded together
+    regridder = get_vertical_regridder(newgrid_bot[:Nglevels], newgrid_top[:Nglevels])
+    Regrided_atb_total_reorder_4D, Regrided_atb_mol_reorder_4D = _regrid_columns(
+        regridder, z_full_km_3D, z_half_km_3D, Nlevels, atb_total_4D_num, atb_mol_4D_num)
 
     loc_atbtot = np.where(Regrided_atb_total_reorder_4D == R_UNDEF)
     Regrided_atb_total_reorder_4D[loc_atbtot] = np.nan
@@ -224,90 +218,251 @@ def COSP_CHANGE_VERTICAL_GRID(Npoints, Ncolumns, Nlevels, zfull, zhalf, y, Nglev
        variable after vertical regriding
     """
 
-    r = np.zeros([Npoints, Ncolumns, Nglevels])  # (1236, 20 , 40)
+    regridder = VerticalRegridder(newgrid_bot[:Nglevels], newgrid_top[:Nglevels])
+    r = regridder.regrid(zfull[:Npoints, :Nlevels], zhalf[:Npoints, :Nlevels],
+                         y[:Npoints, :Ncolumns, :Nlevels], lunits=lunits)[0]
+
+    return r
+
+
+class VerticalRegridder(object):
+    """
+    Regrids fields from model levels to a fixed height grid as in
+    :py:func:`COSP_CHANGE_VERTICAL_GRID`.
+
+    The layer overlap weights of each distinct model height profile are calculated once
+    and cached as the rows of a sparse (new level, model level) matrix, such that the weights are
+    reused by all fields, subcolumns, columns, and times with the same height profile.
 
+    Parameters
+    ----------
+    newgrid_bot : float
+        bottom height in each regrided height bin, unit: km
+    newgrid_top : float
+        top height in each regrided height bin, unit: km
+    max_profiles: int
+        The maximum number of cached height profiles. The least recently used profiles are
+        evicted when the cache is full.
+
+    Attributes
+    ----------
+    operators: OrderedDict
+        The cached weights of each height profile (keyed by the profile bytes), in order of
+        last use.
+    """
     R_UNDEF = -1.0E30  # Missing value
     R_GROUND = -1.0E20  # Flag for below ground results
 
-    oldgrid_top = np.zeros(Nlevels)
-
-    for i in np.arange(Npoints):  # loop through each grid
-
-        # Calculate tops and bottoms of new and old grids
-        oldgrid_bot = zhalf[i, :].copy()
-        oldgrid_top[:Nlevels - 1] = oldgrid_bot[1:].copy()
-        oldgrid_top[Nlevels - 1] = zfull[i, Nlevels - 1] + zfull[i,
-                                                                 Nlevels-1] - zhalf[i, Nlevels - 1]  # Top level symmetric
-
-        lev = -1  # Index of level in the old grid
-
-        for k in np.arange(Nglevels):   # Loop over levels in the new grid
-            Nw = 0  # Number of weigths
-            wt = 0.  # Sum of weights
-            # Loop over levels in the old grid and accumulate total for weighted average
-            # change do loop in Fortran to while loop in Python
-            while lev < Nlevels:
-                lev = lev + 1  # return to while loop
-                w = 0.0  # Initialise weight to 0
-
-                # Distances between edges of both grids
-                dbb = oldgrid_bot[lev] - newgrid_bot[k]
-                dtb = oldgrid_top[lev] - newgrid_bot[k]
-                dbt = oldgrid_bot[lev] - newgrid_top[k]
-                dtt = oldgrid_top[lev] - newgrid_top[k]
-
-                if dbt >= 0.:
-                    break   # Do next level in the new grid (k=k+1)
-
-                if dtb > 0.:
-                    if dbb <= 0.0:
-                        if dtt <= 0:
-                            w = dtb.copy()
-                        else:
-                            w = newgrid_top[k] - newgrid_bot[k]
-                    else:
-                        if dtt <= 0:
-                            w = oldgrid_top[lev] - oldgrid_bot[lev]
-                        else:
-                            w = -dbt
-
-                    # If layers overlap (w!=0), then accumulate
-                    if w != 0.0:
-                        Nw = Nw + 1
-                        wt = wt + w
-
-                        for j in np.arange(Ncolumns):
-                            if lunits:  # True
-                                if (y[i, j, lev] != R_UNDEF):
-                                    yp = 10.**(y[i, j, lev]/10.)
-                                else:
-                                    yp = 0.
-                            else:
-                                yp = y[i, j, lev]
-
-                            r[i, j, k] = r[i, j, k] + w*yp
-            lev -= 2
-            if lev < 1:
-                lev = 0
-
-            # Calculate average in new grid
-            if Nw > 0:
-                for j in np.arange(Ncolumns):
-                    r[i, j, k] = r[i, j, k] / wt
-
-    for k in np.arange(Nglevels):
-        for j in np.arange(Ncolumns):
-            for i in np.arange(Npoints):
-                if newgrid_top[k] > zhalf[i, 0]:  # Level above model bottom level
-                    if lunits:
-                        if r[i, j, k] <= 0.0:
-                            r[i, j, k] = R_UNDEF
-                        else:
-                            r[i, j, k] = 10.*np.log10(r[i, j, k])
-                else:  # Level below surface
-                    r[i, j, k] = R_GROUND
+    def __init__(self, newgrid_bot, newgrid_top, max_profiles=10000):
+        self.newgrid_bot = np.array(newgrid_bot, dtype=float)
+        self.newgrid_top = np.array(newgrid_top, dtype=float)
+        self.max_profiles = max_profiles
+        self.operators = OrderedDict()
+
+    def get_operators(self, zfull, zhalf):
+        """
+        Returns the regridding weights of a set of height profiles.
+
+        Parameters
+        ----------
+        zfull: float
+            (point, level) height, unit: km
+        zhalf : float
+            (point, level) height at half level, unit: km
+
+        Returns
+        -------
+        operators: list
+            The (weights, model levels, weights per new level, weight sum, has weights,
+            above ground) tuple of each point, where the first three are the CSR data,
+            indices, and row lengths of the sparse (new level, model level) weight matrix.
+        """
+        zfull = np.ascontiguousarray(zfull, dtype=float)
+        zhalf = np.ascontiguousarray(zhalf, dtype=float)
+        keys = [zfull[i].tobytes() + zhalf[i].tobytes() for i in range(zfull.shape[0])]
+        new_points = {}
+        for i, key in enumerate(keys):
+            if key in self.operators:
+                self.operators.move_to_end(key)
+            elif key not in new_points:
+                new_points[key] = i
+
+        new_operators = {}
+        if len(new_points) > 0:
+            # The weights are calculated in blocks of points to bound the dense (point, new level,
+            # model level) temporaries (about six of them per point).
+            Nlevels = zfull.shape[1]
+            Nglevels = self.newgrid_bot.size
+            ind = np.array(list(new_points.values()))
+            new_keys = list(new_points.keys())
+            block_size = get_block_size(ind.size, 6 * 8 * Nglevels * Nlevels)
+            for start in range(0, ind.size, block_size):
+                block = ind[start:start + block_size]
+                weights = _get_vertical_grid_weights(Nlevels, zfull[block], zhalf[block],
+                                                     Nglevels, self.newgrid_bot, self.newgrid_top)
+                # Sums in level order (as in COSP)
+                wt = np.cumsum(weights, axis=2)[:, :, -1]
+                has_weights = np.any(weights != 0., axis=2)
+                above_ground = self.newgrid_top[np.newaxis, :] > zhalf[block, 0, np.newaxis]
+                profile, _, lev = np.nonzero(weights)
+                split = np.cumsum(np.bincount(profile, minlength=block.size))[:-1]
+                data = np.split(weights[weights != 0.], split)
+                lev = np.split(lev, split)
+                row_nnz = np.count_nonzero(weights, axis=2)
+                for j, key in enumerate(new_keys[start:start + block_size]):
+                    new_operators[key] = (data[j], lev[j], row_nnz[j], wt[j], has_weights[j], above_ground[j])
+
+        operators = [self.operators[key] if key in self.operators else new_operators[key] for key in keys]
+
+        # Least recently used height profiles are evicted first
+        self.operators.update(new_operators)
+        while len(self.operators) > self.max_profiles:
+            self.operators.popitem(last=False)
+        return operators
+
+    def regrid(self, zfull, zhalf, *fields, lunits=False):
+        """
+        Regrids one or more fields.
+
+        Parameters
+        ----------
+        zfull: float
+            (point, level) height, unit: km
+        zhalf : float
+            (point, level) height at half level, unit: km
+        fields: float
+            The (point, subcolumn, level) fields to regrid.
+        lunits: bool
+            If True, the fields are in dB and are averaged in linear units.
+
+        Returns
+        -------
+        regridded: list
+            The (point, subcolumn, new level) regridded fields.
+        """
+        Npoints, Nlevels = zfull.shape
+        Nglevels = self.newgrid_bot.size
+        n_cols = [y.shape[1] for y in fields]
+
+        # The points are regridded in blocks, such that the weights and the sparse operator
+        # do not grow with the number of points.
+        block_size = get_block_size(Npoints, 8 * (6 * Nglevels * Nlevels + 3 * sum(n_cols) * (Nlevels + Nglevels)))
+        r = np.empty((Npoints, sum(n_cols), Nglevels))
+        for start in range(0, Npoints, block_size):
+            end = min(start + block_size, Npoints)
+            r[start:end] = self._regrid_block(zfull[start:end], zhalf[start:end],
+                                              [y[start:end] for y in fields], lunits)
+
+        return np.split(r, np.cumsum(n_cols)[:-1], axis=1)
+
+    def _regrid_block(self, zfull, zhalf, fields, lunits):
+        """
+        Regrids the (point, subcolumn, level) fields of a block of points to one
+        (point, subcolumn, new level) array.
+        """
+        operators = self.get_operators(zfull, zhalf)
+        Npoints, Nlevels = zfull.shape
+        Nglevels = self.newgrid_bot.size
+
+        # All fields and subcolumns of a point are regridded by the point's weight matrix,
+        # and all points of the block are regridded together by the block diagonal of the matrices.
+        y_all = np.concatenate([np.asarray(y, dtype=float) for y in fields], axis=1)
+        if lunits:
+            y_all = np.where(y_all != self.R_UNDEF, 10.**(y_all/10.), 0.)
+        y_all = np.swapaxes(y_all, 1, 2).reshape(Npoints * Nlevels, -1)
+        indptr = np.concatenate([[0], np.cumsum(np.concatenate([x[2] for x in operators]))])
+        indices = np.concatenate([x[1] + i * Nlevels for i, x in enumerate(operators)])
+        operator = sparse.csr_matrix((np.concatenate([x[0] for x in operators]), indices, indptr),
+                                     shape=(Npoints * Nglevels, Npoints * Nlevels))
+        r = (operator @ y_all).reshape(Npoints, Nglevels, -1)
+        r = np.swapaxes(r, 1, 2)
+
+        # Calculate average in new grid
+        wt = np.stack([x[3] for x in operators])[:, np.newaxis, :]
+        has_weights = np.stack([x[4] for x in operators])[:, np.newaxis, :]
+        r = np.where(has_weights, r / np.where(has_weights, wt, 1.), r)
+
+        # Level above model bottom level
+        above_ground = np.stack([x[5] for x in operators])[:, np.newaxis, :]
+        if lunits:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r = np.where(r <= 0.0, self.R_UNDEF, 10.*np.log10(r))
+        r = np.where(above_ground, r, self.R_GROUND)
+
+        return r
+
+
+def get_vertical_regridder(newgrid_bot, newgrid_top):
+    """
+    Returns the :py:class:`VerticalRegridder` of a height grid. The regridders (and their
+    cached weights) are shared by all calls with the same height grid.
 
-    return r
+    Parameters
+    ----------
+    newgrid_bot : float
+        bottom height in each regrided height bin, unit: km
+    newgrid_top : float
+        top height in each regrided height bin, unit: km
+
+    Returns
+    -------
+    regridder: VerticalRegridder
+        The regridder.
+    """
+    key = np.asarray(newgrid_bot, dtype=float).tobytes() + np.asarray(newgrid_top, dtype=float).tobytes()
+    if key not in _vertical_regridders:
+        _vertical_regridders[key] = VerticalRegridder(newgrid_bot, newgrid_top)
+    return _vertical_regridders[key]
+
+
+def _regrid_columns(regridder, z_full_km_3D, z_half_km_3D, Nlevels, *fields_4D):
+    """
+    Regrids (subcolumn, time, level, column) fields with (time, level, column) heights
+    to (subcolumn, time, new level, column) fields.
+    """
+    col_num = z_full_km_3D.shape[2]
+    zfull = np.moveaxis(z_full_km_3D[:, :Nlevels], 2, 0).reshape(-1, Nlevels)
+    zhalf = np.moveaxis(z_half_km_3D[:, :Nlevels], 2, 0).reshape(-1, Nlevels)
+    fields = [np.transpose(y[:, :, :Nlevels], axes=(3, 1, 0, 2)).reshape(zfull.shape[0], -1, Nlevels)
+              for y in fields_4D]
+    regridded = regridder.regrid(zfull, zhalf, *fields)
+    return [np.transpose(r.reshape(col_num, -1, r.shape[1], r.shape[2]), axes=(2, 1, 3, 0))
+            for r in regridded]
+
+
+def _get_vertical_grid_weights(Nlevels, zfull, zhalf, Nglevels, newgrid_bot, newgrid_top):
+    """
+    Returns the (point, new level, old level) overlap weights of COSP_CHANGE_VERTICAL_GRID.
+
+    As in COSP, the old levels are searched upward from one level below the level that
+    ended the search of the previous new level (but not below the second level), and the
+    search of a new level ends at the first old level with a bottom at or above the top of
+    the new level.
+    """
+    Npoints = zhalf.shape[0]
+
+    # Calculate tops and bottoms of new and old grids
+    oldgrid_bot = zhalf[:, :Nlevels]
+    oldgrid_top = np.empty_like(oldgrid_bot)
+    oldgrid_top[:, :Nlevels - 1] = oldgrid_bot[:, 1:]
+    oldgrid_top[:, Nlevels - 1] = zfull[:, Nlevels - 1] + zfull[:, Nlevels - 1] - zhalf[:, Nlevels - 1]
+
+    # Distances between edges of both grids
+    dtb = oldgrid_top[:, np.newaxis, :] - newgrid_bot[np.newaxis, :, np.newaxis]
+    dbt = oldgrid_bot[:, np.newaxis, :] - newgrid_top[np.newaxis, :, np.newaxis]
+    overlap = np.minimum(oldgrid_top[:, np.newaxis, :], newgrid_top[np.newaxis, :, np.newaxis]) - \
+        np.maximum(oldgrid_bot[:, np.newaxis, :], newgrid_bot[np.newaxis, :, np.newaxis])
+
+    levels = np.arange(Nlevels)
+    searched = np.zeros((Npoints, Nglevels, Nlevels), dtype=bool)
+    start = np.zeros(Npoints, dtype=int)
+    for k in range(Nglevels):
+        ends = np.logical_and(levels >= start[:, np.newaxis], dbt[:, k, :] >= 0.)
+        end = np.where(np.any(ends, axis=1), np.argmax(ends, axis=1), Nlevels)
+        searched[:, k, :] = np.logical_and(levels >= start[:, np.newaxis], levels < end[:, np.newaxis])
+        start = np.maximum(end - 1, 1)
+
+    return np.where(np.logical_and(searched, dtb > 0.), overlap, 0.)
 
 
 def get_regridded_ze_att_tot(Ze_att_total_4D, z_full_km_3D, z_half_km_3D, subcolum_num, time_num,
@@ -349,23 +504,9 @@ def get_regridded_ze_att_tot(Ze_att_total_4D, z_full_km_3D, z_half_km_3D, subcol
     a = copy.deepcopy(Ze_att_total_4D)
     Ze_att_total_4D_num = np.nan_to_num(a, nan=R_UNDEF)
 
-    Regrided_Ze_att_tot_reorder_4D = np.empty(
-        (subcolum_num, time_num, Nglevels, col_num))
-
-    for kk in np.arange(col_num):
-        zfull = z_full_km_3D[:, :, kk]
-        zhalf = z_half_km_3D[:, :, kk]
-        y_input_zeatttot = np.transpose(
-            Ze_att_total_4D_num[:, :, :, kk], axes=(1, 0, 2))  # loop through columns
-
-        Regrided_ze_att_total_3D = COSP_CHANGE_VERTICAL_GRID(
-            Npoints, Ncolumns, Nlevels, zfull,
-            zhalf, y_input_zeatttot, Nglevels,
-            newgrid_bot, newgrid_top, lunits=False)
-
-        # need to covert to right dimension order
-        Regrided_Ze_att_tot_reorder_4D[:, :, :, kk] = np.transpose(
-            Regrided_ze_att_total_3D, axes=(1, 0, 2))  # loop through columns
+    regridder = get_vertical_regridder(newgrid_bot[:Nglevels], newgrid_top[:Nglevels])
+    Regrided_Ze_att_tot_reorder_4D, = _regrid_columns(
+        regridder, z_full_km_3D, z_half_km_3D, Nlevels, Ze_att_total_4D_num)
 
     loc_ze = np.where(Regrided_Ze_att_tot_reorder_4D == R_UNDEF)
     Regrided_Ze_att_tot_reorder_4D[loc_ze] = np.nan
@@ -398,26 +539,23 @@ def calculate_lidar_CF(SR_4D, time_num, Nglevels, col_num):
     s_att = 0.01
 
     CF_3D = np.empty((time_num, Nglevels, col_num)) * np.nan
-    # Cloud detection at subgrid-scale
-    cldy_pixels = np.empty_like(CF_3D)  # (50, 24, 40, 3)
-    # Number of usefull sub-columns:
-    srok_pixels = np.empty_like(CF_3D)  # (50, 24, 40, 3)
-
-    for i in np.arange(time_num):
-        for j in np.arange(Nglevels):
-            for k in np.arange(col_num):
-                cldy_pixels[i, j, k] = np.where(
-                    SR_4D[:, i, j, k] > S_cld)[0].shape[0]
-                srok_pixels[i, j, k] = np.where(
-                    SR_4D[:, i, j, k] > s_att)[0].shape[0]
-
-                if srok_pixels[i, j, k] > 0:
-                    CF_3D[i, j, k] = cldy_pixels[i, j, k] * \
-                        1.0 / srok_pixels[i, j, k]
+    # Cloud detection at subgrid-scale and number of usefull sub-columns
+    cldy_pixels, srok_pixels = _get_lidar_CF_counts(SR_4D[:, :time_num, :Nglevels, :col_num], S_cld, s_att)
+
+    CF_3D[srok_pixels > 0] = cldy_pixels[srok_pixels > 0] * 1.0 / srok_pixels[srok_pixels > 0]
 
     return CF_3D
 
 
+def _get_lidar_CF_counts(SR_4D, S_cld, s_att):
+    """
+    Returns the (time, level, column) numbers of cloudy (SR > S_cld) and usefull (SR > s_att)
+    subcolumns of the (subcolumn, time, level, column) lidar SR.
+    """
+    with np.errstate(invalid="ignore"):
+        return np.count_nonzero(SR_4D > S_cld, axis=0), np.count_nonzero(SR_4D > s_att, axis=0)
+
+
 def cal_cfad_radar_40levels(nsubcolumn, levStat_km, Ze_EDGES, a):
     """
     Calculate CFAD
@@ -439,20 +577,33 @@ def cal_cfad_radar_40levels(nsubcolumn, levStat_km, Ze_EDGES, a):
         CFADs of variable a
     """
 
-    cfaddbz94_space_cal_sub = np.empty(
-        (((len(levStat_km)), (len(Ze_EDGES)-1)))) * np.nan
-
-    for i in np.arange(len(levStat_km)):
-        a1 = a[:, i]
-        loc0 = np.where((a1 >= Ze_EDGES[0]) & (a1 < Ze_EDGES[-1]))
-        if loc0[0].shape[0] > 0:
-            for j in np.arange(len(Ze_EDGES)-1):
-                loc1 = np.where((a1 >= Ze_EDGES[j]) & (a1 < Ze_EDGES[j+1]))
-                cfaddbz94_space_cal_sub[i, j] = len(loc1[0]) * 1.0 / nsubcolumn
+    counts = _get_cfad_counts(a[:, np.newaxis, :], len(levStat_km), Ze_EDGES)[:, :, 0]
+    cfaddbz94_space_cal_sub = counts * 1.0 / nsubcolumn
+    # Levels without any value in the bins are missing
+    cfaddbz94_space_cal_sub[np.sum(counts, axis=1) == 0] = np.nan
 
     return cfaddbz94_space_cal_sub
 
 
+def _get_cfad_counts(a, n_levels, EDGES):
+    """
+    Returns the (level, bin, time) number of subcolumns of a (subcolumn, time, level)
+    variable in each bin [EDGES[j], EDGES[j + 1]) using a single bincount over the
+    combined (level, bin, time) index.
+    """
+    a = np.asarray(a)[:, :, :n_levels]
+    EDGES = np.asarray(EDGES)
+    n_bins = EDGES.size - 1
+    n_times = a.shape[1]
+    with np.errstate(invalid="ignore"):
+        valid = np.logical_and(a >= EDGES[0], a < EDGES[-1])
+    bin_index = np.searchsorted(EDGES, a[valid], side="right") - 1
+    time_index, level_index = np.nonzero(valid)[1:]
+    index = (level_index * n_bins + bin_index) * n_times + time_index
+    counts = np.bincount(index, minlength=n_levels * n_bins * n_times)
+    return counts.reshape(n_levels, n_bins, n_times)
+
+
 def get_cfaddBZ(Ze_EDGES, newgrid_mid, Npoints, Ncolumns, Regrided_Ze_att_tot_reorder_4D, col_index):
     """
     Calcaulte radar CFAD
@@ -485,16 +636,12 @@ def get_cfaddBZ(Ze_EDGES, newgrid_mid, Npoints, Ncolumns, Regrided_Ze_att_tot_re
     levStat_km = copy.deepcopy(newgrid_mid)
 
     # signal
-    cfaddbz35_cal = np.empty(
-        (len(levStat_km), (len(Ze_EDGES) - 1), Npoints)) * np.nan  # levels
-    Ze_forCFAD = Regrided_Ze_att_tot_reorder_4D[:, :, :, col_index]
+    Ze_forCFAD = Regrided_Ze_att_tot_reorder_4D[:, :Npoints, :, col_index]
 
-    for kkk in np.arange(Npoints):
-        dbz_2d = Ze_forCFAD[:, kkk, :]
-        cfaddbz35_cal[:, :, kkk] = cal_cfad_radar_40levels(
-            Ncolumns, levStat_km, Ze_EDGES, dbz_2d)
+    # (level, bin, time) CFADs of all times at once (times without any value in the bins add 0)
+    cfaddbz35_cal = _get_cfad_counts(Ze_forCFAD, len(levStat_km), Ze_EDGES) * 1.0 / Ncolumns
 
-    cfaddbz35_cal_alltime = np.nansum(cfaddbz35_cal, axis=2) / Npoints
+    cfaddbz35_cal_alltime = np.sum(cfaddbz35_cal, axis=2) / Npoints
 
     return cfaddbz35_cal_alltime
 
@@ -530,14 +677,184 @@ def get_cfad_SR(SR_EDGES, newgrid_mid, Npoints, Ncolumns, SR_4D, col_index):
 
     # height
     levStat_km = copy.deepcopy(newgrid_mid)
-    cfadSR_cal = np.empty(
-        (len(levStat_km), (len(SR_EDGES) - 1), Npoints)) * np.nan  # levels
-    SR_forCFAD = SR_4D[:, :, :, col_index]
-    for kkk in np.arange(Npoints):
-        SR_2d = SR_forCFAD[:, kkk, :]
-        cfadSR_cal[:, :, kkk] = cal_cfad_radar_40levels(
-            Ncolumns, levStat_km, SR_EDGES, SR_2d)
+    SR_forCFAD = SR_4D[:, :Npoints, :, col_index]
+
+    # (level, bin, time) CFADs of all times at once (times without any value in the bins add 0)
+    cfadSR_cal = _get_cfad_counts(SR_forCFAD, len(levStat_km), SR_EDGES) * 1.0 / Ncolumns
 
-    cfadSR_cal_alltime = np.nansum(cfadSR_cal, axis=2) / Npoints
+    cfadSR_cal_alltime = np.sum(cfadSR_cal, axis=2) / Npoints
 
     return cfadSR_cal_alltime
+
+
+class CFADAccumulator(object):
+    """
+    Streaming CFAD of a regridded variable (e.g., radar reflectivity or lidar SR).
+
+    The accumulator keeps the integer number of subcolumn profiles in each (level, bin),
+    such that the CFAD can be built from blocks of times (e.g., one time slab or file at
+    a time) and accumulators of different workers or files can be merged. The CFAD of a
+    column is the same as :py:func:`get_cfaddBZ` or :py:func:`get_cfad_SR` (up to
+    round-off) when all times of the column are accumulated.
+
+    Parameters
+    ----------
+    EDGES: float
+        bin edges
+    n_levels: int
+        number of levels after vertical regridding
+
+    Attributes
+    ----------
+    counts: int
+        (level, bin) number of subcolumn profiles with values in [EDGES[j], EDGES[j + 1]).
+    n_profiles: int
+        number of accumulated subcolumn profiles (subcolumns x times).
+    """
+
+    def __init__(self, EDGES, n_levels):
+        self.EDGES = np.array(EDGES, dtype=float)
+        self.n_levels = n_levels
+        self.counts = np.zeros((n_levels, self.EDGES.size - 1), dtype=np.int64)
+        self.n_profiles = 0
+
+    def update(self, a):
+        """
+        Adds a block of times.
+
+        Parameters
+        ----------
+        a: float
+            (subcolumn, time, level) regridded variable of one column, e.g.,
+            SR_4D[:, t_start:t_end, :, col_index].
+
+        Returns
+        -------
+        self: CFADAccumulator
+            The accumulator.
+        """
+        a = np.asarray(a)
+        self.counts += np.sum(_get_cfad_counts(a, self.n_levels, self.EDGES), axis=2)
+        self.n_profiles += a.shape[0] * a.shape[1]
+        return self
+
+    def merge(self, other):
+        """
+        Adds the counts of another accumulator with the same bins and levels.
+
+        Parameters
+        ----------
+        other: CFADAccumulator
+            The accumulator to merge.
+
+        Returns
+        -------
+        self: CFADAccumulator
+            The accumulator.
+        """
+        if self.counts.shape != other.counts.shape or not np.array_equal(self.EDGES, other.EDGES):
+            raise ValueError("Only CFADAccumulators with the same bins and levels can be merged")
+        self.counts += other.counts
+        self.n_profiles += other.n_profiles
+        return self
+
+    def cfad(self):
+        """
+        Returns the (level, bin) CFAD, i.e., the fraction of the subcolumn profiles in each
+        (level, bin). NaN if no profiles were accumulated.
+        """
+        if self.n_profiles == 0:
+            return np.full(self.counts.shape, np.nan)
+        return self.counts / self.n_profiles
+
+
+class CloudFractionAccumulator(object):
+    """
+    Streaming lidar cloud fraction.
+
+    The accumulator keeps the integer numbers of cloudy and usefull subcolumns in each
+    (level, column) as in :py:func:`calculate_lidar_CF`, such that the cloud fraction can
+    be built from blocks of times and accumulators of different workers or files can be
+    merged.
+
+    Parameters
+    ----------
+    n_levels: int
+        number of levels after vertical regridding
+    n_cols: int
+        number of columns
+    S_cld: float
+        SR threshold of cloudy subcolumns
+    s_att: float
+        SR threshold of usefull (not fully attenuated) subcolumns
+
+    Attributes
+    ----------
+    cldy_pixels: int
+        (level, column) number of cloudy subcolumns.
+    srok_pixels: int
+        (level, column) number of usefull subcolumns.
+    n_times: int
+        number of accumulated times.
+    """
+
+    def __init__(self, n_levels, n_cols, S_cld=5., s_att=0.01):
+        self.S_cld = S_cld
+        self.s_att = s_att
+        self.cldy_pixels = np.zeros((n_levels, n_cols), dtype=np.int64)
+        self.srok_pixels = np.zeros((n_levels, n_cols), dtype=np.int64)
+        self.n_times = 0
+
+    def update(self, SR_4D):
+        """
+        Adds a block of times.
+
+        Parameters
+        ----------
+        SR_4D: float
+            (subcolumn, time, level, column) lidar SR, e.g., SR_4D[:, t_start:t_end].
+
+        Returns
+        -------
+        self: CloudFractionAccumulator
+            The accumulator.
+        """
+        n_levels, n_cols = self.cldy_pixels.shape
+        cldy_pixels, srok_pixels = _get_lidar_CF_counts(
+            np.asarray(SR_4D)[:, :, :n_levels, :n_cols], self.S_cld, self.s_att)
+        self.cldy_pixels += np.sum(cldy_pixels, axis=0)
+        self.srok_pixels += np.sum(srok_pixels, axis=0)
+        self.n_times += cldy_pixels.shape[0]
+        return self
+
+    def merge(self, other):
+        """
+        Adds the counts of another accumulator with the same levels, columns, and thresholds.
+
+        Parameters
+        ----------
+        other: CloudFractionAccumulator
+            The accumulator to merge.
+
+        Returns
+        -------
+        self: CloudFractionAccumulator
+            The accumulator.
+        """
+        if self.cldy_pixels.shape != other.cldy_pixels.shape or \
+                (self.S_cld, self.s_att) != (other.S_cld, other.s_att):
+            raise ValueError("Only CloudFractionAccumulators with the same levels, columns, and "
+                             "thresholds can be merged")
+        self.cldy_pixels += other.cldy_pixels
+        self.srok_pixels += other.srok_pixels
+        self.n_times += other.n_times
+        return self
+
+    def cloud_fraction(self):
+        """
+        Returns the (level, column) cloud fraction, i.e., the fraction of the cloudy subcolumns
+        among all usefull subcolumns of the accumulated times. NaN where there are no usefull
+        subcolumns.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.srok_pixels > 0, self.cldy_pixels / self.srok_pixels, np.nan)
@@ -0,0 +1,74 @@
+import emc2
+import numpy as np
+import pytest
+
+
+def _block_sum(t_block, x, scale):
+    return x[t_block[0]:t_block[1]].sum(axis=0) * scale, x.flags.writeable
+
+
+def test_get_executor():
+    executor = emc2.simulator.executor
+    assert isinstance(executor.get_executor(False), executor.SerialExecutor)
+    assert isinstance(executor.get_executor(True), executor.DaskExecutor)
+    assert isinstance(executor.get_executor('thread'), executor.ThreadExecutor)
+    assert isinstance(executor.get_executor('process'), executor.ProcessExecutor)
+    my_executor = executor.ProcessExecutor(n_workers=2)
+    assert executor.get_executor(my_executor) is my_executor
+    with pytest.raises(ValueError):
+        executor.get_executor('mpi')
+
+
+def test_executor_map():
+    x = np.random.default_rng(0).normal(size=(20, 6))
+    t_blocks = [(j, min(j + 3, 20)) for j in range(0, 20, 3)]
+    expected = [x[j:k].sum(axis=0) for j, k in t_blocks]
+    for parallel in [False, True, 'thread']:
+        results = emc2.simulator.executor.get_executor(parallel).map(
+            _block_sum, t_blocks, shared=dict(x=x, scale=1.))
+        np.testing.assert_array_equal(np.stack([y[0] for y in results]), np.stack(expected))
+
+    # The process pool workers get the shared arrays read-only in shared memory
+    results = emc2.simulator.executor.ProcessExecutor(n_workers=2).map(
+        _block_sum, t_blocks, shared=dict(x=x, scale=2.), chunk=4)
+    np.testing.assert_array_equal(np.stack([y[0] for y in results]), 2 * np.stack(expected))
+    assert not np.any([y[1] for y in results])
+
+
+def test_process_executor_chunks(monkeypatch):
+    executor = emc2.simulator.executor
+    created = []
+
+    class CountingSharedMemory(executor.shared_memory.SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if kwargs.get("create", False):
+                created.append(self.name)
+
+    class CountingPool(executor.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            created.append("pool")
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(executor.shared_memory, "SharedMemory", CountingSharedMemory)
+    monkeypatch.setattr(executor, "ProcessPoolExecutor", CountingPool)
+    x = np.random.default_rng(0).normal(size=(20, 6))
+    t_blocks = [(j, min(j + 3, 20)) for j in range(0, 20, 3)]
+    results = executor.ProcessExecutor(n_workers=2).map(
+        _block_sum, t_blocks, shared=dict(x=x, scale=1.), chunk=2)
+    np.testing.assert_array_equal(np.stack([y[0] for y in results]),
+                                  np.stack([x[j:k].sum(axis=0) for j, k in t_blocks]))
+    # One shared memory block and one pool for all of the 4 chunks
+    assert len(created) == 2
+    assert created.count("pool") == 1
+
+
+def test_get_block_size():
+    executor = emc2.simulator.executor
+    # The block working set is limited to 32 MB by default
+    assert executor.get_block_size(1000, 2**20) == 32
+    assert executor.get_block_size(10, 8) == 10
+    assert executor.get_block_size(1000, 2**30) == 1
+    # Each of the parallel workers gets about 4 tasks
+    assert executor.get_block_size(1000, 8, executor.ThreadExecutor(n_workers=4)) == 63
+    assert executor.get_block_size(1000, 8, executor.get_executor(False)) == 1000
@@ -1,5 +1,8 @@
 import emc2
+import netCDF4
 import numpy as np
+import pytest
+import xarray as xr
 
 
 def test_mie_file():
@@ -22,3 +25,108 @@ def test_to_netcdf():
     assert "sub_col_Ze_cl_strat" in [x for x in model.ds.variables.keys()]
     assert "conv_frac_subcolumns_pi" in [x for x in model.ds.variables.keys()]
     model.ds.close()
+
+
+def test_time_block_streaming(tmp_path):
+    def _make_model():
+        model = emc2.core.model.TestAllStratiform()
+        model.ds = model.ds.isel(time=[0, 0, 0, 0, 0])
+        model.ds['time'] = model.ds['time'].copy(data=np.arange(5))
+        for hyd_type in ['cl', 'ci', 'pl', 'pi']:
+            model.ds[model.strat_frac_names[hyd_type]] = model.ds[model.strat_frac_names[hyd_type]] * \
+                model.ds['time'].copy(data=np.linspace(1, 0.3, 5))
+        return model
+
+    KAZR = emc2.core.instruments.KAZR('nsa')
+    model = emc2.simulator.main.make_simulated_data(_make_model(), KAZR, 8, seed=3, parallel=False)
+    streamed = emc2.simulator.main.make_simulated_data(
+        _make_model(), KAZR, 8, seed=3, parallel=False, time_block_size=2, out_file=str(tmp_path / "out.nc"))
+    assert [x.name for x in tmp_path.iterdir()] == ["out.nc"]
+    assert streamed.ds["sub_col_Ze_tot_strat"].chunks is not None
+    for var_name in ["strat_frac_subcolumns_pl", "strat_q_subcolumns_cl", "sub_col_Ze_tot_strat", "Ze_min"]:
+        np.testing.assert_allclose(streamed.ds[var_name].values, model.ds[var_name].values)
+    streamed.ds.close()
+
+
+def test_table_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("EMC2_CACHE_DIR", str(tmp_path))
+    file_path = emc2.core.instruments.__file__.replace("instruments.py", "mie_tables/MieKAZR_liq.dat")
+    parsed = emc2.io.load_mie_file(file_path, use_cache=False)
+    assert len(list(tmp_path.iterdir())) == 0
+    first = emc2.io.load_mie_file(file_path)
+    assert len(list(tmp_path.iterdir())) == 1
+    cached = emc2.io.load_mie_file(file_path)
+    assert cached.equals(parsed)
+    assert cached["beta_p"].attrs == parsed["beta_p"].attrs
+    assert first.equals(parsed)
+
+    # Loader parameters are part of the cache key
+    file_path = file_path.replace("mie_tables/MieKAZR_liq.dat", "c6_tables/C6_KAZR_8col_agg_rough_270K.dat")
+    emc2.io.load_scat_file(file_path, True)
+    emc2.io.load_scat_file(file_path, False)
+    assert len(list(tmp_path.iterdir())) == 3
+    assert "wavelength" in emc2.io.load_scat_file(file_path, False).variables.keys()
+
+    emc2.io.table_cache.clear_table_cache()
+    assert not tmp_path.exists()
+
+
+def test_lazy_tables():
+    KAZR = emc2.core.instruments.KAZR('nsa')
+    assert "CESM_liq" in KAZR.bulk_table
+    assert not KAZR.mie_table.is_loaded("cl")
+    assert KAZR.get_accessed_tables() == {"mie_table": [], "scat_table": [], "bulk_table": []}
+    assert "beta_p" in KAZR.mie_table["pl"].variables.keys()
+    assert KAZR.mie_table.is_loaded("pl")
+    assert not KAZR.mie_table.is_loaded("cl")
+    assert KAZR.get_accessed_tables()["mie_table"] == ["pl"]
+
+    # A failed load is raised again on the next access
+    KAZR.mie_table.set_loader("missing", emc2.io.load_mie_file, "missing_file.dat")
+    for i in range(2):
+        with pytest.raises(FileNotFoundError):
+            KAZR.mie_table["missing"]
+    assert "missing" in KAZR.mie_table
+
+
+def test_write_chunked_netcdf(tmp_path):
+    times = np.datetime64("2020-01-01T00:00:00.000000000") + np.arange(6) * np.timedelta64(1, "m")
+    ds = xr.Dataset({"sub_col_Ze_cl_strat": (("subcolumn", "time", "height"), np.random.rand(4, 6, 10)),
+                     "strat_frac_subcolumns_cl": (("subcolumn", "time", "height"), np.random.rand(4, 6, 10) > 0.5)},
+                    coords={"time": times, "subcolumn": np.arange(4)})
+    file_name = str(tmp_path / "out.nc")
+    emc2.io.write_chunked_netcdf(ds.isel(time=slice(0, 4)), file_name, time_chunk=2)
+    # The dask-backed variables are appended one chunk at a time
+    emc2.io.write_chunked_netcdf(ds.isel(time=slice(4, 6)).chunk({"time": 1}), file_name, append=True)
+    with netCDF4.Dataset(file_name) as nc_file:
+        assert nc_file.dimensions["time"].isunlimited()
+        assert nc_file.variables["sub_col_Ze_cl_strat"].chunking() == [4, 2, 10]
+        assert nc_file.variables["sub_col_Ze_cl_strat"].filters()["zlib"]
+
+    # Lazily load the subcolumns
+    model = emc2.core.model.Model()
+    model.ds = xr.Dataset()
+    model.load_subcolumns_from_netcdf(file_name, chunks={})
+    assert model.ds["sub_col_Ze_cl_strat"].chunks is not None
+    np.testing.assert_array_equal(model.ds["time"].values, times)
+    np.testing.assert_array_equal(model.ds["sub_col_Ze_cl_strat"].values, ds["sub_col_Ze_cl_strat"].values)
+    np.testing.assert_array_equal(model.ds["strat_frac_subcolumns_cl"].values, ds["strat_frac_subcolumns_cl"].values)
+    model.ds.close()
+
+
+def test_load_processed_lazy(tmp_path):
+    ds = xr.Dataset({"sub_col_Ze_cl_strat": (("subcolumn", "time", "lev"), np.random.rand(4, 6, 10)),
+                     "sub_col_Ze_tot_strat": (("subcolumn", "time", "lev"), np.random.rand(4, 6, 10))},
+                    coords={"time": np.arange(6), "lev": np.arange(10), "subcolumn": np.arange(4)})
+    file_name = str(tmp_path / "out.nc")
+    emc2.io.write_chunked_netcdf(ds, file_name)
+
+    model = emc2.core.model.E3SM(file_name, load_processed=True, lazy_load=True,
+                                 load_vars=["sub_col_Ze_tot_strat"])
+    assert "sub_col_Ze_cl_strat" not in model.ds.variables
+    assert not model.ds["sub_col_Ze_tot_strat"].variable._in_memory
+    np.testing.assert_array_equal(model.ds["sub_col_Ze_tot_strat"].values, ds["sub_col_Ze_tot_strat"].values)
+    model.ds.close()
+
+    model = emc2.core.model.E3SM(file_name, load_processed=True)
+    assert model.ds["sub_col_Ze_cl_strat"].variable._in_memory
@@ -1,3 +1,4 @@
+import tracemalloc
 import emc2
 import numpy as np
 
@@ -137,3 +138,54 @@ def test_cosp_emulator():
                   > 0] == 2)
     assert np.sum(my_model_top.ds.COSP_phase_mask_all_hyd.values[my_model_top.ds.COSP_phase_mask_all_hyd.values
                   > 0] == 2) == 8
+
+
+def test_accumulate_OD_memory():
+    my_model = emc2.core.model.TestAllStratiform()
+    my_model = emc2.simulator.subcolumn.set_convective_sub_col_frac(my_model,
+                                                                    'cl', N_columns=64)
+    my_model = emc2.simulator.subcolumn.set_convective_sub_col_frac(my_model,
+                                                                    'ci', N_columns=64)
+    my_model = emc2.simulator.subcolumn.set_stratiform_sub_col_frac(my_model)
+    my_model = emc2.simulator.subcolumn.set_q_n(my_model, 'cl', is_conv=False, qc_flag=False)
+    dims = my_model.ds["strat_q_subcolumns_cl"].dims
+    alpha_p = np.random.default_rng(0).uniform(0., 1e-3, my_model.ds["strat_q_subcolumns_cl"].shape)
+    my_model.ds["sub_col_alpha_p_cl_strat"] = (dims, alpha_p)
+    z_values = my_model.ds[my_model.z_field].values
+
+    # The grid-mean layer depths are broadcast over the subcolumns rather than replicated, so
+    # accumulating the optical depth needs little more than the output array itself.
+    tracemalloc.start()
+    my_model = emc2.simulator.lidar_moments.accumulate_OD(my_model, False, z_values, 'cl', OD_from_sfc=True)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 1.5 * alpha_p.nbytes
+    dz = np.diff(z_values, axis=1, prepend=0.)
+    OD = np.cumsum(dz * np.concatenate((np.zeros(alpha_p.shape[:2] + (1,)), alpha_p[:, :, :-1]), axis=2), axis=2)
+    np.testing.assert_allclose(my_model.ds["sub_col_OD_cl_strat"].values, OD, rtol=1e-12)
+
+    my_model = emc2.simulator.lidar_moments.accumulate_OD(my_model, False, z_values, 'cl', OD_from_sfc=False)
+    dz = np.diff(z_values, axis=1, append=0.)
+    OD = np.flip(np.cumsum(np.flip(dz * np.concatenate((alpha_p[:, :, 1:], np.zeros(alpha_p.shape[:2] + (1,))),
+                                                       axis=2), axis=2), axis=2), axis=2)
+    np.testing.assert_allclose(my_model.ds["sub_col_OD_cl_strat"].values, OD, rtol=1e-12)
+
+
+def test_lidar_micro_batched_integrals():
+    instrument = emc2.core.instruments.KAZR('nsa')
+    p_diam = instrument.mie_table["cl"]["p_diam"].values
+    beta_p = instrument.mie_table["cl"]["beta_p"].values
+    alpha_p = instrument.mie_table["cl"]["alpha_p"].values
+    N_0 = np.array([[[1e20, 5e22, np.nan]], [[2e18, 1e21, 3e19]]])
+    lambdas = np.array([[[2e5, 4e5, 1e5]], [[1e5, 3e5, 2e5]]])
+    mu = np.array([[[2., 8., 0.]], [[0., 4., 1.]]])
+    total_hydrometeor = np.array([[[1, 1, 1]], [[0, 1, 0]]])
+    beta_p_strat, alpha_p_strat = emc2.simulator.lidar_moments._calc_lidar_micro_batched(
+        N_0, lambdas, mu, total_hydrometeor, p_diam, beta_p, alpha_p, block_size=2, parallel=False)
+    for i, j, k in np.ndindex(N_0.shape):
+        if not np.isfinite(N_0[i, j, k]):
+            assert beta_p_strat[i, j, k] == 0 and alpha_p_strat[i, j, k] == 0
+            continue
+        N_D = N_0[i, j, k] * p_diam ** mu[i, j, k] * np.exp(-lambdas[i, j, k] * p_diam)
+        assert np.isclose(beta_p_strat[i, j, k], np.trapz(beta_p * N_D, x=p_diam), rtol=1e-10)
+        assert np.isclose(alpha_p_strat[i, j, k], np.trapz(alpha_p * N_D, x=p_diam), rtol=1e-10)
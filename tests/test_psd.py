@@ -26,3 +26,73 @@ def test_re():
     my_ds = my_model.ds
     assert np.all(my_ds["re_cl"] < 100.)
     print(my_ds["re_cl"])
+
+
+def test_psd_integral_table():
+    instrument = emc2.core.instruments.KAZR('nsa')
+    p_diam = instrument.mie_table["pl"]["p_diam"].values
+    beta_p = instrument.mie_table["pl"]["beta_p"].values
+    alpha_p = instrument.mie_table["pl"]["alpha_p"].values
+    v_tmp = -(842. * p_diam ** 0.8)
+    rtol = 1e-3
+    table = emc2.simulator.psd.calc_psd_integral_table(
+        p_diam, beta_p, alpha_p, v_tmp, mu_range=(0., 3.), lambda_range=(1e3, 1e4), rtol=rtol)
+    assert table.attrs["max_rel_error"] <= rtol
+
+    np.random.seed(3)
+    N_0 = 10 ** np.random.uniform(5, 9, 20)
+    lambdas = 10 ** np.random.uniform(3, 4, 20)
+    mu = np.random.uniform(0, 3, 20)
+    moment_denom, V_d_numer, sigma_d_numer, tmp_od = \
+        emc2.simulator.psd.interp_psd_integral_table(table, N_0, lambdas, mu)
+    for i in range(N_0.size):
+        N_D = N_0[i] * p_diam ** mu[i] * np.exp(-lambdas[i] * p_diam)
+        denom = np.trapz(beta_p * N_D, x=p_diam)
+        V_d = np.trapz(v_tmp * beta_p * N_D, x=p_diam) / denom
+        sigma_d = np.sqrt(np.trapz((v_tmp - V_d) ** 2 * beta_p * N_D, x=p_diam) / denom)
+        assert np.isclose(moment_denom[i], denom, rtol=rtol)
+        assert np.isclose(tmp_od[i], np.trapz(alpha_p * N_D, x=p_diam), rtol=rtol)
+        assert np.isclose(V_d_numer[i] / moment_denom[i], V_d, rtol=rtol)
+        assert np.isclose(np.sqrt(sigma_d_numer[i] / moment_denom[i]), sigma_d, rtol=rtol)
+
+    # PSD parameters outside of the table are flagged with NaNs
+    assert np.all(np.isnan(emc2.simulator.psd.interp_psd_integral_table(
+        table, np.ones(2), np.array([1e2, 1e5]), np.ones(2))[0]))
+
+
+def test_psd_integral_table_fallback_cached(monkeypatch):
+    instrument = emc2.core.instruments.KAZR('nsa')
+    p_diam = instrument.mie_table["pl"]["p_diam"].values
+    beta_p = instrument.mie_table["pl"]["beta_p"].values
+    alpha_p = instrument.mie_table["pl"]["alpha_p"].values
+    v_tmp = np.linspace(-1., 1., p_diam.size)
+    mu = np.zeros(4)
+    lambdas = np.full(4, 1e3)
+
+    # A table requires a single-signed velocity; the fallback is decided once
+    assert emc2.simulator.psd._get_psd_integral_table(
+        instrument, "pl", p_diam, beta_p, alpha_p, v_tmp, mu, lambdas) is None
+    assert None in instrument.psd_integral_tables.values()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("The table was calculated again")
+
+    monkeypatch.setattr(emc2.simulator.psd, "calc_psd_integral_table", _fail)
+    assert emc2.simulator.psd._get_psd_integral_table(
+        instrument, "pl", p_diam, beta_p, alpha_p, v_tmp, mu, lambdas) is None
+
+
+def test_bulk_mu_lambda_interpolator():
+    instrument = emc2.core.instruments.HSRL()
+    table = instrument.bulk_table["CESM_liq"]
+    interpolator = emc2.simulator.psd._get_bulk_mu_lambda_interpolator(instrument, "CESM_liq")
+    assert instrument.bulk_interpolators["CESM_liq"] is interpolator
+    mu = np.broadcast_to(table["mu"].values, table["lambda"].shape)
+    interp_vals = interpolator(mu.ravel(), table["lambda"].values.ravel())
+    np.testing.assert_allclose(interp_vals[:, 0], table["Q_back"].values.ravel(), rtol=1e-12)
+    np.testing.assert_allclose(interp_vals[:, 1], table["Q_ext"].values.ravel(), rtol=1e-12)
+    lambda_mid = (table["lambda"].values[1:] + table["lambda"].values[:-1]) / 2
+    interp_vals = interpolator(mu[1:].ravel(), lambda_mid.ravel())
+    np.testing.assert_allclose(
+        interp_vals[:, 0], (table["Q_back"].values[1:] + table["Q_back"].values[:-1]).ravel() / 2, rtol=1e-12)
+    assert np.all(np.isnan(interpolator(np.array([1., 2.]), np.array([1e6, 1e12]))))
@@ -85,3 +85,61 @@ def test_radar_moments_all_stratiform():
     my_model = emc2.simulator.attenuation.calc_radar_Ze_min(instrument, my_model)
     assert np.all(np.logical_or(np.diff(my_model.ds["Ze_min"].values) > 0,
                                 np.isnan(np.diff(my_model.ds['Ze_min'].values))))
+
+
+def test_radar_micro_block_integrals():
+    instrument = emc2.core.instruments.KAZR('nsa')
+    p_diam = instrument.mie_table["cl"]["p_diam"].values
+    beta_p = instrument.mie_table["cl"]["beta_p"].values
+    alpha_p = instrument.mie_table["cl"]["alpha_p"].values
+    v_tmp = -3e5 * p_diam ** 2
+    N_0 = np.array([1e20, 5e22, 2e18])
+    lambdas = np.array([2e5, 4e5, 1e5])
+    mu = np.array([2., 8., 0.])
+    moment_denom, V_d_numer, sigma_d_numer, tmp_od = \
+        emc2.simulator.radar_moments._calc_radar_micro_block(
+            N_0, lambdas, mu, p_diam, beta_p, alpha_p, v_tmp)
+    for i in range(N_0.size):
+        N_D = N_0[i] * p_diam ** mu[i] * np.exp(-lambdas[i] * p_diam)
+        denom = np.trapz(beta_p * N_D, x=p_diam)
+        V_d = np.trapz(v_tmp * beta_p * N_D, x=p_diam) / denom
+        sigma_d = np.trapz((v_tmp - V_d) ** 2 * beta_p * N_D, x=p_diam)
+        assert np.isclose(moment_denom[i], denom, rtol=1e-10)
+        assert np.isclose(V_d_numer[i] / moment_denom[i], V_d, rtol=1e-10)
+        assert np.isclose(sigma_d_numer[i], sigma_d, rtol=1e-10)
+        assert np.isclose(tmp_od[i], np.trapz(alpha_p * N_D, x=p_diam), rtol=1e-10)
+
+
+def test_combine_sigma_d_numer():
+    v = np.linspace(-2, 1, 50)
+    w_a = np.exp(-(v + 1.) ** 2)
+    w_b = 3 * np.exp(-4 * (v - 0.5) ** 2)
+    moments = []
+    for w in [w_a, w_b]:
+        denom = np.trapz(w, x=v)
+        numer = np.trapz(v * w, x=v)
+        moments += [denom, numer, np.trapz((v - numer / denom) ** 2 * w, x=v)]
+    sigma_d_numer = emc2.simulator.radar_moments._combine_sigma_d_numer(*moments)
+    w_tot = w_a + w_b
+    V_d_tot = np.trapz(v * w_tot, x=v) / np.trapz(w_tot, x=v)
+    assert np.isclose(sigma_d_numer, np.trapz((v - V_d_tot) ** 2 * w_tot, x=v), rtol=1e-10)
+
+    # Combining with an empty population leaves the numerator unchanged
+    assert emc2.simulator.radar_moments._combine_sigma_d_numer(
+        np.zeros(1), np.zeros(1), np.zeros(1), *moments[:3]) == moments[2]
+
+
+def test_radar_moments_float32():
+    instrument = emc2.core.instruments.KAZR('nsa')
+    model_64 = emc2.simulator.main.make_simulated_data(
+        emc2.core.model.TestAllStratiform(), instrument, 8, seed=1, parallel=False)
+    model_32 = emc2.simulator.main.make_simulated_data(
+        emc2.core.model.TestAllStratiform(), instrument, 8, seed=1, parallel=False, precision="float32")
+    assert model_32.precision == "float32"
+    for var_name in ["strat_q_subcolumns_cl", "sub_col_Ze_cl_strat", "sub_col_Ze_tot_strat",
+                     "hyd_ext_strat", "sub_col_Ze_att_tot"]:
+        assert model_32.ds[var_name].dtype == np.float32
+        assert model_64.ds[var_name].dtype == np.float64
+    np.testing.assert_allclose(model_32.ds["sub_col_Ze_tot_strat"].values,
+                               model_64.ds["sub_col_Ze_tot_strat"].values, atol=1e-3)
+    np.testing.assert_array_equal(model_32.ds["detect_mask"].values, model_64.ds["detect_mask"].values)
@@ -1,5 +1,6 @@
 import emc2
 import numpy as np
+import xarray as xr
 
 
 def test_get_SR():
@@ -109,3 +110,124 @@ def test_get_CF():
     assert np.all(CF_3D[np.isfinite(CF_3D)] >= 0)
     assert np.all(CF_3D[np.isfinite(CF_3D)] <= 1)
     
+
+def test_cosp_change_vertical_grid():
+    zhalf = np.tile(np.arange(10) * 0.25, (2, 1))
+    zfull = zhalf + 0.125
+    y = np.random.default_rng(0).uniform(-30., 10., (2, 3, 10))
+    newgrid_bot = np.arange(4) * 0.5
+    newgrid_top = newgrid_bot + 0.5
+    r = emc2.statistics_LLNL.statistical_aggregation.COSP_CHANGE_VERTICAL_GRID(
+        2, 3, 10, zfull, zhalf, y, 4, newgrid_bot, newgrid_top)
+    np.testing.assert_allclose(r, (y[:, :, 0:8:2] + y[:, :, 1:8:2]) / 2)
+
+    y[0, 0, 2] = -1.0E30
+    r = emc2.statistics_LLNL.statistical_aggregation.COSP_CHANGE_VERTICAL_GRID(
+        2, 3, 10, zfull, zhalf, y, 4, newgrid_bot, newgrid_top, lunits=True)
+    np.testing.assert_allclose(
+        r[1], 10 * np.log10((10 ** (y[1, :, 0:8:2] / 10) + 10 ** (y[1, :, 1:8:2] / 10)) / 2))
+    assert np.isclose(r[0, 0, 1], 10 * np.log10(10 ** (y[0, 0, 3] / 10) / 2))
+
+    r = emc2.statistics_LLNL.statistical_aggregation.COSP_CHANGE_VERTICAL_GRID(
+        2, 3, 10, zfull, zhalf + 10., y, 4, newgrid_bot, newgrid_top)
+    assert np.all(r == -1.0E20)
+
+
+def test_vertical_regridder():
+    zhalf = np.tile(np.arange(10) * 0.25, (4, 1))
+    zhalf[2:] += 0.1
+    zfull = zhalf + 0.125
+    y = np.random.default_rng(0).uniform(-30., 10., (4, 3, 10))
+    newgrid_bot = np.arange(4) * 0.5
+    newgrid_top = newgrid_bot + 0.5
+    regridder = emc2.statistics_LLNL.statistical_aggregation.get_vertical_regridder(newgrid_bot, newgrid_top)
+    r_y, r_y2 = regridder.regrid(zfull, zhalf, y, 2 * y[:, :2])
+    assert len(regridder.operators) == 2
+    assert emc2.statistics_LLNL.statistical_aggregation.get_vertical_regridder(
+        newgrid_bot, newgrid_top) is regridder
+    r = emc2.statistics_LLNL.statistical_aggregation.COSP_CHANGE_VERTICAL_GRID(
+        4, 3, 10, zfull, zhalf, y, 4, newgrid_bot, newgrid_top)
+    np.testing.assert_array_equal(r_y, r)
+    np.testing.assert_allclose(r_y2, 2 * r[:, :2])
+
+    # The least recently used profile is evicted from a full cache
+    regridder = emc2.statistics_LLNL.statistical_aggregation.VerticalRegridder(
+        newgrid_bot, newgrid_top, max_profiles=1)
+    np.testing.assert_array_equal(regridder.regrid(zfull, zhalf, y)[0], r)
+    assert list(regridder.operators.keys()) == [zfull[3].tobytes() + zhalf[3].tobytes()]
+
+
+def test_get_radar_lidar_signals():
+    rng = np.random.default_rng(0)
+    model = emc2.core.model.TestAllStratiform()
+    model.ds = xr.Dataset({
+        "sub_col_beta_att_tot": (("subcolumn", "time", "lev", "ncol"), rng.uniform(0, 1e-5, (4, 3, 6, 2))),
+        "sub_col_Ze_att_tot": (("subcolumn", "time", "lev", "ncol"), rng.uniform(-40, 10, (4, 3, 6, 2))),
+        "sigma_180_vol": (("time", "lev", "ncol"), rng.uniform(0, 1e-6, (3, 6, 2))),
+        "tau": (("time", "lev", "ncol"), rng.uniform(0, 1, (3, 6, 2))),
+        "Z3": (("time", "lev", "ncol"), np.cumsum(rng.uniform(10, 500, (3, 6, 2)), axis=1))})
+    signals = emc2.statistics_LLNL.statistical_aggregation.get_radar_lidar_signals(model)
+    lazy_signals = emc2.statistics_LLNL.statistical_aggregation.get_radar_lidar_signals(model, lazy=True)
+    for x, lazy_x in zip(signals, lazy_signals):
+        np.testing.assert_array_equal(np.asarray(lazy_x), x)
+    for i, j, k in np.ndindex(4, 3, 2):
+        sub_atb_total, sub_atb_mol, z_full, z_half, sub_ze_att_total = \
+            emc2.statistics_LLNL.statistical_aggregation.get_ATB_ATBmol(model, i, j, k)
+        np.testing.assert_array_equal(signals[0][i, j, :, k], sub_atb_total)
+        np.testing.assert_array_equal(signals[1][i, j, :, k], sub_atb_mol)
+        np.testing.assert_array_equal(signals[2][j, :, k], z_full)
+        np.testing.assert_array_equal(signals[3][j, :, k], z_half)
+        np.testing.assert_array_equal(signals[4][i, j, :, k], sub_ze_att_total)
+
+
+def test_cfad():
+    SR_EDGES = np.array([-1., 0.01, 1.2, 3.0, 5.0, 999.])
+    newgrid_mid = np.array([0.24, 0.72, 1.2])
+    SR_4D = np.full((4, 2, 3, 1), np.nan)
+    SR_4D[:, 0, 0, 0] = [0.5, 2., 2., 999.]
+    SR_4D[:2, 1, 0, 0] = [3.0, -1.]
+    SR_4D[:, 1, 2, 0] = 1000.
+    cfad = emc2.statistics_LLNL.statistical_aggregation.cal_cfad_radar_40levels(
+        4, newgrid_mid, SR_EDGES, SR_4D[:, 0, :, 0])
+    np.testing.assert_allclose(cfad[0], [0., 0.25, 0.5, 0., 0.])
+    assert np.all(np.isnan(cfad[1:]))
+    cfad = emc2.statistics_LLNL.statistical_aggregation.get_cfad_SR(
+        SR_EDGES, newgrid_mid, 2, 4, SR_4D, 0)
+    np.testing.assert_allclose(cfad[0], [0.125, 0.125, 0.25, 0.125, 0.])
+    np.testing.assert_array_equal(cfad[1:], 0.)
+
+
+def test_streaming_accumulators():
+    rng = np.random.default_rng(0)
+    SR_4D = rng.lognormal(1., 1.5, (10, 30, 8, 2))
+    SR_4D[rng.random(SR_4D.shape) < 0.3] = np.nan
+    SR_EDGES = np.array([-1., 0.01, 1.2, 3.0, 5.0, 7.0, 10.0, 999.])
+    newgrid_mid = np.arange(8) * 0.48 + 0.24
+
+    cfad_acc = emc2.statistics_LLNL.statistical_aggregation.CFADAccumulator(SR_EDGES, 8)
+    for t_start in range(0, 30, 7):
+        block = SR_4D[:, t_start:t_start + 7]
+        cfad_acc.merge(emc2.statistics_LLNL.statistical_aggregation.CFADAccumulator(
+            SR_EDGES, 8).update(block[:, :, :, 1]))
+    cfad = emc2.statistics_LLNL.statistical_aggregation.get_cfad_SR(
+        SR_EDGES, newgrid_mid, 30, 10, SR_4D, 1)
+    np.testing.assert_allclose(cfad_acc.cfad(), cfad, rtol=1e-12, atol=1e-15)
+    assert cfad_acc.n_profiles == 300
+
+    # No usefull subcolumns in one (level, column)
+    SR_4D[:, :, 7, 0] = 0.
+    cf_acc = emc2.statistics_LLNL.statistical_aggregation.CloudFractionAccumulator(8, 2)
+    for t_start in range(0, 30, 7):
+        cf_acc.merge(emc2.statistics_LLNL.statistical_aggregation.CloudFractionAccumulator(
+            8, 2).update(SR_4D[:, t_start:t_start + 7]))
+    assert cf_acc.n_times == 30
+
+    # Single-pass reference from the per-pixel counts of calculate_lidar_CF
+    CF_3D = emc2.statistics_LLNL.statistical_aggregation.calculate_lidar_CF(SR_4D, 30, 8, 2)
+    srok_pixels = np.sum(SR_4D > 0.01, axis=0)
+    cldy_pixels = np.sum(SR_4D > 5., axis=0)
+    np.testing.assert_allclose(CF_3D[srok_pixels > 0], cldy_pixels[srok_pixels > 0] / srok_pixels[srok_pixels > 0])
+    assert np.all(np.isnan(CF_3D[srok_pixels == 0]))
+    cf = np.sum(np.where(srok_pixels > 0, CF_3D * srok_pixels, 0.), axis=0) / np.sum(srok_pixels, axis=0)
+    np.testing.assert_allclose(cf_acc.cloud_fraction(), cf)
+    assert np.isnan(cf_acc.cloud_fraction()[7, 0])
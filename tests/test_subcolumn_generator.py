@@ -1,5 +1,6 @@
 import emc2
 import numpy as np
+import pickle
 import xarray as xr
 
 
@@ -161,3 +162,166 @@ def test_set_qn():
     assert np.all(q_sum[~where_gt_1km] == 0)
     qcl = my_model.ds[my_model.q_names_stratiform["cl"]].values
     np.testing.assert_almost_equal(q_sum, qcl)
+
+
+def test_allocate_strat_sub_col():
+    N_columns = 20
+    data_frac1 = np.array([[10, 10, 5, 0, 20, 3]] * 4)
+    data_frac2 = np.array([[4, 10, 15, 8, 20, 0]] * 4)
+    conv_profs = np.zeros((N_columns, 4, 6), dtype=bool)
+    conv_profs[:2, :, 2] = True
+    full_overcast, strat_profs1, strat_profs2 = emc2.simulator.subcolumn._allocate_strat_sub_col(
+        data_frac1, data_frac2, conv_profs, N_columns)
+
+    # The fraction is conserved except in convective subcolumns, and the top level is skipped
+    assert full_overcast == 4
+    np.testing.assert_equal(strat_profs1.sum(axis=0), [[10, 10, 5, 0, 20, 0]] * 4)
+    np.testing.assert_equal(strat_profs2.sum(axis=0), [[4, 10, 15, 8, 20, 0]] * 4)
+    assert ~np.any(strat_profs1[:2, :, 2]) and ~np.any(strat_profs2[:2, :, 2])
+
+    # The smaller class is nested in the larger class and overlying cloud is filled first
+    assert ~np.any(strat_profs2[:, :, 0] & ~strat_profs1[:, :, 0])
+    assert ~np.any(strat_profs1[:, :, 1] & ~strat_profs2[:, :, 1])
+    np.testing.assert_equal(strat_profs1[:, :, 0], strat_profs1[:, :, 1])
+    assert np.all(strat_profs2[:, :, 3] <= strat_profs2[:, :, 4])
+
+
+def test_allocate_precip_sub_col_batched():
+    N_columns = 20
+    t_dim = 50
+    data_frac = [np.array([[10, 12, 5, 0, 7]] * t_dim), np.array([[4, 12, 15, 0, 0]] * t_dim)]
+    strat_profs = np.zeros((N_columns, t_dim, 5), dtype=bool)
+    strat_profs[:6] = True
+    PF_val = np.max(np.stack(data_frac), axis=0)
+    precip_exist = np.stack([frac > 0 for frac in data_frac])
+    overlapping_cloud = np.ones((t_dim, 5), dtype=bool)
+    overlapping_cloud[:, -1] = False
+    my_tuple = [emc2.simulator.subcolumn._allocate_precip_sub_col(
+        tt, [strat_profs, ~strat_profs], N_columns, data_frac, PF_val.copy(), precip_exist, 0,
+        overlapping_cloud) for tt in range(t_dim)]
+    p_strat_profs = np.concatenate([x[1] for x in my_tuple], axis=1)
+    full_overcast, p_strat_profs_batched = emc2.simulator.subcolumn._allocate_precip_sub_col_batched(
+        data_frac, strat_profs, N_columns)
+
+    # Both allocators conserve the precipitation fraction (the top level is skipped)
+    assert full_overcast == np.sum([x[0] for x in my_tuple]) == 0
+    for i in range(2):
+        expected = np.where(np.arange(5) < 4, data_frac[i], 0)
+        np.testing.assert_equal(p_strat_profs[..., i].sum(axis=0), expected)
+        np.testing.assert_equal(p_strat_profs_batched[..., i].sum(axis=0), expected)
+
+    # Cloudy subcolumns are filled first, then overlying precipitation is extended
+    assert np.all(p_strat_profs_batched[:6, :, 2, 1])
+    assert ~np.any(p_strat_profs_batched[6:, :, 2, 0])
+    assert np.all(p_strat_profs_batched[:, :, 1, :].any(axis=2) <= p_strat_profs_batched[:, :, 2, :].any(axis=2))
+    assert np.all(p_strat_profs_batched[:, :, 0, 0] <= p_strat_profs_batched[:, :, 1, :].any(axis=2))
+    assert np.all(p_strat_profs_batched[:, :, 0, 1] <= p_strat_profs_batched[:, :, 0, 0])
+
+
+def test_subcolumn_seed():
+    def _make_subcolumns(parallel, chunk, seed):
+        my_model = emc2.core.model.TestHalfAndHalf()
+        my_model.ds = my_model.ds.isel(time=[0, 0, 0, 0, 0])
+        for hyd_type in ['cl', 'ci', 'pl', 'pi']:
+            my_model.ds[my_model.strat_frac_names[hyd_type]] = my_model.ds[
+                my_model.strat_frac_names[hyd_type]] * xr.DataArray(np.linspace(1, 0.2, 5), dims='time')
+        my_model = emc2.simulator.subcolumn.set_convective_sub_col_frac(my_model, 'cl', N_columns=8)
+        my_model = emc2.simulator.subcolumn.set_convective_sub_col_frac(my_model, 'ci', N_columns=8)
+        my_model = emc2.simulator.subcolumn.set_stratiform_sub_col_frac(
+            my_model, parallel=parallel, chunk=chunk, seed=seed)
+        my_model = emc2.simulator.subcolumn.set_precip_sub_col_frac(
+            my_model, is_conv=False, parallel=parallel, chunk=chunk, seed=seed)
+        my_model = emc2.simulator.subcolumn.set_q_n(
+            my_model, 'cl', is_conv=False, qc_flag=True, use_rad_logic=False,
+            parallel=parallel, chunk=chunk, seed=seed)
+        return my_model.ds
+
+    ds_serial = _make_subcolumns(False, None, 42)
+    ds_chunked = _make_subcolumns(False, 2, 42)
+    ds_parallel = _make_subcolumns(True, 3, 42)
+    ds_thread = _make_subcolumns('thread', 2, 42)
+    ds_process = _make_subcolumns('process', 2, 42)
+    ds_other_seed = _make_subcolumns(False, None, 43)
+    for var_name in ['strat_frac_subcolumns_cl', 'strat_frac_subcolumns_ci',
+                     'strat_frac_subcolumns_pl', 'strat_q_subcolumns_cl']:
+        np.testing.assert_array_equal(ds_serial[var_name].values, ds_chunked[var_name].values)
+        np.testing.assert_array_equal(ds_serial[var_name].values, ds_parallel[var_name].values)
+        np.testing.assert_array_equal(ds_serial[var_name].values, ds_thread[var_name].values)
+        np.testing.assert_array_equal(ds_serial[var_name].values, ds_process[var_name].values)
+        assert not np.array_equal(ds_serial[var_name].values, ds_other_seed[var_name].values)
+
+
+def test_distribute_cl_q_n():
+    sub_data_frac = np.zeros((20, 30, 4), dtype=bool)
+    sub_data_frac[:1, :, 0] = True
+    sub_data_frac[:5, :, 1] = True
+    sub_data_frac[:, :, 2] = True
+    q_ic_mean = np.tile([1e-3, 2e-4, 5e-4, 0.], (30, 1))
+    q_profs = emc2.simulator.subcolumn._distribute_cl_q_n(sub_data_frac, 1., q_ic_mean)
+
+    # The mass is conserved and only hydrometeor-containing subcolumns are filled
+    np.testing.assert_allclose(q_profs.sum(axis=0), q_ic_mean * sub_data_frac.sum(axis=0), rtol=1e-12)
+    assert np.all(q_profs[~sub_data_frac] == 0)
+    assert np.all(q_profs[sub_data_frac] >= 0)
+    np.testing.assert_allclose(q_profs[0, :, 0], 1e-3)
+    assert np.std(q_profs[:, :, 2]) > 0
+
+    # Infinite means (q > 0 without cloud fraction) where there are no hydrometeor subcolumns
+    q_ic_mean[:, 3] = np.inf
+    with np.errstate(invalid="raise"):
+        q_profs = emc2.simulator.subcolumn._distribute_cl_q_n(sub_data_frac, 1., q_ic_mean)
+    assert np.all(q_profs[:, :, 3] == 0)
+
+
+def test_active_cells():
+    my_model = emc2.core.model.TestAllStratiform()
+    my_model = emc2.simulator.subcolumn.set_convective_sub_col_frac(my_model,
+                                                                    'cl', N_columns=8)
+    my_model = emc2.simulator.subcolumn.set_convective_sub_col_frac(my_model,
+                                                                    'ci', N_columns=8)
+    my_model = emc2.simulator.subcolumn.set_stratiform_sub_col_frac(my_model)
+    my_model = emc2.simulator.subcolumn.set_q_n(my_model, 'cl', is_conv=False, qc_flag=False)
+    q = my_model.ds["strat_q_subcolumns_cl"].values
+    cells = my_model.active_cells["strat_q_subcolumns_cl"].cells
+    np.testing.assert_array_equal(cells, np.flatnonzero(q > 0))
+    assert emc2.simulator.subcolumn.get_active_cells(my_model, 'cl', False) is cells
+
+    # Missing entries are computed from the subcolumn field on demand
+    my_model.active_cells = {}
+    cells = emc2.simulator.subcolumn.get_active_cells(my_model, 'cl', False)
+    np.testing.assert_array_equal(cells, np.flatnonzero(q > 0))
+    assert "strat_q_subcolumns_cl" in my_model.active_cells.keys()
+
+    values = emc2.simulator.subcolumn._scatter_cells(q.ravel()[cells], cells, q.shape)
+    np.testing.assert_array_equal(values, q)
+
+    # Pickled entries drop the reference to their field and are found again
+    active_cells = pickle.loads(pickle.dumps(my_model.active_cells["strat_q_subcolumns_cl"]))
+    np.testing.assert_array_equal(active_cells.cells, cells)
+    assert active_cells.source is None
+
+    # The cells are found again when the field is replaced (e.g., cropped)
+    my_model.ds = my_model.ds.isel({my_model.height_dim: slice(3, None)})
+    q = my_model.ds["strat_q_subcolumns_cl"].values
+    cells = emc2.simulator.subcolumn.get_active_cells(my_model, 'cl', False)
+    np.testing.assert_array_equal(cells, np.flatnonzero(q > 0))
+
+
+def test_active_cells_found_once(monkeypatch):
+    # The cells stored by set_q_n are reused by all of the forward operators
+    find_active_cells = emc2.simulator.subcolumn._find_active_cells
+    calls = []
+
+    def _counting_find_active_cells(q):
+        calls.append(q.name)
+        return find_active_cells(q)
+
+    monkeypatch.setattr(emc2.simulator.subcolumn, "_find_active_cells", _counting_find_active_cells)
+    KAZR = emc2.core.instruments.KAZR('nsa')
+    for use_rad_logic in [True, False]:
+        calls.clear()
+        my_model = emc2.core.model.TestAllStratiform()
+        my_model = emc2.simulator.main.make_simulated_data(
+            my_model, KAZR, 8, use_rad_logic=use_rad_logic, parallel=False)
+        assert len(calls) > 0
+        assert sorted(calls) == sorted(set(calls))